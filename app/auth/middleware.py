@@ -5,13 +5,14 @@ from jose import JWTError
 from fastapi import HTTPException, status, Depends, Header
 from fastapi.security import HTTPBearer
 from typing import Optional
-from sqlalchemy import select, text
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.models import JWTPayload
 from app.auth.jwt_verifier import JWTVerifier
 from app.auth.permissions_manager import PermissionsManager
 from app.db.postgres import get_db
+from app.db.repository import set_search_path
 from app.db.models import Organization, User, Patient
 
 
@@ -40,7 +41,7 @@ async def _lookup_internal_user_id(
         User/Patient ID if found, None otherwise
     """
     try:
-        await db.execute(text(f'SET search_path TO "{tenant_schema}"'))
+        await set_search_path(db, f'"{tenant_schema}"')
         
         # First try to find in Patient table
         stmt = select(Patient.id).where(Patient.keycloak_user_id == UUID(auth_user_id))
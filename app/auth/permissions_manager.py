@@ -1,7 +1,7 @@
 """Permissions Management"""
 import yaml
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class PermissionsManager:
@@ -13,6 +13,8 @@ class PermissionsManager:
             permissions_file_path = Path(__file__).parent.parent.parent / "permissions.yml"
         
         self.role_permissions = self._load_permissions(permissions_file_path)
+        # Tokens carry a handful of role combinations; resolve each one once.
+        self._permissions_by_roles: Dict[Tuple[str, ...], List[str]] = {}
     
     def _load_permissions(self, file_path: Path) -> Dict[str, List[str]]:
         """Load role-to-permissions mapping from YAML file"""
@@ -25,8 +27,12 @@ class PermissionsManager:
     
     def get_permissions_for_roles(self, roles: List[str]) -> List[str]:
         """Convert list of roles to list of permissions"""
-        permissions = set()
-        for role in roles:
-            role_perms = self.role_permissions.get(role, [])
-            permissions.update(role_perms)
-        return list(permissions)
+        key = tuple(sorted(roles))
+        cached = self._permissions_by_roles.get(key)
+        if cached is None:
+            permissions = set()
+            for role in key:
+                role_perms = self.role_permissions.get(role, [])
+                permissions.update(role_perms)
+            cached = self._permissions_by_roles[key] = list(permissions)
+        return list(cached)
@@ -14,6 +14,7 @@ from app.care_sessions.schemas import (
 )
 from app.db.models import CareSession
 from app.auth.middleware import JWTPayload, verify_token, check_permission
+from app.reports.cache import reports_cache
 from app.utils.timezone import convert_to_cet
 
 router = APIRouter(
@@ -62,6 +63,7 @@ async def create_care_session(
         caregiver_id=jwt_payload.internal_user_id,
         session_id=request.session_id,
     )
+    await reports_cache.invalidate_session_reports(jwt_payload.tenant_schema)
     
     return to_response(session)
 
@@ -110,6 +112,7 @@ async def complete_care_session(
         caregiver_notes=request.caregiver_notes,
         caregiver_id=jwt_payload.internal_user_id,
     )
+    await reports_cache.invalidate_session_reports(jwt_payload.tenant_schema)
     
     return to_response(session)
 
@@ -181,5 +184,6 @@ async def update_care_session(
         caregiver_notes=request.caregiver_notes,
         status=request.status,
     )
+    await reports_cache.invalidate_session_reports(jwt_payload.tenant_schema)
     
     return to_response(session)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, String, DateTime, Text, Boolean, Date, Integer, ForeignKey, func
+from sqlalchemy import Column, String, DateTime, Text, Boolean, Date, Integer, BigInteger, Float, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.postgres import Base
 
@@ -95,6 +95,34 @@ class User(Base):
     deleted_at = Column(DateTime, nullable=True)
 
 
+class CaregiverStats(Base):
+    """
+    Per-caregiver daily session counters.
+    Maintained by triggers on care_sessions; read-only for the application.
+    """
+    __tablename__ = "caregiver_stats"
+
+    caregiver_id = Column(UUID(as_uuid=True), primary_key=True)
+    date_bucket = Column(DateTime, primary_key=True)
+    total_sessions = Column(Integer, nullable=False, default=0)
+    completed_sessions = Column(Integer, nullable=False, default=0)
+    total_duration_seconds = Column(Float, nullable=False, default=0)
+    duration_count = Column(Integer, nullable=False, default=0)
+
+
+class FeedbackStats(Base):
+    """
+    Daily feedback counters for the feedback summary.
+    Maintained by triggers on feedback; read-only for the application.
+    """
+    __tablename__ = "feedback_stats"
+
+    date_bucket = Column(DateTime, primary_key=True)
+    total_feedback = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(BigInteger, nullable=False, default=0)
+    positive_feedback = Column(Integer, nullable=False, default=0)
+
+
 class Feedback(Base):
     """
     Feedback table - owned by care-session-service.
@@ -1,4 +1,5 @@
 """PostgreSQL Database Configuration"""
+import asyncio
 import os
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
@@ -6,11 +7,28 @@ from sqlalchemy.ext.declarative import declarative_base
 # Database URL
 DATABASE_URL = f"postgresql+asyncpg://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
 
+# Pool sizing: report downloads hold a connection while the file is generated,
+# so keep pool_size + max_overflow within ~4x the database's CPU cores.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+# Prepared statements kept per connection by asyncpg; tenant queries share SQL text
+# (tables resolve through search_path), so this only needs to cover the distinct queries.
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
     echo=os.getenv("APP_ENV") == "development",
     future=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
+    connect_args={
+        "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "command_timeout": 60,
+        "server_settings": {"application_name": "care-session-service"},
+    },
 )
 
 # Create async session factory
@@ -28,3 +46,26 @@ async def get_db():
     """Dependency for getting database session"""
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def warm_pool():
+    """Open pool_size connections up front so the first burst does not pay for connects."""
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(DB_POOL_SIZE)),
+        return_exceptions=True,
+    )
+    await asyncio.gather(*(conn.close() for conn in results if not isinstance(conn, BaseException)))
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+
+
+def pool_status():
+    """Current connection pool counters."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
@@ -1,6 +1,42 @@
 """Shared repository base helpers."""
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy.pool import Pool
+from sqlalchemy import event, text
+
+# Key in the pooled connection's info dict holding the search_path last applied.
+_SEARCH_PATH_KEY = "search_path"
+
+
+@event.listens_for(Engine, "rollback")
+def _forget_search_path_on_rollback(conn):
+    # A rollback undoes a SET issued inside the transaction.
+    conn.info.pop(_SEARCH_PATH_KEY, None)
+
+
+@event.listens_for(Engine, "rollback_savepoint")
+def _forget_search_path_on_rollback_savepoint(conn, name, context):
+    # So does rolling back to a savepoint taken before the SET.
+    conn.info.pop(_SEARCH_PATH_KEY, None)
+
+
+@event.listens_for(Pool, "reset")
+def _forget_search_path_on_reset(dbapi_connection, connection_record, reset_state):
+    connection_record.info.pop(_SEARCH_PATH_KEY, None)
+
+
+# Bound rather than interpolated, so every tenant shares one prepared statement
+# instead of each schema taking its own slot in asyncpg's statement cache.
+_SET_SEARCH_PATH = text("SELECT set_config('search_path', :search_path, false)")
+
+
+async def set_search_path(db: AsyncSession, search_path: str) -> None:
+    """Apply search_path on the session's connection unless it is already set."""
+    conn = await db.connection()
+    if conn.info.get(_SEARCH_PATH_KEY) == search_path:
+        return
+    await conn.execute(_SET_SEARCH_PATH, {"search_path": search_path})
+    conn.info[_SEARCH_PATH_KEY] = search_path
 
 
 class BaseRepository:
@@ -14,6 +50,6 @@ class BaseRepository:
     async def _set_search_path(self):
         """Set PostgreSQL search_path to tenant schema."""
         if self.include_public:
-            await self.db.execute(text(f'SET search_path TO "{self.tenant_schema}", public'))
+            await set_search_path(self.db, f'"{self.tenant_schema}", public')
         else:
-            await self.db.execute(text(f'SET search_path TO "{self.tenant_schema}"'))
+            await set_search_path(self.db, f'"{self.tenant_schema}"')
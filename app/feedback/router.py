@@ -18,13 +18,12 @@ from app.feedback.schemas import (
     PatientAverageRatingResponse,
     TopCaregiversResponse,
     TopCaregiverItem,
-    CaregiverFeedbackItem,
-    CaregiverFeedbackPage,
     CaregiverAverageRatingResponse,
 )
 from app.db.models import Feedback
 from app.feedback.satisfaction import get_satisfaction_level, compute_metrics
 from app.auth.middleware import JWTPayload, verify_token, check_permission
+from app.reports.cache import reports_cache
 from app.db.models import Patient, User
 from app.utils.timezone import convert_to_cet
 
@@ -81,6 +80,7 @@ async def create_feedback(
         rating=request.rating,
         patient_feedback=request.patient_feedback,
     )
+    await reports_cache.invalidate_session_reports(jwt_payload.tenant_schema)
     
     return to_response(feedback)
 
@@ -293,6 +293,7 @@ async def delete_feedback(
     service = FeedbackService(db, jwt_payload.tenant_schema)
     
     await service.delete_feedback(feedback_id)
+    await reports_cache.invalidate_session_reports(jwt_payload.tenant_schema)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
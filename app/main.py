@@ -6,15 +6,36 @@ import os
 if os.path.exists('.env'):
     load_dotenv()
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 import logging
 
+from app.auth.middleware import check_permission, verify_token
+from app.auth.models import JWTPayload
+from app.db.postgres import engine, pool_status, warm_pool
+from app.reports.pdf_pool import shutdown_pdf_pool, start_pdf_pool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Care Session Service")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await warm_pool()
+    except Exception as e:
+        logger.warning(f"Failed to pre-create database connections: {e}")
+    start_pdf_pool()
+    yield
+    shutdown_pdf_pool()
+    await engine.dispose()
+
+
+app = FastAPI(title="Care Session Service", lifespan=lifespan)
 
 # Configure CORS
 allowed_origins_str = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,https://wailsalutem-web-ui.netlify.app")
@@ -26,6 +47,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all methods (GET, POST, PUT, DELETE, etc.)
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["X-Next-Cursor", "Warning"],  # Selector list paging
+)
+
+# CSV/JSON report downloads compress several-fold; level 1 keeps the CPU cost low and
+# streamed downloads are compressed chunk by chunk. ReportLab PDFs and zstd Parquet
+# exports are already compressed.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    compresslevel=1,
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/pdf", "application/vnd.apache.parquet"),
 )
 
 # Import and include routers with error handling
@@ -54,3 +86,8 @@ except Exception as e:
 def health():
     return {"status": "ok", "service": "care-session-service"}
 
+
+@app.get("/health/pool")
+def health_pool(jwt_payload: JWTPayload = Depends(verify_token)):
+    check_permission(jwt_payload, "care-session:admin")
+    return {"status": "ok", "pool": pool_status()}
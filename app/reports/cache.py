@@ -0,0 +1,94 @@
+"""Optional Redis cache for read-mostly report responses."""
+import os
+import logging
+from typing import Any, Iterable, Optional
+
+from pydantic import TypeAdapter
+
+try:
+    from redis import asyncio as redis
+except ImportError:  # pragma: no cover - redis is optional
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+LIST_TTL_SECONDS = 60
+SUMMARY_TTL_SECONDS = 10
+
+# Namespaces derived from care sessions/feedback rather than the patient/user caches.
+SESSION_REPORT_NAMESPACES = ("caregiver_performance", "feedback_summary", "patient_summary")
+
+
+class ReportsCache:
+    """Cache-aside store keyed by tenant schema; a no-op when REDIS_URL is unset.
+
+    Each (schema, namespace) pair has a generation counter that is part of every
+    entry key, so invalidation is a single INCR and superseded entries simply age
+    out through their TTL.
+    """
+
+    def __init__(self, url: Optional[str] = None):
+        url = url if url is not None else os.getenv("REDIS_URL")
+        self.client = redis.from_url(url) if url and redis is not None else None
+
+    @staticmethod
+    def _generation_key(schema: str, namespace: str) -> str:
+        return f"{schema}:{namespace}#generation"
+
+    async def key(self, schema: str, namespace: str, *parts: Any) -> str:
+        """Entry key for the namespace's current generation.
+
+        Resolve the key once per request and reuse it for ``set`` so a result
+        computed before an invalidation is written under the stale generation.
+        """
+        generation = 0
+        if self.client is not None:
+            try:
+                generation = int(await self.client.get(self._generation_key(schema, namespace)) or 0)
+            except Exception as e:
+                logger.warning(f"Reports cache read failed: {e}")
+        return ":".join([schema, namespace, str(generation), *("" if part is None else str(part) for part in parts)])
+
+    async def get(self, key: str, adapter: TypeAdapter) -> Optional[Any]:
+        if self.client is None:
+            return None
+        try:
+            raw = await self.client.get(key)
+            return adapter.validate_json(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"Reports cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, value: Any, adapter: TypeAdapter, ttl: int) -> None:
+        if self.client is None:
+            return
+        try:
+            await self.client.set(key, adapter.dump_json(value), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Reports cache write failed: {e}")
+
+    async def invalidate(self, schema: str, namespace: str) -> None:
+        """Drop every cached entry for a namespace of one tenant."""
+        await self._bump_generations(schema, (namespace,))
+
+    async def invalidate_session_reports(self, schema: str) -> None:
+        """Drop aggregates that a care-session or feedback write can change."""
+        await self._bump_generations(schema, SESSION_REPORT_NAMESPACES)
+
+    async def _bump_generations(self, schema: str, namespaces: Iterable[str]) -> None:
+        if self.client is None:
+            return
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for namespace in namespaces:
+                    pipe.incr(self._generation_key(schema, namespace))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Reports cache invalidation failed: {e}")
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+
+
+reports_cache = ReportsCache()
@@ -5,9 +5,10 @@ import pika
 import logging
 from uuid import UUID
 from datetime import datetime, date
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.db.postgres import AsyncSessionLocal
+from app.reports.cache import ReportsCache
 from app.reports.repository import ReportsRepository
 
 logging.basicConfig(level=logging.INFO)
@@ -22,8 +23,12 @@ class OrganizationEventConsumer:
         self.user = os.getenv("RABBITMQ_USER")
         self.password = os.getenv("RABBITMQ_PASSWORD")
         self.org_exchange = os.getenv("RABBITMQ_ORG_EXCHANGE", "wailsalutem.events")
+        self.batch_size = int(os.getenv("RABBITMQ_ORG_BATCH_SIZE", "50"))
+        self.flush_interval = float(os.getenv("RABBITMQ_ORG_FLUSH_SECONDS", "0.5"))
         self.connection = None
         self.channel = None
+        self._pending = []
+        self._flush_timer = None
         self.routing_keys = [
             "patient.created",
             "patient.deleted",
@@ -149,94 +154,186 @@ class OrganizationEventConsumer:
             "deleted_at": None,
         }
 
-    async def _process_event(self, event_type: str, event_data: Dict):
+    async def _apply_event(self, session, event_type: str, event_data: Dict):
         schema = self._schema_from_org(event_data)
         if not schema:
             logger.warning("Missing organization schema for event")
             return
 
+        repository = ReportsRepository(session, schema)
+
+        if event_type == "patient.created":
+            payload = self._patient_payload(event_data)
+            if not payload:
+                logger.warning("Missing patient_id in event")
+                return
+            await repository.upsert_patient_cache(payload)
+        elif event_type == "patient.deleted":
+            patient_id = self._get_value(event_data, "patient_id", "patientId")
+            if not patient_id:
+                logger.warning("Missing patient_id in delete event")
+                return
+            deleted_at = self._parse_datetime(self._get_value(event_data, "deleted_at", "deletedAt")) or datetime.utcnow()
+            if not await repository.mark_patient_deleted(UUID(patient_id), deleted_at):
+                self._log_not_cached(event_type, patient_id)
+        elif event_type == "patient.status_changed":
+            patient_id = self._get_value(event_data, "patient_id", "patientId")
+            if not patient_id:
+                logger.warning("Missing patient_id in status event")
+                return
+            new_status = self._get_value(event_data, "new_status", "newStatus")
+            changed_at = self._parse_datetime(self._get_value(event_data, "changed_at", "changedAt")) or datetime.utcnow()
+            is_active = (str(new_status).lower() == "active")
+            if not await repository.update_patient_status(UUID(patient_id), is_active, changed_at):
+                self._log_not_cached(event_type, patient_id)
+        elif event_type == "user.created":
+            payload = self._user_payload(event_data)
+            if not payload:
+                return
+            await repository.upsert_user_cache(payload)
+        elif event_type == "user.deleted":
+            user_id = self._get_value(event_data, "user_id", "userId")
+            if not user_id:
+                logger.warning("Missing user_id in delete event")
+                return
+            role = self._get_value(event_data, "role")
+            if role and str(role).upper() != "CAREGIVER":
+                return
+            deleted_at = self._parse_datetime(self._get_value(event_data, "deleted_at", "deletedAt")) or datetime.utcnow()
+            if not await repository.mark_user_deleted(UUID(user_id), deleted_at):
+                self._log_not_cached(event_type, user_id)
+        elif event_type == "user.status_changed":
+            user_id = self._get_value(event_data, "user_id", "userId")
+            if not user_id:
+                logger.warning("Missing user_id in status event")
+                return
+            role = self._get_value(event_data, "role")
+            if role and str(role).upper() != "CAREGIVER":
+                return
+            new_status = self._get_value(event_data, "new_status", "newStatus")
+            changed_at = self._parse_datetime(self._get_value(event_data, "changed_at", "changedAt")) or datetime.utcnow()
+            is_active = (str(new_status).lower() == "active")
+            if not await repository.update_user_status(UUID(user_id), is_active, changed_at):
+                self._log_not_cached(event_type, user_id)
+        elif event_type == "user.role_changed":
+            user_id = self._get_value(event_data, "user_id", "userId")
+            if not user_id:
+                logger.warning("Missing user_id in role event")
+                return
+            new_role = self._get_value(event_data, "new_role", "newRole")
+            old_role = self._get_value(event_data, "old_role", "oldRole")
+            changed_at = self._parse_datetime(self._get_value(event_data, "changed_at", "changedAt")) or datetime.utcnow()
+
+            if old_role and str(old_role).upper() == "CAREGIVER" and (not new_role or str(new_role).upper() != "CAREGIVER"):
+                if not await repository.update_user_role(UUID(user_id), new_role, False, changed_at):
+                    self._log_not_cached(event_type, user_id)
+            elif new_role and str(new_role).upper() == "CAREGIVER":
+                if not await repository.update_user_role(UUID(user_id), new_role, True, changed_at):
+                    self._log_not_cached(event_type, user_id)
+        else:
+            logger.warning(f"Unknown event type: {event_type}")
+
+    def _log_not_cached(self, event_type: str, entity_id: str):
+        logger.info(f"{event_type} for {entity_id} matched no cached row")
+
+    async def _process_event(self, event_type: str, event_data: Dict):
         async with AsyncSessionLocal() as session:
-            repository = ReportsRepository(session, schema)
+            await self._apply_event(session, event_type, event_data)
+            await session.commit()
+        await self._invalidate_cache([(event_type, event_data)])
+
+    async def _process_batch(self, events: List[Tuple[str, Dict]]):
+        """Apply a batch of events and commit them as one transaction."""
+        async with AsyncSessionLocal() as session:
+            upserts: Dict[Tuple[str, str], List[Dict]] = {}
+            for event_type, event_data in events:
+                if event_type in ("patient.created", "user.created"):
+                    schema = self._schema_from_org(event_data)
+                    if event_type == "patient.created":
+                        payload = self._patient_payload(event_data)
+                    else:
+                        payload = self._user_payload(event_data)
+                    if schema and payload:
+                        upserts.setdefault((schema, event_type), []).append(payload)
+                        continue
+                # Other events may touch rows created earlier in the batch.
+                await self._flush_upserts(session, upserts)
+                await self._apply_event(session, event_type, event_data)
+            await self._flush_upserts(session, upserts)
+            await session.commit()
+        await self._invalidate_cache(events)
+
+    async def _invalidate_cache(self, events: List[Tuple[str, Dict]]):
+        """Drop cached patient/caregiver lists for tenants touched by committed events."""
+        touched = set()
+        for event_type, event_data in events:
+            schema = self._schema_from_org(event_data)
+            if schema and event_type:
+                touched.add((schema, "patients" if event_type.startswith("patient.") else "caregivers"))
+        if not touched:
+            return
+        # asyncio.run() uses a fresh loop per batch, so the client cannot be shared.
+        cache = ReportsCache()
+        try:
+            for schema, namespace in touched:
+                await cache.invalidate(schema, namespace)
+        finally:
+            await cache.close()
 
+    async def _flush_upserts(self, session, upserts: Dict[Tuple[str, str], List[Dict]]):
+        for (schema, event_type), payloads in upserts.items():
+            repository = ReportsRepository(session, schema)
             if event_type == "patient.created":
-                payload = self._patient_payload(event_data)
-                if not payload:
-                    logger.warning("Missing patient_id in event")
-                    return
-                await repository.upsert_patient_cache(payload)
-            elif event_type == "patient.deleted":
-                patient_id = self._get_value(event_data, "patient_id", "patientId")
-                if not patient_id:
-                    logger.warning("Missing patient_id in delete event")
-                    return
-                deleted_at = self._parse_datetime(self._get_value(event_data, "deleted_at", "deletedAt")) or datetime.utcnow()
-                await repository.mark_patient_deleted(UUID(patient_id), deleted_at)
-            elif event_type == "patient.status_changed":
-                patient_id = self._get_value(event_data, "patient_id", "patientId")
-                if not patient_id:
-                    logger.warning("Missing patient_id in status event")
-                    return
-                new_status = self._get_value(event_data, "new_status", "newStatus")
-                changed_at = self._parse_datetime(self._get_value(event_data, "changed_at", "changedAt")) or datetime.utcnow()
-                is_active = (str(new_status).lower() == "active")
-                await repository.update_patient_status(UUID(patient_id), is_active, changed_at)
-            elif event_type == "user.created":
-                payload = self._user_payload(event_data)
-                if not payload:
-                    return
-                await repository.upsert_user_cache(payload)
-            elif event_type == "user.deleted":
-                user_id = self._get_value(event_data, "user_id", "userId")
-                if not user_id:
-                    logger.warning("Missing user_id in delete event")
-                    return
-                role = self._get_value(event_data, "role")
-                if role and str(role).upper() != "CAREGIVER":
-                    return
-                deleted_at = self._parse_datetime(self._get_value(event_data, "deleted_at", "deletedAt")) or datetime.utcnow()
-                await repository.mark_user_deleted(UUID(user_id), deleted_at)
-            elif event_type == "user.status_changed":
-                user_id = self._get_value(event_data, "user_id", "userId")
-                if not user_id:
-                    logger.warning("Missing user_id in status event")
-                    return
-                role = self._get_value(event_data, "role")
-                if role and str(role).upper() != "CAREGIVER":
-                    return
-                new_status = self._get_value(event_data, "new_status", "newStatus")
-                changed_at = self._parse_datetime(self._get_value(event_data, "changed_at", "changedAt")) or datetime.utcnow()
-                is_active = (str(new_status).lower() == "active")
-                await repository.update_user_status(UUID(user_id), is_active, changed_at)
-            elif event_type == "user.role_changed":
-                user_id = self._get_value(event_data, "user_id", "userId")
-                if not user_id:
-                    logger.warning("Missing user_id in role event")
-                    return
-                new_role = self._get_value(event_data, "new_role", "newRole")
-                old_role = self._get_value(event_data, "old_role", "oldRole")
-                changed_at = self._parse_datetime(self._get_value(event_data, "changed_at", "changedAt")) or datetime.utcnow()
-
-                if old_role and str(old_role).upper() == "CAREGIVER" and (not new_role or str(new_role).upper() != "CAREGIVER"):
-                    await repository.update_user_role(UUID(user_id), new_role, False, changed_at)
-                elif new_role and str(new_role).upper() == "CAREGIVER":
-                    await repository.update_user_role(UUID(user_id), new_role, True, changed_at)
+                await repository.upsert_patients_cache(payloads)
             else:
-                logger.warning(f"Unknown event type: {event_type}")
+                await repository.upsert_users_cache(payloads)
+        upserts.clear()
 
     def callback(self, ch, method, properties, body):
-        """Process incoming messages from the queue."""
+        """Buffer incoming messages and flush them in batches."""
         try:
             message = json.loads(body)
             event_type = method.routing_key or message.get("event_type") or message.get("event")
             event_data = message.get("data", {})
-
-            asyncio.run(self._process_event(event_type, event_data))
-
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+            return
+
+        self._pending.append((method.delivery_tag, event_type, event_data))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = self.connection.call_later(self.flush_interval, self._on_flush_timer)
+
+    def _on_flush_timer(self):
+        self._flush_timer = None
+        self._flush()
+
+    def _flush(self):
+        """Commit buffered events once, falling back to one-by-one on failure."""
+        if self._flush_timer is not None:
+            self.connection.remove_timeout(self._flush_timer)
+            self._flush_timer = None
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        events = [(event_type, event_data) for _, event_type, event_data in pending]
+        try:
+            asyncio.run(self._process_batch(events))
+            self.channel.basic_ack(delivery_tag=pending[-1][0], multiple=True)
+            return
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(pending)} events, retrying individually: {e}")
+
+        for delivery_tag, event_type, event_data in pending:
+            try:
+                asyncio.run(self._process_event(event_type, event_data))
+                self.channel.basic_ack(delivery_tag=delivery_tag)
+            except Exception as e:
+                logger.error(f"Error processing message: {e}")
+                self.channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
 
     def start_consuming(self):
         """Start consuming messages from RabbitMQ."""
@@ -250,7 +347,7 @@ class OrganizationEventConsumer:
             logger.info(f"Routing keys: {', '.join(self.routing_keys)}")
             logger.info("="*60)
 
-            self.channel.basic_qos(prefetch_count=1)
+            self.channel.basic_qos(prefetch_count=self.batch_size)
             self.channel.basic_consume(
                 queue=queue_name,
                 on_message_callback=self.callback
@@ -269,6 +366,7 @@ class OrganizationEventConsumer:
     def stop(self):
         """Stop consuming and close connections."""
         if self.channel and not self.channel.is_closed:
+            self._flush()
             self.channel.stop_consuming()
             self.channel.close()
         if self.connection and not self.connection.is_closed:
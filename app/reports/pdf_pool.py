@@ -0,0 +1,38 @@
+"""Process pool for CPU-bound ReportLab rendering."""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# PDF_WORKERS=0 keeps rendering on the default thread pool.
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def start_pdf_pool() -> None:
+    global _executor
+    if PDF_WORKERS <= 0 or _executor is not None:
+        return
+    # spawn keeps children free of the parent's event loop and pooled DB sockets.
+    _executor = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    logger.info(f"PDF process pool started with {PDF_WORKERS} workers")
+
+
+def shutdown_pdf_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+async def render_pdf(builder: Callable[..., BytesIO], *args) -> BytesIO:
+    """Run a module-level PDF builder off the event loop, in a worker process when available."""
+    if _executor is None:
+        return await asyncio.to_thread(builder, *args)
+    return await asyncio.get_running_loop().run_in_executor(_executor, builder, *args)
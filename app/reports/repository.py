@@ -1,14 +1,123 @@
 """Reports repository for read-only reporting queries."""
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from uuid import UUID
-from typing import Optional, List, Dict, Tuple
+from typing import AsyncIterator, Optional, List, Dict, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, text, func, case
+from sqlalchemy import select, and_, or_, text, func, case, cast, tuple_, Float, Integer, Row, RowMapping
+from sqlalchemy.orm import aliased
 from sqlalchemy.dialects.postgresql import insert
 
-from app.db.models import CareSession, Patient, User
+from app.db.models import CareSession, CaregiverStats, Feedback, FeedbackStats, Patient, User
 from app.db.repository import BaseRepository
 
+# Rows per server-side cursor fetch when streaming downloads.
+STREAM_BATCH_SIZE = 1000
+# Rows per multi-row upsert; keeps bind parameters well under asyncpg's 32767 limit.
+_UPSERT_CHUNK_SIZE = 1000
+
+
+def _active_caregiver_filter():
+    """Caregiver predicate matching the partial ``users_role_lower_idx`` index."""
+    return and_(
+        func.lower(User.role) == "caregiver",
+        User.deleted_at.is_(None),
+    )
+
+
+def _duration_minutes():
+    """Whole minutes from check-in to check-out, truncated toward zero; NULL while open."""
+    elapsed = func.extract("epoch", CareSession.check_out_time - CareSession.check_in_time)
+    return cast(func.trunc(elapsed / 60), Integer).label("duration_minutes")
+
+
+def _full_name(first_name, last_name):
+    """SQL twin of the service's name join: blank parts are skipped, '' when both are."""
+    return func.concat_ws(" ", func.nullif(first_name, ""), func.nullif(last_name, ""))
+
+
+def _joined_full_name(person):
+    """Full name of an outer-joined Patient/User, NULL when the join found nobody."""
+    return case((person.id.is_not(None), _full_name(person.first_name, person.last_name)))
+
+
+def _report_sessions_select():
+    """care_sessions columns plus duration_minutes and the patient's/caregiver's display columns.
+
+    The people are outer joined, so a session whose patient or caregiver is
+    missing from the tenant tables still comes back, with NULL name columns.
+    Full names are joined in SQL rather than per row in Python.
+    """
+    return (
+        select(
+            *CareSession.__table__.columns,
+            _duration_minutes(),
+            _joined_full_name(Patient).label("patient_full_name"),
+            Patient.email.label("patient_email"),
+            Patient.careplan_type.label("careplan_type"),
+            _joined_full_name(User).label("caregiver_full_name"),
+            User.email.label("caregiver_email"),
+        )
+        .select_from(CareSession)
+        .outerjoin(Patient, Patient.id == CareSession.patient_id)
+        .outerjoin(User, User.id == CareSession.caregiver_id)
+    )
+
+
+def _feedback_list_conditions(
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    caregiver_id: Optional[UUID],
+    patient_id: Optional[UUID],
+    session_id: Optional[UUID],
+) -> list:
+    conditions = [Feedback.deleted_at.is_(None), CareSession.deleted_at.is_(None)]
+    if start_date:
+        conditions.append(Feedback.created_at >= start_date)
+    if end_date:
+        conditions.append(Feedback.created_at <= end_date)
+    if caregiver_id:
+        conditions.append(CareSession.caregiver_id == caregiver_id)
+    if patient_id:
+        conditions.append(Feedback.patient_id == patient_id)
+    if session_id:
+        conditions.append(Feedback.care_session_id == session_id)
+    return conditions
+
+
+def _day_bucket_range(
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> Optional[Tuple[datetime, datetime]]:
+    """Half-open day range covered exactly by the *_stats day buckets, if any.
+
+    Both bounds are required: the start must fall on midnight and the end on the
+    last instant of a day (as produced by the period filters); anything finer is
+    not representable. Open-ended ranges stay on the live tables, so a tenant
+    schema provisioned without the stats tables still answers the default
+    report calls.
+    """
+    if start_date is None or end_date is None:
+        return None
+    if start_date.tzinfo is not None or end_date.tzinfo is not None:
+        return None
+    end_day = end_date + timedelta(microseconds=1)
+    if start_date.time() != time.min or end_day.time() != time.min:
+        return None
+    return start_date, end_day
+
+
+def _caregiver_avg_rating(*feedback_conditions):
+    """Average feedback rating correlated to the outer ``User`` row."""
+    # The alias keeps the subquery from binding to an outer care_sessions join.
+    rated_session = aliased(CareSession)
+    return (
+        select(cast(func.avg(Feedback.rating), Float))
+        .join(rated_session, rated_session.id == Feedback.care_session_id)
+        .where(rated_session.caregiver_id == User.id, *feedback_conditions)
+        .correlate(User)
+        .scalar_subquery()
+    )
+
 
 class ReportsRepository(BaseRepository):
     """Repository for report-specific database operations."""
@@ -16,12 +125,12 @@ class ReportsRepository(BaseRepository):
     def __init__(self, db: AsyncSession, tenant_schema: str):
         super().__init__(db, tenant_schema, include_public=False)
 
-    async def get_by_id(self, session_id: UUID) -> Optional[CareSession]:
+    async def get_by_id(self, session_id: UUID) -> Optional[Row]:
         """Get care session by ID"""
         await self._set_search_path()
-        stmt = select(CareSession).where(CareSession.id == session_id)
+        stmt = _report_sessions_select().where(CareSession.id == session_id)
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.one_or_none()
 
     async def get_sessions_in_period(
         self,
@@ -31,10 +140,10 @@ class ReportsRepository(BaseRepository):
         offset: int | None = 0,
         cursor_time: datetime | None = None,
         cursor_id: UUID | None = None,
-    ) -> List[CareSession]:
+    ) -> Sequence[Row]:
         """Get care sessions within a date range"""
         await self._set_search_path()
-        stmt = select(CareSession).where(
+        stmt = _report_sessions_select().where(
             and_(
                 CareSession.check_in_time >= start_date,
                 CareSession.check_in_time <= end_date,
@@ -57,7 +166,7 @@ class ReportsRepository(BaseRepository):
         if offset is not None:
             stmt = stmt.offset(offset)
         result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return result.all()
 
     async def get_all_sessions(
         self,
@@ -65,10 +174,10 @@ class ReportsRepository(BaseRepository):
         offset: int | None = 0,
         cursor_time: datetime | None = None,
         cursor_id: UUID | None = None,
-    ) -> List[CareSession]:
+    ) -> Sequence[Row]:
         """Get all care sessions"""
         await self._set_search_path()
-        stmt = select(CareSession).where(
+        stmt = _report_sessions_select().where(
             CareSession.deleted_at.is_(None)
         )
         if cursor_time is not None and cursor_id is not None:
@@ -87,40 +196,88 @@ class ReportsRepository(BaseRepository):
         if offset is not None:
             stmt = stmt.offset(offset)
         result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return result.all()
+
+    async def stream_sessions_in_period(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Yield care session rows in a date range in batches from a server-side cursor.
 
-    async def get_patients_by_ids(self, patient_ids: List[UUID]) -> Dict[UUID, Patient]:
-        """Fetch patients by IDs from the tenant cache."""
-        if not patient_ids:
-            return {}
+        Plain Core rows (attribute access, no ORM identity map) keep per-row
+        overhead down on large exports.
+        """
         await self._set_search_path()
-        stmt = select(Patient).where(Patient.id.in_(patient_ids))
-        result = await self.db.execute(stmt)
-        patients = result.scalars().all()
-        return {patient.id: patient for patient in patients}
+        stmt = (
+            _report_sessions_select()
+            .where(
+                CareSession.check_in_time >= start_date,
+                CareSession.check_in_time <= end_date,
+                CareSession.deleted_at.is_(None),
+            )
+            .order_by(CareSession.check_in_time.desc(), CareSession.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(stmt)
+        async for batch in result.partitions():
+            yield batch
 
-    async def get_users_by_ids(self, user_ids: List[UUID]) -> Dict[UUID, User]:
-        """Fetch users by IDs from the tenant cache."""
-        if not user_ids:
-            return {}
+    async def get_session_created_bounds(self) -> Tuple[Optional[datetime], Optional[datetime], int]:
+        """Earliest and latest created_at of active sessions, with their count."""
         await self._set_search_path()
-        stmt = select(User).where(User.id.in_(user_ids))
+        stmt = select(
+            func.min(CareSession.created_at),
+            func.max(CareSession.created_at),
+            func.count(),
+        ).where(CareSession.deleted_at.is_(None))
         result = await self.db.execute(stmt)
-        users = result.scalars().all()
-        return {user.id: user for user in users}
+        first, last, total = result.one()
+        return first, last, int(total)
+
+    async def stream_all_sessions(
+        self,
+        batch_size: int = STREAM_BATCH_SIZE,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Yield all care session rows in batches from a server-side cursor.
+
+        ``created_from``/``created_to`` (inclusive) restrict the stream to one
+        created_at window.
+        """
+        await self._set_search_path()
+        conditions = [CareSession.deleted_at.is_(None)]
+        if created_from is not None:
+            conditions.append(CareSession.created_at >= created_from)
+        if created_to is not None:
+            conditions.append(CareSession.created_at <= created_to)
+        stmt = (
+            _report_sessions_select()
+            .where(*conditions)
+            .order_by(CareSession.created_at.desc(), CareSession.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(stmt)
+        async for batch in result.partitions():
+            yield batch
 
-    async def get_caregiver_list(self, limit: int = 100, offset: int = 0) -> List[User]:
-        """List caregivers for selection."""
+    async def get_caregiver_list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[Tuple[str, str, UUID]] = None,
+    ) -> List[User]:
+        """List caregivers for selection, by offset or after a (last_name, first_name, id) key."""
         await self._set_search_path()
+        conditions = [_active_caregiver_filter()]
+        if after is not None:
+            conditions.append(tuple_(User.last_name, User.first_name, User.id) > tuple_(*after))
         stmt = (
             select(User)
-            .where(
-                and_(
-                    func.lower(User.role) == "caregiver",
-                    User.deleted_at.is_(None),
-                )
-            )
-            .order_by(User.last_name.asc(), User.first_name.asc())
+            .where(*conditions)
+            .order_by(User.last_name.asc(), User.first_name.asc(), User.id.asc())
             .limit(limit)
             .offset(offset)
         )
@@ -134,6 +291,10 @@ class ReportsRepository(BaseRepository):
         caregiver_id: Optional[UUID] = None,
     ):
         """Aggregate caregiver performance from care sessions."""
+        day_range = _day_bucket_range(start_date, end_date)
+        if day_range is not None:
+            return await self._get_caregiver_performance_from_stats(*day_range, caregiver_id)
+
         await self._set_search_path()
         join_conditions = [
             CareSession.caregiver_id == User.id,
@@ -158,6 +319,13 @@ class ReportsRepository(BaseRepository):
             )
         )
 
+        rating_conditions = []
+        if start_date:
+            rating_conditions.append(Feedback.created_at >= start_date)
+        if end_date:
+            rating_conditions.append(Feedback.created_at <= end_date)
+        avg_rating = _caregiver_avg_rating(*rating_conditions)
+
         stmt = (
             select(
                 User.id,
@@ -168,15 +336,11 @@ class ReportsRepository(BaseRepository):
                 func.count(CareSession.id).label("total_sessions"),
                 completed_count.label("completed_sessions"),
                 avg_duration.label("avg_duration_minutes"),
+                avg_rating.label("avg_rating"),
             )
             .select_from(User)
             .outerjoin(CareSession, and_(*join_conditions))
-            .where(
-                and_(
-                    func.lower(User.role) == "caregiver",
-                    User.deleted_at.is_(None),
-                )
-            )
+            .where(_active_caregiver_filter())
             .group_by(User.id, User.first_name, User.last_name, User.email, User.is_active)
             .order_by(User.last_name.asc(), User.first_name.asc())
         )
@@ -186,45 +350,66 @@ class ReportsRepository(BaseRepository):
         result = await self.db.execute(stmt)
         return result.all()
 
-    async def get_caregiver_avg_ratings(
+    async def _get_caregiver_performance_from_stats(
         self,
-        caregiver_ids: List[UUID],
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-    ) -> Dict[UUID, float]:
-        """Fetch average ratings per caregiver from feedback table."""
-        if not caregiver_ids:
-            return {}
+        start_day: Optional[datetime],
+        end_day: Optional[datetime],
+        caregiver_id: Optional[UUID] = None,
+    ):
+        """Caregiver performance summed from the trigger-maintained caregiver_stats buckets."""
         await self._set_search_path()
-
-        clauses = ["cs.caregiver_id = ANY(:caregiver_ids)"]
-        params: Dict[str, object] = {"caregiver_ids": caregiver_ids}
-        if start_date:
-            clauses.append("f.created_at >= :start_date")
-            params["start_date"] = start_date
-        if end_date:
-            clauses.append("f.created_at <= :end_date")
-            params["end_date"] = end_date
-
-        stmt = text(
-            f"""
-            SELECT cs.caregiver_id, AVG(f.rating)::float AS avg_rating
-            FROM feedback f
-            JOIN care_sessions cs ON cs.id = f.care_session_id
-            WHERE {' AND '.join(clauses)}
-            GROUP BY cs.caregiver_id
-            """
+        join_conditions = [CaregiverStats.caregiver_id == User.id]
+        rating_conditions = []
+        if start_day:
+            join_conditions.append(CaregiverStats.date_bucket >= start_day)
+            rating_conditions.append(Feedback.created_at >= start_day)
+        if end_day:
+            join_conditions.append(CaregiverStats.date_bucket < end_day)
+            rating_conditions.append(Feedback.created_at < end_day)
+
+        avg_duration = (
+            func.sum(CaregiverStats.total_duration_seconds) / 60.0
+            / func.nullif(func.sum(CaregiverStats.duration_count), 0)
         )
-        result = await self.db.execute(stmt, params)
-        return {row.caregiver_id: float(row.avg_rating) for row in result.all()}
+        stmt = (
+            select(
+                User.id,
+                User.first_name,
+                User.last_name,
+                User.email,
+                User.is_active,
+                func.coalesce(func.sum(CaregiverStats.total_sessions), 0).label("total_sessions"),
+                func.coalesce(func.sum(CaregiverStats.completed_sessions), 0).label("completed_sessions"),
+                avg_duration.label("avg_duration_minutes"),
+                _caregiver_avg_rating(*rating_conditions).label("avg_rating"),
+            )
+            .select_from(User)
+            .outerjoin(CaregiverStats, and_(*join_conditions))
+            .where(_active_caregiver_filter())
+            .group_by(User.id, User.first_name, User.last_name, User.email, User.is_active)
+            .order_by(User.last_name.asc(), User.first_name.asc())
+        )
+        if caregiver_id:
+            stmt = stmt.where(User.id == caregiver_id)
 
-    async def get_patient_list(self, limit: int = 100, offset: int = 0) -> List[Patient]:
-        """List patients for selector dropdowns."""
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    async def get_patient_list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[Tuple[str, str, UUID]] = None,
+    ) -> List[Patient]:
+        """List patients for selector dropdowns, by offset or after a (last_name, first_name, id) key."""
         await self._set_search_path()
+        conditions = [Patient.deleted_at.is_(None)]
+        if after is not None:
+            conditions.append(tuple_(Patient.last_name, Patient.first_name, Patient.id) > tuple_(*after))
         stmt = (
             select(Patient)
-            .where(Patient.deleted_at.is_(None))
-            .order_by(Patient.last_name.asc(), Patient.first_name.asc())
+            .where(*conditions)
+            .order_by(Patient.last_name.asc(), Patient.first_name.asc(), Patient.id.asc())
             .limit(limit)
             .offset(offset)
         )
@@ -234,34 +419,36 @@ class ReportsRepository(BaseRepository):
     async def get_patient_summary(self, patient_id: UUID) -> Dict[str, object]:
         """Aggregate patient summary metrics."""
         await self._set_search_path()
-        summary_stmt = text(
+        stmt = text(
             """
             SELECT
-                COUNT(cs.id) AS total_sessions,
-                COUNT(DISTINCT cs.caregiver_id) AS distinct_caregivers
-            FROM care_sessions cs
-            WHERE cs.patient_id = :patient_id
-              AND cs.deleted_at IS NULL
+                (
+                    SELECT COUNT(cs.id)
+                    FROM care_sessions cs
+                    WHERE cs.patient_id = :patient_id
+                      AND cs.deleted_at IS NULL
+                ) AS total_sessions,
+                (
+                    SELECT COUNT(DISTINCT cs.caregiver_id)
+                    FROM care_sessions cs
+                    WHERE cs.patient_id = :patient_id
+                      AND cs.deleted_at IS NULL
+                ) AS distinct_caregivers,
+                (
+                    SELECT AVG(f.rating)::float
+                    FROM feedback f
+                    WHERE f.patient_id = :patient_id
+                      AND f.deleted_at IS NULL
+                ) AS avg_rating
             """
         )
-        summary_result = await self.db.execute(summary_stmt, {"patient_id": patient_id})
-        summary = summary_result.mappings().first() or {}
-
-        rating_stmt = text(
-            """
-            SELECT AVG(f.rating)::float AS avg_rating
-            FROM feedback f
-            WHERE f.patient_id = :patient_id
-              AND f.deleted_at IS NULL
-            """
-        )
-        rating_result = await self.db.execute(rating_stmt, {"patient_id": patient_id})
-        avg_rating = rating_result.scalar()
+        result = await self.db.execute(stmt, {"patient_id": patient_id})
+        summary = result.mappings().first() or {}
 
         return {
             "total_sessions": int(summary.get("total_sessions") or 0),
             "distinct_caregivers": int(summary.get("distinct_caregivers") or 0),
-            "avg_rating": float(avg_rating) if avg_rating is not None else None,
+            "avg_rating": float(summary["avg_rating"]) if summary.get("avg_rating") is not None else None,
         }
 
     async def get_patient_sessions(
@@ -271,49 +458,71 @@ class ReportsRepository(BaseRepository):
         offset: int = 0,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> Tuple[List[Dict[str, object]], int]:
-        """List patient sessions with feedback ratings."""
+        cursor_time: Optional[datetime] = None,
+        cursor_id: Optional[UUID] = None,
+        with_total: bool = True,
+    ) -> Tuple[Sequence[RowMapping], int]:
+        """List patient sessions with feedback ratings and the caregiver's name.
+
+        With ``with_total=False`` the count is skipped and 0 is returned as the
+        total, for callers that walk every page anyway.
+        """
         await self._set_search_path()
-        where_clauses = ["cs.patient_id = :patient_id", "cs.deleted_at IS NULL"]
-        params: Dict[str, object] = {"patient_id": patient_id, "limit": limit, "offset": offset}
+        conditions = [CareSession.patient_id == patient_id, CareSession.deleted_at.is_(None)]
         if start_date:
-            where_clauses.append("cs.check_in_time >= :start_date")
-            params["start_date"] = start_date
+            conditions.append(CareSession.check_in_time >= start_date)
         if end_date:
-            where_clauses.append("cs.check_in_time <= :end_date")
-            params["end_date"] = end_date
-
-        count_stmt = text(
-            f"""
-            SELECT COUNT(*) AS total
-            FROM care_sessions cs
-            WHERE {' AND '.join(where_clauses)}
-            """
-        )
-        total_result = await self.db.execute(count_stmt, params)
-        total = int(total_result.scalar() or 0)
+            conditions.append(CareSession.check_in_time <= end_date)
+        page_conditions = list(conditions)
+        if cursor_time is not None and cursor_id is not None:
+            page_conditions.append(
+                tuple_(CareSession.check_in_time, CareSession.id) < tuple_(cursor_time, cursor_id)
+            )
 
-        data_stmt = text(
-            f"""
-            SELECT
-                cs.id,
-                cs.caregiver_id,
-                cs.check_in_time,
-                cs.check_out_time,
-                cs.status,
-                cs.caregiver_notes,
-                f.rating AS rating,
-                f.patient_feedback AS feedback_comment,
-                f.created_at AS feedback_date
-            FROM care_sessions cs
-            LEFT JOIN feedback f ON f.care_session_id = cs.id AND f.deleted_at IS NULL
-            WHERE {' AND '.join(where_clauses)}
-            ORDER BY cs.check_in_time DESC, cs.id DESC
-            LIMIT :limit OFFSET :offset
-            """
+        # The total is computed over the unpaged predicate so it stays the same
+        # on every page, whether the caller pages by offset or by cursor.
+        count_stmt = select(func.count()).select_from(CareSession).where(*conditions)
+        columns = [
+            CareSession.id,
+            CareSession.caregiver_id,
+            CareSession.check_in_time,
+            CareSession.check_out_time,
+            _duration_minutes(),
+            CareSession.status,
+            CareSession.caregiver_notes,
+            Feedback.rating.label("rating"),
+            Feedback.patient_feedback.label("feedback_comment"),
+            Feedback.created_at.label("feedback_date"),
+            _joined_full_name(User).label("caregiver_full_name"),
+            Patient.careplan_type.label("careplan_type"),
+        ]
+        if with_total:
+            columns.append(count_stmt.correlate(None).scalar_subquery().label("total_count"))
+        data_stmt = (
+            select(*columns)
+            .select_from(CareSession)
+            .outerjoin(
+                Feedback,
+                and_(Feedback.care_session_id == CareSession.id, Feedback.deleted_at.is_(None)),
+            )
+            .outerjoin(User, User.id == CareSession.caregiver_id)
+            .outerjoin(Patient, Patient.id == CareSession.patient_id)
+            .where(*page_conditions)
+            .order_by(CareSession.check_in_time.desc(), CareSession.id.desc())
+            .limit(limit)
+            .offset(offset)
         )
-        result = await self.db.execute(data_stmt, params)
-        rows = [dict(row._mapping) for row in result]
+        result = await self.db.execute(data_stmt)
+        rows = result.mappings().all()
+        if not with_total:
+            total = 0
+        elif rows:
+            total = int(rows[0]["total_count"])
+        elif offset or cursor_time is not None:
+            # Page past the end: there is no row to carry the total.
+            total = int((await self.db.execute(count_stmt)).scalar() or 0)
+        else:
+            total = 0
         return rows, total
 
     async def get_feedback_list(
@@ -326,50 +535,55 @@ class ReportsRepository(BaseRepository):
         caregiver_id: Optional[UUID] = None,
         patient_id: Optional[UUID] = None,
         session_id: Optional[UUID] = None,
-    ) -> List[Dict[str, object]]:
-        """List feedback items with optional filters and cursor pagination."""
+    ) -> Sequence[RowMapping]:
+        """List feedback items, with patient and caregiver names, by filters and cursor."""
         await self._set_search_path()
-        where_clauses = ["f.deleted_at IS NULL", "cs.deleted_at IS NULL"]
-        params: Dict[str, object] = {"limit": limit}
-        if start_date:
-            where_clauses.append("f.created_at >= :start_date")
-            params["start_date"] = start_date
-        if end_date:
-            where_clauses.append("f.created_at <= :end_date")
-            params["end_date"] = end_date
-        if caregiver_id:
-            where_clauses.append("cs.caregiver_id = :caregiver_id")
-            params["caregiver_id"] = caregiver_id
-        if patient_id:
-            where_clauses.append("f.patient_id = :patient_id")
-            params["patient_id"] = patient_id
-        if session_id:
-            where_clauses.append("f.care_session_id = :session_id")
-            params["session_id"] = session_id
+        conditions = _feedback_list_conditions(start_date, end_date, caregiver_id, patient_id, session_id)
         if cursor_time is not None and cursor_id is not None:
-            where_clauses.append("(f.created_at < :cursor_time OR (f.created_at = :cursor_time AND f.id < :cursor_id))")
-            params["cursor_time"] = cursor_time
-            params["cursor_id"] = cursor_id
+            conditions.append(tuple_(Feedback.created_at, Feedback.id) < tuple_(cursor_time, cursor_id))
 
-        stmt = text(
-            f"""
-            SELECT
-                f.id,
-                f.care_session_id,
-                f.patient_id,
-                cs.caregiver_id,
-                f.rating,
-                f.patient_feedback,
-                f.created_at AS feedback_date
-            FROM feedback f
-            JOIN care_sessions cs ON cs.id = f.care_session_id
-            WHERE {' AND '.join(where_clauses)}
-            ORDER BY f.created_at DESC, f.id DESC
-            LIMIT :limit
-            """
+        stmt = (
+            select(
+                Feedback.id,
+                Feedback.care_session_id,
+                Feedback.patient_id,
+                CareSession.caregiver_id,
+                Feedback.rating,
+                Feedback.patient_feedback,
+                Feedback.created_at.label("feedback_date"),
+                _joined_full_name(Patient).label("patient_full_name"),
+                Patient.careplan_type,
+                _joined_full_name(User).label("caregiver_full_name"),
+            )
+            .select_from(Feedback)
+            .join(CareSession, CareSession.id == Feedback.care_session_id)
+            .outerjoin(Patient, Patient.id == Feedback.patient_id)
+            .outerjoin(User, User.id == CareSession.caregiver_id)
+            .where(*conditions)
+            .order_by(Feedback.created_at.desc(), Feedback.id.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.mappings().all()
+
+    async def count_feedback_list(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        caregiver_id: Optional[UUID] = None,
+        patient_id: Optional[UUID] = None,
+        session_id: Optional[UUID] = None,
+    ) -> int:
+        """Count feedback items matching the feedback list filters."""
+        await self._set_search_path()
+        stmt = (
+            select(func.count())
+            .select_from(Feedback)
+            .join(CareSession, CareSession.id == Feedback.care_session_id)
+            .where(*_feedback_list_conditions(start_date, end_date, caregiver_id, patient_id, session_id))
         )
-        result = await self.db.execute(stmt, params)
-        return [dict(row._mapping) for row in result]
+        result = await self.db.execute(stmt)
+        return int(result.scalar_one())
 
     async def get_feedback_summary(
         self,
@@ -377,27 +591,54 @@ class ReportsRepository(BaseRepository):
         end_date: Optional[datetime] = None,
     ) -> Dict[str, object]:
         """Get summary metrics for feedback."""
+        day_range = _day_bucket_range(start_date, end_date)
+        if day_range is not None:
+            return await self._get_feedback_summary_from_stats(*day_range)
+
         await self._set_search_path()
-        where_clauses = ["f.deleted_at IS NULL"]
-        params: Dict[str, object] = {}
+        conditions = [Feedback.deleted_at.is_(None)]
         if start_date:
-            where_clauses.append("f.created_at >= :start_date")
-            params["start_date"] = start_date
+            conditions.append(Feedback.created_at >= start_date)
         if end_date:
-            where_clauses.append("f.created_at <= :end_date")
-            params["end_date"] = end_date
+            conditions.append(Feedback.created_at <= end_date)
 
-        stmt = text(
-            f"""
-            SELECT
-                COUNT(*)::int AS total_feedback,
-                AVG(f.rating)::float AS avg_rating,
-                SUM(CASE WHEN f.rating >= 4 THEN 1 ELSE 0 END)::int AS positive_feedback
-            FROM feedback f
-            WHERE {' AND '.join(where_clauses)}
-            """
+        stmt = (
+            select(
+                func.count().label("total_feedback"),
+                cast(func.avg(Feedback.rating), Float).label("avg_rating"),
+                func.sum(case((Feedback.rating >= 4, 1), else_=0)).label("positive_feedback"),
+            )
+            .select_from(Feedback)
+            .where(*conditions)
         )
-        result = await self.db.execute(stmt, params)
+        result = await self.db.execute(stmt)
+        row = result.mappings().first() or {}
+        return {
+            "total_feedback": int(row.get("total_feedback") or 0),
+            "avg_rating": float(row.get("avg_rating")) if row.get("avg_rating") is not None else None,
+            "positive_feedback": int(row.get("positive_feedback") or 0),
+        }
+
+    async def _get_feedback_summary_from_stats(
+        self,
+        start_day: Optional[datetime],
+        end_day: Optional[datetime],
+    ) -> Dict[str, object]:
+        """Feedback summary summed from the trigger-maintained feedback_stats buckets."""
+        await self._set_search_path()
+        conditions = []
+        if start_day:
+            conditions.append(FeedbackStats.date_bucket >= start_day)
+        if end_day:
+            conditions.append(FeedbackStats.date_bucket < end_day)
+
+        total = func.coalesce(func.sum(FeedbackStats.total_feedback), 0)
+        stmt = select(
+            total.label("total_feedback"),
+            (cast(func.sum(FeedbackStats.rating_sum), Float) / func.nullif(total, 0)).label("avg_rating"),
+            func.coalesce(func.sum(FeedbackStats.positive_feedback), 0).label("positive_feedback"),
+        ).where(*conditions)
+        result = await self.db.execute(stmt)
         row = result.mappings().first() or {}
         return {
             "total_feedback": int(row.get("total_feedback") or 0),
@@ -410,48 +651,71 @@ class ReportsRepository(BaseRepository):
         caregiver_id: UUID,
         limit: int = 100,
         offset: int = 0,
-    ) -> Tuple[List[Dict[str, object]], int]:
-        """List caregiver feedback items for reports."""
+        cursor_time: Optional[datetime] = None,
+        cursor_id: Optional[UUID] = None,
+        with_total: bool = True,
+    ) -> Tuple[Sequence[RowMapping], int]:
+        """List caregiver feedback items for reports.
+
+        With ``with_total=False`` the count is skipped and 0 is returned as the
+        total, for callers that walk every page anyway.
+        """
         await self._set_search_path()
-        count_stmt = text(
-            """
-            SELECT COUNT(*) AS total
-            FROM feedback f
-            JOIN care_sessions cs ON cs.id = f.care_session_id
-            WHERE cs.caregiver_id = :caregiver_id
-              AND cs.deleted_at IS NULL
-              AND f.deleted_at IS NULL
-            """
-        )
-        total_result = await self.db.execute(count_stmt, {"caregiver_id": caregiver_id})
-        total = int(total_result.scalar() or 0)
+        conditions = [
+            CareSession.caregiver_id == caregiver_id,
+            CareSession.deleted_at.is_(None),
+            Feedback.deleted_at.is_(None),
+        ]
+        page_conditions = list(conditions)
+        if cursor_time is not None and cursor_id is not None:
+            page_conditions.append(tuple_(Feedback.created_at, Feedback.id) < tuple_(cursor_time, cursor_id))
 
-        data_stmt = text(
-            """
-            SELECT
-                f.id,
-                f.care_session_id,
-                f.patient_id,
-                f.rating,
-                f.patient_feedback,
-                f.created_at AS feedback_date,
-                cs.check_in_time AS session_date
-            FROM feedback f
-            JOIN care_sessions cs ON cs.id = f.care_session_id
-            WHERE cs.caregiver_id = :caregiver_id
-              AND cs.deleted_at IS NULL
-              AND f.deleted_at IS NULL
-            ORDER BY f.created_at DESC
-            LIMIT :limit OFFSET :offset
-            """
+        count_stmt = (
+            select(func.count())
+            .select_from(Feedback)
+            .join(CareSession, CareSession.id == Feedback.care_session_id)
+            .where(*conditions)
         )
-        result = await self.db.execute(
-            data_stmt,
-            {"caregiver_id": caregiver_id, "limit": limit, "offset": offset},
+        columns = [
+            Feedback.id,
+            Feedback.care_session_id,
+            Feedback.patient_id,
+            Feedback.rating,
+            Feedback.patient_feedback,
+            Feedback.created_at.label("feedback_date"),
+            CareSession.check_in_time.label("session_date"),
+            _joined_full_name(Patient).label("patient_full_name"),
+            _joined_full_name(User).label("caregiver_full_name"),
+        ]
+        if with_total:
+            columns.append(count_stmt.correlate(None).scalar_subquery().label("total_count"))
+        data_stmt = (
+            select(*columns)
+            .select_from(Feedback)
+            .join(CareSession, CareSession.id == Feedback.care_session_id)
+            .outerjoin(Patient, Patient.id == Feedback.patient_id)
+            .outerjoin(User, User.id == CareSession.caregiver_id)
+            .where(*page_conditions)
+            .order_by(Feedback.created_at.desc(), Feedback.id.desc())
+            .limit(limit)
+            .offset(offset)
         )
-        rows = [dict(row._mapping) for row in result]
+        result = await self.db.execute(data_stmt)
+        rows = result.mappings().all()
+        if not with_total:
+            total = 0
+        elif rows:
+            total = int(rows[0]["total_count"])
+        elif offset or cursor_time is not None:
+            # Page past the end: there is no row to carry the total.
+            total = int((await self.db.execute(count_stmt)).scalar() or 0)
+        else:
+            total = 0
         return rows, total
 
+    # Cache-sync writes below do not commit; the caller owns the transaction
+    # so a batch of events can be flushed with a single commit.
+
     async def upsert_patient_cache(self, payload: Dict[str, object]) -> None:
         """Upsert patient cache record."""
         await self._set_search_path()
@@ -462,27 +726,32 @@ class ReportsRepository(BaseRepository):
             set_=update_payload,
         )
         await self.db.execute(stmt)
-        await self.db.commit()
 
-    async def mark_patient_deleted(self, patient_id: UUID, deleted_at: datetime) -> None:
-        """Mark patient as deleted."""
+    async def upsert_patients_cache(self, payloads: List[Dict[str, object]]) -> None:
+        """Upsert many patient cache records with multi-row statements."""
+        await self._bulk_upsert(Patient, payloads)
+
+    async def mark_patient_deleted(self, patient_id: UUID, deleted_at: datetime) -> Optional[Dict[str, object]]:
+        """Mark patient as deleted; returns the updated row, or None if not cached."""
         await self._set_search_path()
-        await self.db.execute(
+        result = await self.db.execute(
             Patient.__table__.update()
             .where(Patient.id == patient_id)
             .values(deleted_at=deleted_at, is_active=False, updated_at=deleted_at)
+            .returning(Patient.__table__)
         )
-        await self.db.commit()
+        return result.mappings().first()
 
-    async def update_patient_status(self, patient_id: UUID, is_active: bool, updated_at: datetime) -> None:
-        """Update patient active status."""
+    async def update_patient_status(self, patient_id: UUID, is_active: bool, updated_at: datetime) -> Optional[Dict[str, object]]:
+        """Update patient active status; returns the updated row, or None if not cached."""
         await self._set_search_path()
-        await self.db.execute(
+        result = await self.db.execute(
             Patient.__table__.update()
             .where(Patient.id == patient_id)
             .values(is_active=is_active, updated_at=updated_at)
+            .returning(Patient.__table__)
         )
-        await self.db.commit()
+        return result.mappings().first()
 
     async def upsert_user_cache(self, payload: Dict[str, object]) -> None:
         """Upsert user cache record."""
@@ -494,34 +763,56 @@ class ReportsRepository(BaseRepository):
             set_=update_payload,
         )
         await self.db.execute(stmt)
-        await self.db.commit()
 
-    async def mark_user_deleted(self, user_id: UUID, deleted_at: datetime) -> None:
-        """Mark user as deleted."""
+    async def upsert_users_cache(self, payloads: List[Dict[str, object]]) -> None:
+        """Upsert many user cache records with multi-row statements."""
+        await self._bulk_upsert(User, payloads)
+
+    async def mark_user_deleted(self, user_id: UUID, deleted_at: datetime) -> Optional[Dict[str, object]]:
+        """Mark user as deleted; returns the updated row, or None if not cached."""
         await self._set_search_path()
-        await self.db.execute(
+        result = await self.db.execute(
             User.__table__.update()
             .where(User.id == user_id)
             .values(deleted_at=deleted_at, is_active=False, updated_at=deleted_at)
+            .returning(User.__table__)
         )
-        await self.db.commit()
+        return result.mappings().first()
 
-    async def update_user_status(self, user_id: UUID, is_active: bool, updated_at: datetime) -> None:
-        """Update user active status."""
+    async def update_user_status(self, user_id: UUID, is_active: bool, updated_at: datetime) -> Optional[Dict[str, object]]:
+        """Update user active status; returns the updated row, or None if not cached."""
         await self._set_search_path()
-        await self.db.execute(
+        result = await self.db.execute(
             User.__table__.update()
             .where(User.id == user_id)
             .values(is_active=is_active, updated_at=updated_at)
+            .returning(User.__table__)
         )
-        await self.db.commit()
+        return result.mappings().first()
 
-    async def update_user_role(self, user_id: UUID, role: Optional[str], is_active: bool, updated_at: datetime) -> None:
-        """Update user role and active status."""
+    async def update_user_role(self, user_id: UUID, role: Optional[str], is_active: bool, updated_at: datetime) -> Optional[Dict[str, object]]:
+        """Update user role and active status; returns the updated row, or None if not cached."""
         await self._set_search_path()
-        await self.db.execute(
+        result = await self.db.execute(
             User.__table__.update()
             .where(User.id == user_id)
             .values(role=role, is_active=is_active, updated_at=updated_at)
+            .returning(User.__table__)
         )
-        await self.db.commit()
+        return result.mappings().first()
+
+    async def _bulk_upsert(self, model, payloads: List[Dict[str, object]]) -> None:
+        # ON CONFLICT cannot update the same row twice in one statement, so the
+        # last payload per id wins.
+        rows = list({payload["id"]: payload for payload in payloads}.values())
+        if not rows:
+            return
+        await self._set_search_path()
+        update_columns = [key for key in rows[0] if key not in ("id", "created_at")]
+        for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+            stmt = insert(model).values(rows[start:start + _UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[model.id],
+                set_={key: stmt.excluded[key] for key in update_columns},
+            )
+            await self.db.execute(stmt)
@@ -1,10 +1,13 @@
+from functools import lru_cache
 from uuid import UUID
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, Query, HTTPException
+from datetime import date, datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.postgres import get_db
-from app.reports.service import ReportsService
+from app.reports.cache import reports_cache
+from app.reports.pdf_pool import render_pdf
+from app.reports.service import PARQUET_AVAILABLE, ReportsService, collect, iter_buffer, json_stream, single_batch
 from app.reports.schemas import (
     CareSessionReportPage,
     CareSessionReportItem,
@@ -22,35 +25,65 @@ from app.auth.middleware import JWTPayload, verify_token, check_permission
 from app.utils.timezone import convert_to_cet
 
 
-def get_reports_service(db: AsyncSession = Depends(get_db), jwt_payload: JWTPayload = Depends(verify_token)) -> ReportsService:
+def require_report_permission(jwt_payload: JWTPayload = Depends(verify_token)) -> JWTPayload:
+    """Reject callers without report access before any handler dependency is built."""
+    check_permission(jwt_payload, "care-session:report")
+    return jwt_payload
+
+
+def get_reports_service(db: AsyncSession = Depends(get_db), jwt_payload: JWTPayload = Depends(require_report_permission)) -> ReportsService:
     """Dependency to get ReportsService"""
     repository = ReportsRepository(db, jwt_payload.tenant_schema)
-    return ReportsService(repository)
+    return ReportsService(repository, reports_cache)
 
 
+# No default_response_class: with a response_model and the stock JSONResponse,
+# FastAPI serializes straight to JSON bytes in pydantic-core, which a custom
+# (e.g. orjson) response class would switch off. Handlers return model instances,
+# not dicts, so the response_model check is an isinstance pass and validators
+# are not re-run on data the service already built.
 router = APIRouter(
     prefix="/reports",
     tags=["reports"],
+    dependencies=[Depends(require_report_permission)],
 )
 
 
+def _set_page_headers(response: Response, next_cursor: str | None, offset: int) -> None:
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if offset:
+        response.headers["Warning"] = '299 - "offset is deprecated; page with the after cursor from X-Next-Cursor"'
+
+
+def _require_parquet() -> None:
+    if not PARQUET_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Parquet export is not available")
+
+
+_DAY = timedelta(days=1)
+_WEEK = timedelta(days=7)
+# Period ends are inclusive, one microsecond before the next period starts.
+_TICK = timedelta(microseconds=1)
+
+
 def _resolve_period_range(period: str) -> tuple[datetime, datetime]:
-    now = datetime.utcnow()
+    return _resolve_period_range_for_day(period, datetime.now(timezone.utc).toordinal())
+
+
+@lru_cache(maxsize=256)
+def _resolve_period_range_for_day(period: str, utc_day_ordinal: int) -> tuple[datetime, datetime]:
+    # The ranges only move at day boundaries, so the UTC day fully determines them.
+    today = date.fromordinal(utc_day_ordinal)
     if period == "day":
-        start = datetime(now.year, now.month, now.day)
-        end = start + timedelta(days=1) - timedelta(microseconds=1)
-        return start, end
+        start = datetime(today.year, today.month, today.day)
+        return start, start + _DAY - _TICK
     if period == "week":
-        start = datetime(now.year, now.month, now.day) - timedelta(days=now.weekday())
-        end = start + timedelta(days=7) - timedelta(microseconds=1)
-        return start, end
+        start = datetime.fromordinal(utc_day_ordinal - today.weekday())
+        return start, start + _WEEK - _TICK
     if period == "month":
-        start = datetime(now.year, now.month, 1)
-        if start.month == 12:
-            end = datetime(start.year + 1, 1, 1) - timedelta(microseconds=1)
-        else:
-            end = datetime(start.year, start.month + 1, 1) - timedelta(microseconds=1)
-        return start, end
+        start = datetime(today.year, today.month, 1)
+        return start, datetime(today.year + today.month // 12, today.month % 12 + 1, 1) - _TICK
     raise ValueError("Invalid period")
 
 
@@ -62,10 +95,8 @@ async def get_period_session_report(
     limit: int = Query(100, ge=1, le=1000),
     cursor: str | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Get reports for care sessions in a specific time period"""
-    check_permission(jwt_payload, "care-session:report")
     if period:
         try:
             start_date, end_date = _resolve_period_range(period)
@@ -85,10 +116,8 @@ async def get_all_time_session_report(
     limit: int = Query(100, ge=1, le=1000),
     cursor: str | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Get reports for all care sessions"""
-    check_permission(jwt_payload, "care-session:report")
     try:
         items, next_cursor = await service.get_all_time_session_report(limit, cursor)
     except ValueError:
@@ -101,12 +130,10 @@ async def download_period_session_report(
     start_date: datetime | None = Query(None),
     end_date: datetime | None = Query(None),
     period: str | None = Query(None, enum=["day", "week", "month"]),
-    format: str = Query("json", enum=["json", "csv", "pdf"]),
+    format: str = Query("json", enum=["json", "csv", "pdf", "parquet"]),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Download reports for care sessions in a specific time period"""
-    check_permission(jwt_payload, "care-session:report")
     if period:
         try:
             start_date, end_date = _resolve_period_range(period)
@@ -114,34 +141,42 @@ async def download_period_session_report(
             raise HTTPException(status_code=400, detail="Invalid period")
     if not start_date or not end_date:
         raise HTTPException(status_code=400, detail="start_date and end_date are required when period is not provided")
-    sessions, _ = await service.get_period_session_report(start_date, end_date, None, None)
-
     if format == "csv":
-        csv_buffer = service.generate_csv(sessions)
-        return StreamingResponse(csv_buffer, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=sessions_{start_date.date()}_to_{end_date.date()}.csv"})
+        csv_stream = service.generate_csv_stream(service.iter_period_session_report(start_date, end_date))
+        return StreamingResponse(csv_stream, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=sessions_{start_date.date()}_to_{end_date.date()}.csv"})
     elif format == "pdf":
-        pdf_buffer = service.generate_pdf(sessions, f"Care Sessions Report - {start_date.date()} to {end_date.date()}")
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=sessions_{start_date.date()}_to_{end_date.date()}.pdf"})
+        sessions = await collect(service.iter_period_session_report(start_date, end_date))
+        pdf_buffer = await render_pdf(service.generate_pdf, sessions, f"Care Sessions Report - {start_date.date()} to {end_date.date()}")
+        return StreamingResponse(iter_buffer(pdf_buffer), media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=sessions_{start_date.date()}_to_{end_date.date()}.pdf"})
+    elif format == "json":
+        return StreamingResponse(json_stream(service.iter_period_session_report(start_date, end_date)), media_type="application/json", headers={"Content-Disposition": f"attachment; filename=sessions_{start_date.date()}_to_{end_date.date()}.json"})
+    elif format == "parquet":
+        _require_parquet()
+        parquet_stream = service.generate_parquet_stream(service.iter_period_session_report(start_date, end_date))
+        return StreamingResponse(parquet_stream, media_type="application/vnd.apache.parquet", headers={"Content-Disposition": f"attachment; filename=sessions_{start_date.date()}_to_{end_date.date()}.parquet"})
     else:
         raise HTTPException(status_code=400, detail="Invalid format")
 
 
 @router.get("/sessions/all/download")
 async def download_all_time_session_report(
-    format: str = Query("json", enum=["json", "csv", "pdf"]),
+    format: str = Query("json", enum=["json", "csv", "pdf", "parquet"]),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Download reports for all care sessions"""
-    check_permission(jwt_payload, "care-session:report")
-    sessions, _ = await service.get_all_time_session_report(None, None)
-
     if format == "csv":
-        csv_buffer = service.generate_csv(sessions)
-        return StreamingResponse(csv_buffer, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=all_sessions.csv"})
+        csv_stream = service.generate_csv_stream(service.iter_all_time_session_report_sharded())
+        return StreamingResponse(csv_stream, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=all_sessions.csv"})
     elif format == "pdf":
-        pdf_buffer = service.generate_pdf(sessions, "All Care Sessions Report")
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=all_sessions.pdf"})
+        sessions = await collect(service.iter_all_time_session_report_sharded())
+        pdf_buffer = await render_pdf(service.generate_pdf, sessions, "All Care Sessions Report")
+        return StreamingResponse(iter_buffer(pdf_buffer), media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=all_sessions.pdf"})
+    elif format == "json":
+        return StreamingResponse(json_stream(service.iter_all_time_session_report_sharded()), media_type="application/json", headers={"Content-Disposition": "attachment; filename=all_sessions.json"})
+    elif format == "parquet":
+        _require_parquet()
+        parquet_stream = service.generate_parquet_stream(service.iter_all_time_session_report_sharded())
+        return StreamingResponse(parquet_stream, media_type="application/vnd.apache.parquet", headers={"Content-Disposition": "attachment; filename=all_sessions.parquet"})
     else:
         raise HTTPException(status_code=400, detail="Invalid format")
 
@@ -150,10 +185,8 @@ async def download_all_time_session_report(
 async def get_individual_session_report(
     session_id: UUID,
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Get report for an individual care session"""
-    check_permission(jwt_payload, "care-session:report")
     return await service.get_individual_session_report(session_id)
 
 
@@ -162,33 +195,41 @@ async def download_individual_session_report(
     session_id: UUID,
     format: str = Query("json", enum=["json", "csv", "pdf"]),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Download report for an individual care session"""
-    check_permission(jwt_payload, "care-session:report")
     session = await service.get_individual_session_report(session_id)
     sessions = [session]
 
     if format == "csv":
-        csv_buffer = service.generate_csv(sessions)
-        return StreamingResponse(csv_buffer, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=session_{session_id}.csv"})
+        csv_stream = service.generate_csv_stream(single_batch(sessions))
+        return StreamingResponse(csv_stream, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=session_{session_id}.csv"})
     elif format == "pdf":
-        pdf_buffer = service.generate_pdf(sessions, f"Care Session Report - {session_id}")
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=session_{session_id}.pdf"})
+        pdf_buffer = await render_pdf(service.generate_pdf, sessions, f"Care Session Report - {session_id}")
+        return StreamingResponse(iter_buffer(pdf_buffer), media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=session_{session_id}.pdf"})
+    elif format == "json":
+        return StreamingResponse(json_stream(single_batch(sessions)), media_type="application/json", headers={"Content-Disposition": f"attachment; filename=session_{session_id}.json"})
     else:
         raise HTTPException(status_code=400, detail="Invalid format")
 
 
 @router.get("/caregivers", response_model=list[CaregiverListItem])
 async def list_caregivers(
+    response: Response,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
-    """List caregivers for selector dropdowns."""
-    check_permission(jwt_payload, "care-session:report")
-    return await service.get_caregiver_list(limit, offset)
+    """List caregivers for selector dropdowns.
+
+    Pages by keyset: pass the previous response's X-Next-Cursor header as ``after``.
+    """
+    try:
+        items, next_cursor = await service.get_caregiver_list(limit, offset, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    _set_page_headers(response, next_cursor, offset)
+    return items
 
 
 @router.get("/caregivers/performance", response_model=list[CaregiverPerformanceItem])
@@ -196,10 +237,8 @@ async def caregiver_performance(
     start_date: datetime | None = Query(None),
     end_date: datetime | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Aggregate caregiver performance metrics."""
-    check_permission(jwt_payload, "care-session:report")
     return await service.get_caregiver_performance(start_date, end_date)
 
 
@@ -209,18 +248,18 @@ async def download_caregiver_performance(
     start_date: datetime | None = Query(None),
     end_date: datetime | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Download caregiver performance report."""
-    check_permission(jwt_payload, "care-session:report")
     caregivers = await service.get_caregiver_performance(start_date, end_date)
 
     if format == "csv":
-        csv_buffer = service.generate_caregiver_csv(caregivers)
-        return StreamingResponse(csv_buffer, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=caregiver_performance.csv"})
+        csv_stream = service.generate_caregiver_csv_stream(single_batch(caregivers))
+        return StreamingResponse(csv_stream, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=caregiver_performance.csv"})
     elif format == "pdf":
-        pdf_buffer = service.generate_caregiver_pdf(caregivers, "Caregiver Performance Report")
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=caregiver_performance.pdf"})
+        pdf_buffer = await render_pdf(service.generate_caregiver_pdf, caregivers, "Caregiver Performance Report")
+        return StreamingResponse(iter_buffer(pdf_buffer), media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=caregiver_performance.pdf"})
+    elif format == "json":
+        return StreamingResponse(json_stream(single_batch(caregivers)), media_type="application/json", headers={"Content-Disposition": "attachment; filename=caregiver_performance.json"})
     else:
         raise HTTPException(status_code=400, detail="Invalid format")
 
@@ -232,42 +271,48 @@ async def download_caregiver_report(
     start_date: datetime | None = Query(None),
     end_date: datetime | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Download report for a single caregiver."""
-    check_permission(jwt_payload, "care-session:report")
     caregivers = await service.get_caregiver_performance(start_date, end_date, caregiver_id)
 
     if format == "csv":
-        csv_buffer = service.generate_caregiver_csv(caregivers)
-        return StreamingResponse(csv_buffer, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}.csv"})
+        csv_stream = service.generate_caregiver_csv_stream(single_batch(caregivers))
+        return StreamingResponse(csv_stream, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}.csv"})
     elif format == "pdf":
-        pdf_buffer = service.generate_caregiver_pdf(caregivers, f"Caregiver Report - {caregiver_id}")
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}.pdf"})
+        pdf_buffer = await render_pdf(service.generate_caregiver_pdf, caregivers, f"Caregiver Report - {caregiver_id}")
+        return StreamingResponse(iter_buffer(pdf_buffer), media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}.pdf"})
+    elif format == "json":
+        return StreamingResponse(json_stream(single_batch(caregivers)), media_type="application/json", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}.json"})
     else:
         raise HTTPException(status_code=400, detail="Invalid format")
 
 
 @router.get("/patients", response_model=list[PatientListItem])
 async def list_patients(
+    response: Response,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
-    """List patients for selector dropdowns."""
-    check_permission(jwt_payload, "care-session:report")
-    return await service.get_patient_list(limit, offset)
+    """List patients for selector dropdowns.
+
+    Pages by keyset: pass the previous response's X-Next-Cursor header as ``after``.
+    """
+    try:
+        items, next_cursor = await service.get_patient_list(limit, offset, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    _set_page_headers(response, next_cursor, offset)
+    return items
 
 
 @router.get("/patients/{patient_id}/summary", response_model=PatientSummary)
 async def get_patient_summary(
     patient_id: UUID,
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Get patient summary metrics."""
-    check_permission(jwt_payload, "care-session:report")
     return await service.get_patient_summary(patient_id)
 
 
@@ -278,12 +323,14 @@ async def list_patient_sessions(
     offset: int = Query(0, ge=0),
     start_date: datetime | None = Query(None),
     end_date: datetime | None = Query(None),
+    cursor: str | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """List patient session history."""
-    check_permission(jwt_payload, "care-session:report")
-    return await service.get_patient_sessions(patient_id, limit, offset, start_date, end_date)
+    try:
+        return await service.get_patient_sessions(patient_id, limit, offset, start_date, end_date, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.get("/patients/{patient_id}/download")
@@ -293,18 +340,19 @@ async def download_patient_report(
     start_date: datetime | None = Query(None),
     end_date: datetime | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Download patient session history report."""
-    check_permission(jwt_payload, "care-session:report")
-    page = await service.get_patient_sessions(patient_id, limit=10000, offset=0, start_date=start_date, end_date=end_date)
+    batches = service.iter_patient_sessions(patient_id, start_date, end_date)
 
     if format == "csv":
-        csv_buffer = service.generate_patient_sessions_csv(page.items)
-        return StreamingResponse(csv_buffer, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=patient_{patient_id}.csv"})
+        csv_stream = service.generate_patient_sessions_csv_stream(batches)
+        return StreamingResponse(csv_stream, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=patient_{patient_id}.csv"})
     elif format == "pdf":
-        pdf_buffer = service.generate_patient_sessions_pdf(page.items, f"Patient Report - {patient_id}")
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=patient_{patient_id}.pdf"})
+        sessions = await collect(batches)
+        pdf_buffer = await render_pdf(service.generate_patient_sessions_pdf, sessions, f"Patient Report - {patient_id}")
+        return StreamingResponse(iter_buffer(pdf_buffer), media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=patient_{patient_id}.pdf"})
+    elif format == "json":
+        return StreamingResponse(json_stream(batches), media_type="application/json", headers={"Content-Disposition": f"attachment; filename=patient_{patient_id}.json"})
     else:
         raise HTTPException(status_code=400, detail="Invalid format")
 
@@ -320,10 +368,8 @@ async def list_feedback_reports(
     limit: int = Query(100, ge=1, le=1000),
     cursor: str | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """List feedback reports with filters."""
-    check_permission(jwt_payload, "care-session:report")
     if period:
         try:
             start_date, end_date = _resolve_period_range(period)
@@ -349,10 +395,8 @@ async def feedback_summary(
     end_date: datetime | None = Query(None),
     period: str | None = Query(None, enum=["day", "week", "month"]),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Feedback summary metrics."""
-    check_permission(jwt_payload, "care-session:report")
     if period:
         try:
             start_date, end_date = _resolve_period_range(period)
@@ -368,31 +412,24 @@ async def download_feedback_report(
     period: str | None = Query(None, enum=["day", "week", "month"]),
     format: str = Query("json", enum=["json", "csv", "pdf"]),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Download feedback report."""
-    check_permission(jwt_payload, "care-session:report")
     if period:
         try:
             start_date, end_date = _resolve_period_range(period)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid period")
-    page = await service.get_feedback_report(
-        limit=10000,
-        cursor=None,
-        start_date=start_date,
-        end_date=end_date,
-        caregiver_id=None,
-        patient_id=None,
-        session_id=None,
-    )
+    batches = service.iter_feedback_report_sharded(start_date=start_date, end_date=end_date)
 
     if format == "csv":
-        csv_buffer = service.generate_feedback_csv(page.items)
-        return StreamingResponse(csv_buffer, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=feedback_report.csv"})
+        csv_stream = service.generate_feedback_csv_stream(batches)
+        return StreamingResponse(csv_stream, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=feedback_report.csv"})
     elif format == "pdf":
-        pdf_buffer = service.generate_feedback_pdf(page.items, "Feedback Report")
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=feedback_report.pdf"})
+        feedbacks = await collect(batches)
+        pdf_buffer = await render_pdf(service.generate_feedback_pdf, feedbacks, "Feedback Report")
+        return StreamingResponse(iter_buffer(pdf_buffer), media_type="application/pdf", headers={"Content-Disposition": "attachment; filename=feedback_report.pdf"})
+    elif format == "json":
+        return StreamingResponse(json_stream(batches), media_type="application/json", headers={"Content-Disposition": "attachment; filename=feedback_report.json"})
     else:
         raise HTTPException(status_code=400, detail="Invalid format")
 
@@ -402,12 +439,14 @@ async def list_caregiver_feedback(
     caregiver_id: UUID,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """List caregiver feedback for reports."""
-    check_permission(jwt_payload, "care-session:report")
-    return await service.get_caregiver_feedback(caregiver_id, limit, offset)
+    try:
+        return await service.get_caregiver_feedback(caregiver_id, limit, offset, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.get("/caregivers/{caregiver_id}/feedback/download")
@@ -415,17 +454,18 @@ async def download_caregiver_feedback(
     caregiver_id: UUID,
     format: str = Query("json", enum=["json", "csv", "pdf"]),
     service: ReportsService = Depends(get_reports_service),
-    jwt_payload: JWTPayload = Depends(verify_token),
 ):
     """Download caregiver feedback report."""
-    check_permission(jwt_payload, "care-session:report")
-    page = await service.get_caregiver_feedback(caregiver_id, limit=10000, offset=0)
+    batches = service.iter_caregiver_feedback(caregiver_id)
 
     if format == "csv":
-        csv_buffer = service.generate_caregiver_feedback_csv(page.items)
-        return StreamingResponse(csv_buffer, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}_feedback.csv"})
+        csv_stream = service.generate_caregiver_feedback_csv_stream(batches)
+        return StreamingResponse(csv_stream, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}_feedback.csv"})
     elif format == "pdf":
-        pdf_buffer = service.generate_caregiver_feedback_pdf(page.items, f"Caregiver Feedback - {caregiver_id}")
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}_feedback.pdf"})
+        feedbacks = await collect(batches)
+        pdf_buffer = await render_pdf(service.generate_caregiver_feedback_pdf, feedbacks, f"Caregiver Feedback - {caregiver_id}")
+        return StreamingResponse(iter_buffer(pdf_buffer), media_type="application/pdf", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}_feedback.pdf"})
+    elif format == "json":
+        return StreamingResponse(json_stream(batches), media_type="application/json", headers={"Content-Disposition": f"attachment; filename=caregiver_{caregiver_id}_feedback.json"})
     else:
         raise HTTPException(status_code=400, detail="Invalid format")
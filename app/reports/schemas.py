@@ -85,6 +85,7 @@ class PatientSessionPage(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class FeedbackReportItem(BaseModel):
@@ -133,3 +134,4 @@ class CaregiverFeedbackPage(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
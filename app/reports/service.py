@@ -1,10 +1,19 @@
-from typing import List, Optional, Tuple, Dict
+import asyncio
+import csv
+import json
+import math
+import struct
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Sequence, Tuple, Dict
 from uuid import UUID
-from datetime import datetime
-import pandas as pd
-from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from datetime import datetime, timedelta
+from io import BytesIO, StringIO
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from app.reports.cache import LIST_TTL_SECONDS, SUMMARY_TTL_SECONDS, ReportsCache
 from app.reports.repository import ReportsRepository
 from app.reports.schemas import (
     CareSessionReportItem,
@@ -21,77 +30,578 @@ from app.reports.schemas import (
     CaregiverFeedbackPage,
 )
 from app.care_sessions.exceptions import CareSessionNotFoundException
-from app.db.models import Patient, User
-
-
-def to_report_response(session, patient: Optional[Patient], caregiver: Optional[User]) -> CareSessionReportItem:
-    """Convert CareSession model to report response schema."""
-    duration_minutes = None
-    if session.check_in_time and session.check_out_time:
-        duration_minutes = int((session.check_out_time - session.check_in_time).total_seconds() / 60)
-    patient_full_name = None
-    if patient:
-        patient_full_name = " ".join([name for name in [patient.first_name, patient.last_name] if name])
-    caregiver_full_name = None
-    if caregiver:
-        caregiver_full_name = " ".join([name for name in [caregiver.first_name, caregiver.last_name] if name])
-    return CareSessionReportItem(
-        id=session.id,
-        patient_id=session.patient_id,
-        patient_full_name=patient_full_name,
-        patient_email=patient.email if patient else None,
-        careplan_type=patient.careplan_type if patient else None,
-        caregiver_id=session.caregiver_id,
-        caregiver_full_name=caregiver_full_name,
-        caregiver_email=caregiver.email if caregiver else None,
-        check_in_time=session.check_in_time,
-        check_out_time=session.check_out_time,
-        duration_minutes=duration_minutes,
-        status=session.status,
-        caregiver_notes=session.caregiver_notes,
-        created_at=session.created_at,
-        updated_at=session.updated_at,
+from app.db.postgres import DB_POOL_SIZE, AsyncSessionLocal
+
+# Page size used when download iterators walk a keyset-paginated report.
+DOWNLOAD_PAGE_SIZE = 1000
+# Upper bound on concurrent shard queries (each holds a pooled connection) per download.
+MAX_DOWNLOAD_SHARDS = 8
+# Batches a shard may buffer ahead of the consumer before its query pauses.
+SHARD_QUEUE_BATCHES = 2
+# Extra connections all sharded downloads of this process may hold at once; the
+# rest of the pool stays free for ordinary requests.
+SHARD_CONNECTIONS = max(1, DB_POOL_SIZE // 2)
+_shard_connections = asyncio.Semaphore(SHARD_CONNECTIONS)
+# Slice size when streaming a finished in-memory file such as a rendered PDF.
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# Keyset cursors pack (microseconds since a naive epoch, uuid bytes); the report
+# timestamp columns are all naive.
+_KEYSET_CURSOR = struct.Struct(">q16s")
+_CURSOR_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_REPORT_ITEMS = TypeAdapter(List[CareSessionReportItem])
+_CAREGIVER_LIST = TypeAdapter(Tuple[List[CaregiverListItem], Optional[str]])
+_PATIENT_LIST = TypeAdapter(Tuple[List[PatientListItem], Optional[str]])
+_PATIENT_SUMMARY = TypeAdapter(PatientSummary)
+_FEEDBACK_SUMMARY = TypeAdapter(FeedbackReportSummary)
+_CAREGIVER_PERFORMANCE = TypeAdapter(List[CaregiverPerformanceItem])
+_PATIENT_SESSION_ITEMS = TypeAdapter(List[PatientSessionItem])
+_FEEDBACK_ITEMS = TypeAdapter(List[FeedbackReportItem])
+_CAREGIVER_FEEDBACK_ITEMS = TypeAdapter(List[CaregiverFeedbackItem])
+
+
+SESSION_CSV_HEADER = (
+    "ID",
+    "Patient ID",
+    "Patient Name",
+    "Patient Email",
+    "Careplan Type",
+    "Caregiver ID",
+    "Caregiver Name",
+    "Caregiver Email",
+    "Check In Time",
+    "Check Out Time",
+    "Duration (Minutes)",
+    "Status",
+    "Caregiver Notes",
+    "Created At",
+    "Updated At",
+)
+CAREGIVER_CSV_HEADER = (
+    "Caregiver ID",
+    "Caregiver Name",
+    "Caregiver Email",
+    "Total Sessions",
+    "Completed Sessions",
+    "Avg Rating",
+    "Avg Duration (Minutes)",
+    "Status",
+)
+PATIENT_SESSIONS_CSV_HEADER = (
+    "Session ID",
+    "Caregiver ID",
+    "Caregiver Name",
+    "Careplan Type",
+    "Check In Time",
+    "Check Out Time",
+    "Duration (Minutes)",
+    "Status",
+    "Rating",
+    "Feedback",
+)
+FEEDBACK_CSV_HEADER = (
+    "Feedback ID",
+    "Session ID",
+    "Patient",
+    "Caregiver",
+    "Type",
+    "Date",
+    "Rating",
+    "Feedback",
+)
+CAREGIVER_FEEDBACK_CSV_HEADER = (
+    "Caregiver ID",
+    "Caregiver Name",
+    "Patient ID",
+    "Patient Name",
+    "Session Date",
+    "Rating",
+    "Comment",
+    "Feedback Date",
+)
+
+
+# uuid.UUID.__str__ formats in Python. Patient and caregiver ids repeat across
+# the rows of an export, so their text is cached; row ids are unique and are not.
+_id_text = lru_cache(maxsize=4096)(str)
+
+
+def _session_csv_row(session: CareSessionReportItem) -> tuple:
+    return (
+        str(session.id),
+        _id_text(session.patient_id),
+        session.patient_full_name or "",
+        session.patient_email or "",
+        session.careplan_type or "",
+        _id_text(session.caregiver_id),
+        session.caregiver_full_name or "",
+        session.caregiver_email or "",
+        session.check_in_time.isoformat() if session.check_in_time else "",
+        session.check_out_time.isoformat() if session.check_out_time else "",
+        session.duration_minutes if session.duration_minutes is not None else "",
+        session.status,
+        session.caregiver_notes or "",
+        session.created_at.isoformat(),
+        session.updated_at.isoformat() if session.updated_at else "",
+    )
+
+
+def _caregiver_csv_row(caregiver: CaregiverPerformanceItem) -> tuple:
+    return (
+        str(caregiver.caregiver_id),
+        caregiver.caregiver_full_name,
+        caregiver.caregiver_email or "",
+        caregiver.total_sessions,
+        caregiver.completed_sessions,
+        caregiver.avg_rating if caregiver.avg_rating is not None else "",
+        caregiver.avg_duration_minutes if caregiver.avg_duration_minutes is not None else "",
+        caregiver.status,
+    )
+
+
+def _patient_session_csv_row(session: PatientSessionItem) -> tuple:
+    return (
+        str(session.session_id),
+        _id_text(session.caregiver_id),
+        session.caregiver_full_name or "",
+        session.careplan_type or "",
+        session.check_in_time.isoformat(),
+        session.check_out_time.isoformat() if session.check_out_time else "",
+        session.duration_minutes if session.duration_minutes is not None else "",
+        session.status,
+        session.rating if session.rating is not None else "",
+        session.feedback_comment or "",
+    )
+
+
+def _feedback_csv_row(feedback: FeedbackReportItem) -> tuple:
+    return (
+        str(feedback.id),
+        str(feedback.session_id),
+        feedback.patient_full_name or "",
+        feedback.caregiver_full_name or "",
+        feedback.careplan_type or "",
+        feedback.feedback_date.isoformat(),
+        feedback.rating,
+        feedback.comment or "",
+    )
+
+
+def _caregiver_feedback_csv_row(feedback: CaregiverFeedbackItem) -> tuple:
+    return (
+        _id_text(feedback.caregiver_id),
+        feedback.caregiver_full_name or "",
+        _id_text(feedback.patient_id),
+        feedback.patient_full_name or "",
+        feedback.session_date.isoformat(),
+        feedback.rating,
+        feedback.comment or "",
+        feedback.feedback_date.isoformat(),
     )
 
 
+# Report PDFs print each record as a block of "Label: value" lines with a rule under it.
+# Lines are taken from the record's CSV row, so both formats flatten a record once
+# the same way; a None label leaves that column out of the PDF.
+_PDF_LEADING = 15
+_PDF_RECORD_GAP = 20
+
+SESSION_PDF_LABELS = (
+    "ID",
+    "Patient ID",
+    "Patient Name",
+    "Patient Email",
+    "Careplan Type",
+    "Caregiver ID",
+    "Caregiver Name",
+    "Caregiver Email",
+    "Check In",
+    "Check Out",
+    "Duration (Minutes)",
+    "Status",
+    "Notes",
+    None,
+    None,
+)
+CAREGIVER_PDF_LABELS = (
+    "Caregiver ID",
+    "Name",
+    "Email",
+    "Total Sessions",
+    "Completed Sessions",
+    "Avg Rating",
+    "Avg Duration (Minutes)",
+    "Status",
+)
+PATIENT_SESSIONS_PDF_LABELS = (
+    "Session ID",
+    None,
+    "Caregiver",
+    "Careplan Type",
+    "Check In",
+    "Check Out",
+    "Duration (Minutes)",
+    "Status",
+    "Rating",
+    "Feedback",
+)
+FEEDBACK_PDF_LABELS = (
+    "Feedback ID",
+    "Session ID",
+    "Patient",
+    "Caregiver",
+    "Type",
+    "Date",
+    "Rating",
+    "Feedback",
+)
+CAREGIVER_FEEDBACK_PDF_LABELS = (
+    None,
+    "Caregiver",
+    None,
+    "Patient",
+    "Session Date",
+    "Rating",
+    "Comment",
+    "Feedback Date",
+)
+
+
+def _records_pdf(
+    title: str,
+    records: Iterable,
+    to_row: Callable[[object], tuple],
+    labels: Tuple[Optional[str], ...],
+    page_break_y: float,
+) -> BytesIO:
+    """Render records as labelled text blocks, one text object per record."""
+    # Imported here so only processes that render PDFs (the pdf_pool workers,
+    # or the thread fallback) load ReportLab; the API parent never does.
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    fields = [(label, index) for index, label in enumerate(labels) if label is not None]
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=letter)
+    width, height = letter
+    line_x1 = 50
+    line_x2 = width - 50
+
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(100, height - 50, title)
+    # Text objects inherit the canvas font, so it is set once per page, not per record.
+    c.setFont("Helvetica", 10, leading=_PDF_LEADING)
+    c.setLineWidth(0.5)
+
+    y = height - 80
+    for record in records:
+        if y < page_break_y:
+            c.showPage()
+            c.setFont("Helvetica", 10, leading=_PDF_LEADING)
+            c.setLineWidth(0.5)
+            y = height - 50
+
+        row = to_row(record)
+        text = c.beginText(50, y)
+        text.textLines([f"{label}: {row[index]}" for label, index in fields])
+        c.drawText(text)
+        rule_y = y - _PDF_LEADING * len(fields)
+        c.line(line_x1, rule_y, line_x2, rule_y)
+        y = rule_y - _PDF_RECORD_GAP
+
+    c.save()
+    buffer.seek(0)
+    return buffer
+
+
+@lru_cache(maxsize=None)
+def _encoded_csv_header(header: Tuple[str, ...]) -> bytes:
+    buffer = StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(header)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _plain_csv_text(rows: List[tuple], template: str, delimiters: int) -> Optional[str]:
+    """Format rows with one %-template each, or None if any field would need quoting.
+
+    Quote-free batches (the common case) skip csv.writer's per-field quoting
+    checks; the check here is a few whole-string scans of the result.
+    """
+    if any(None in row for row in rows):
+        return None
+    text = "".join([template % row for row in rows])
+    if (
+        '"' in text
+        or "\r" in text
+        or text.count(",") != delimiters * len(rows)
+        or text.count("\n") != len(rows)
+    ):
+        return None
+    return text
+
+
+async def _csv_stream(
+    header: Tuple[str, ...],
+    batches: AsyncIterator[Iterable],
+    to_row: Callable[[object], tuple],
+) -> AsyncIterator[bytes]:
+    """Encode batches of items as CSV, yielding one chunk per batch."""
+    yield _encoded_csv_header(header)
+    template = ",".join(["%s"] * len(header)) + "\n"
+    buffer = StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    async for batch in batches:
+        rows = [to_row(item) for item in batch]
+        text = _plain_csv_text(rows, template, len(header) - 1)
+        if text is None:
+            buffer.seek(0)
+            buffer.truncate(0)
+            writer.writerows(rows)
+            text = buffer.getvalue()
+        yield text.encode("utf-8")
+
+
+async def json_stream(batches: AsyncIterator[Iterable]) -> AsyncIterator[bytes]:
+    """Encode batches of response models as one JSON array, yielding one chunk per batch.
+
+    Batches are serialized directly by pydantic-core, without wrapping them in a page model.
+    """
+    yield b"["
+    first = True
+    async for batch in batches:
+        body = to_json(list(batch))[1:-1]
+        if not body:
+            continue
+        yield body if first else b"," + body
+        first = False
+    yield b"]"
+
+
+# pyarrow is optional and only imported by the first Parquet export: it costs
+# every worker (PDF pool processes included) ~90ms and ~50MB otherwise.
+PARQUET_AVAILABLE = find_spec("pyarrow") is not None
+
+
+@lru_cache(maxsize=None)
+def _pyarrow():
+    import pyarrow
+    import pyarrow.parquet
+    return pyarrow, pyarrow.parquet
+
+
+@lru_cache(maxsize=None)
+def _session_parquet_schema():
+    pa, _ = _pyarrow()
+    # Ids are written as strings; timestamps are naive like the care_sessions columns.
+    return pa.schema([
+        ("id", pa.string()),
+        ("patient_id", pa.string()),
+        ("patient_full_name", pa.string()),
+        ("patient_email", pa.string()),
+        ("careplan_type", pa.string()),
+        ("caregiver_id", pa.string()),
+        ("caregiver_full_name", pa.string()),
+        ("caregiver_email", pa.string()),
+        ("check_in_time", pa.timestamp("us")),
+        ("check_out_time", pa.timestamp("us")),
+        ("duration_minutes", pa.int32()),
+        ("status", pa.string()),
+        ("caregiver_notes", pa.string()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+    ])
+
+
+class _ChunkSink:
+    """Write-only file handing out what was written since the last take().
+
+    ParquetWriter records footer offsets from tell(), so the position keeps
+    counting while the buffered bytes are drained.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _parquet_stream(batches: AsyncIterator[Iterable], schema) -> AsyncIterator[bytes]:
+    """Encode batches as one zstd Parquet file, yielding each row group as it is written."""
+    pa, pq = _pyarrow()
+    uuid_columns = [field.name for field in schema if field.name == "id" or field.name.endswith("_id")]
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema, compression="zstd")
+    try:
+        async for batch in batches:
+            columns = {name: [getattr(item, name) for item in batch] for name in schema.names}
+            for name in uuid_columns:
+                columns[name] = [str(value) for value in columns[name]]
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            chunk = sink.take()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.take()
+
+
+def _time_shards(
+    start: Optional[datetime], end: Optional[datetime], total: int
+) -> List[Tuple[Optional[datetime], Optional[datetime]]]:
+    """Split an inclusive time range into contiguous windows, newest first.
+
+    One window per DOWNLOAD_PAGE_SIZE rows, capped at MAX_DOWNLOAD_SHARDS. An
+    open-ended range stays a single window.
+    """
+    count = min(MAX_DOWNLOAD_SHARDS, math.ceil(total / DOWNLOAD_PAGE_SIZE))
+    if count <= 1 or start is None or end is None or end <= start:
+        return [(start, end)]
+    step = (end - start) / count
+    bounds = [start + step * i for i in range(count)] + [end]
+    shards = [(bounds[i], bounds[i + 1] - timedelta(microseconds=1)) for i in range(count - 1)]
+    shards.append((bounds[-2], end))
+    return shards[::-1]
+
+
+async def single_batch(items: Iterable) -> AsyncIterator[Iterable]:
+    """Wrap an already-loaded list as a one-batch stream."""
+    yield items
+
+
+async def iter_buffer(buffer: BytesIO, chunk_size: int = DOWNLOAD_CHUNK_BYTES) -> AsyncIterator[bytes]:
+    """Yield a finished in-memory file in fixed-size slices.
+
+    Iterating a BytesIO directly splits binary content on newline bytes.
+    """
+    while chunk := buffer.read(chunk_size):
+        yield chunk
+
+
+async def collect(batches: AsyncIterator[List]) -> List:
+    """Flatten a batch stream into one list, for builders that need every row."""
+    return [item async for batch in batches for item in batch]
+
+
+@dataclass(slots=True)
+class _CareSessionRow:
+    """Unvalidated CareSessionReportItem twin for exports; rows come straight from the database."""
+    id: UUID
+    patient_id: UUID
+    patient_full_name: Optional[str]
+    patient_email: Optional[str]
+    careplan_type: Optional[str]
+    caregiver_id: UUID
+    caregiver_full_name: Optional[str]
+    caregiver_email: Optional[str]
+    check_in_time: datetime
+    check_out_time: Optional[datetime]
+    duration_minutes: Optional[int]
+    status: str
+    caregiver_notes: Optional[str]
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+def _full_name(first_name: Optional[str], last_name: Optional[str]) -> str:
+    if first_name and last_name:
+        return f"{first_name} {last_name}"
+    return first_name or last_name or ""
+
+
+def _report_row(session) -> Dict[str, object]:
+    return {
+        "id": session.id,
+        "patient_id": session.patient_id,
+        "patient_full_name": session.patient_full_name,
+        "patient_email": session.patient_email,
+        "careplan_type": session.careplan_type,
+        "caregiver_id": session.caregiver_id,
+        "caregiver_full_name": session.caregiver_full_name,
+        "caregiver_email": session.caregiver_email,
+        "check_in_time": session.check_in_time,
+        "check_out_time": session.check_out_time,
+        "duration_minutes": session.duration_minutes,
+        "status": session.status,
+        "caregiver_notes": session.caregiver_notes,
+        "created_at": session.created_at,
+        "updated_at": session.updated_at,
+    }
+
+
+def to_report_response(session) -> CareSessionReportItem:
+    """Convert a joined report session row to report response schema."""
+    return CareSessionReportItem.model_validate(_report_row(session))
+
+
+def _export_rows(sessions: Sequence) -> List[_CareSessionRow]:
+    return [_CareSessionRow(**_report_row(session)) for session in sessions]
+
+
+def to_report_items(sessions: Sequence) -> List[CareSessionReportItem]:
+    """Convert a batch of sessions in one validator call instead of one per row."""
+    return _REPORT_ITEMS.validate_python([_report_row(session) for session in sessions])
+
+
 class ReportsService:
     """Service for generating care session reports"""
 
-    def __init__(self, repository: ReportsRepository):
+    def __init__(self, repository: ReportsRepository, cache: Optional[ReportsCache] = None):
         self.repository = repository
+        self.cache = cache or ReportsCache(url="")
 
     def _parse_cursor(self, cursor: str) -> Tuple[datetime, UUID]:
-        parts = cursor.split("|", 1)
-        if len(parts) != 2:
-            raise ValueError("Invalid cursor")
-        cursor_time = datetime.fromisoformat(parts[0])
-        cursor_id = UUID(parts[1])
-        return cursor_time, cursor_id
+        try:
+            micros, id_bytes = _KEYSET_CURSOR.unpack(urlsafe_b64decode(cursor.encode("ascii")))
+            return _CURSOR_EPOCH + micros * _MICROSECOND, UUID(bytes=id_bytes)
+        except (struct.error, ValueError, UnicodeError, OverflowError) as e:
+            raise ValueError("Invalid cursor") from e
 
     def _build_cursor(self, cursor_time: datetime, cursor_id: UUID) -> str:
-        return f"{cursor_time.isoformat()}|{cursor_id}"
+        micros = (cursor_time - _CURSOR_EPOCH) // _MICROSECOND
+        return urlsafe_b64encode(_KEYSET_CURSOR.pack(micros, cursor_id.bytes)).decode("ascii")
 
-    def _format_full_name(self, first_name: Optional[str], last_name: Optional[str]) -> str:
-        return " ".join([name for name in [first_name, last_name] if name])
+    def _parse_name_cursor(self, cursor: str) -> Tuple[str, str, UUID]:
+        try:
+            last_name, first_name, cursor_id = json.loads(urlsafe_b64decode(cursor.encode("ascii")))
+            if not all(isinstance(part, str) for part in (last_name, first_name, cursor_id)):
+                raise TypeError("cursor parts must be strings")
+            return last_name, first_name, UUID(cursor_id)
+        except (TypeError, ValueError, UnicodeError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    def _build_name_cursor(self, last_name: str, first_name: str, cursor_id: UUID) -> str:
+        return urlsafe_b64encode(json.dumps([last_name, first_name, str(cursor_id)]).encode("utf-8")).decode("ascii")
 
-    async def _load_cache_maps(self, sessions) -> Tuple[Dict[UUID, Patient], Dict[UUID, User]]:
-        patient_ids = {session.patient_id for session in sessions}
-        caregiver_ids = {session.caregiver_id for session in sessions}
-        patients = await self.repository.get_patients_by_ids(list(patient_ids))
-        caregivers = await self.repository.get_users_by_ids(list(caregiver_ids))
-        return patients, caregivers
+    def _format_full_name(self, first_name: Optional[str], last_name: Optional[str]) -> str:
+        return _full_name(first_name, last_name)
 
     async def get_individual_session_report(self, session_id: UUID) -> CareSessionReportItem:
         """Get report for a single care session"""
         session = await self.repository.get_by_id(session_id)
         if not session:
             raise CareSessionNotFoundException(str(session_id))
-        patients, caregivers = await self._load_cache_maps([session])
-        return to_report_response(
-            session,
-            patients.get(session.patient_id),
-            caregivers.get(session.caregiver_id),
-        )
+        return to_report_response(session)
 
     async def get_period_session_report(
         self,
@@ -119,20 +629,147 @@ class ReportsService:
             last = sessions[limit - 1]
             next_cursor = self._build_cursor(last.check_in_time, last.id)
             sessions = sessions[:limit]
-        patients, caregivers = await self._load_cache_maps(sessions)
-        items = [
-            to_report_response(
-                session,
-                patients.get(session.patient_id),
-                caregivers.get(session.caregiver_id),
-            )
-            for session in sessions
-        ]
+        items = to_report_items(sessions)
         return items, next_cursor
 
-    async def get_caregiver_list(self, limit: int = 100, offset: int = 0) -> List[CaregiverListItem]:
-        caregivers = await self.repository.get_caregiver_list(limit, offset)
-        return [
+    async def iter_period_session_report(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> AsyncIterator[List[_CareSessionRow]]:
+        """Yield report rows for a period batch by batch, for downloads."""
+        async for sessions in self.repository.stream_sessions_in_period(start_date, end_date):
+            yield _export_rows(sessions)
+
+    async def _iter_shards(
+        self,
+        shards: List[Tuple[datetime, datetime]],
+        fetch: Callable[["ReportsService", datetime, datetime], AsyncIterator[List]],
+    ) -> AsyncIterator[List]:
+        """Fetch shards concurrently, each on its own session, and yield their batches in order.
+
+        Each shard hands batches over through a bounded queue, so a download holds at
+        most SHARD_QUEUE_BATCHES batches per shard rather than whole shards. Shards
+        read in separate transactions, so the result is not one consistent snapshot.
+
+        Connections come from the process-wide SHARD_CONNECTIONS budget. A download
+        only takes slots that are free when it starts and reuses them shard after
+        shard, so downloads never wait on each other; with no slot free the shards
+        are read one after another on the request's own session.
+        """
+        async def run(queue: asyncio.Queue, shard_start: datetime, shard_end: datetime) -> None:
+            try:
+                async with AsyncSessionLocal() as session:
+                    repository = ReportsRepository(session, self.repository.tenant_schema)
+                    async for batch in fetch(ReportsService(repository, self.cache), shard_start, shard_end):
+                        await queue.put(batch)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        slots = 0
+        while slots < len(shards) and not _shard_connections.locked():
+            await _shard_connections.acquire()
+            slots += 1
+        try:
+            if not slots:
+                for shard_start, shard_end in shards:
+                    async for items in fetch(self, shard_start, shard_end):
+                        if items:
+                            yield items
+                return
+
+            queues = [asyncio.Queue(maxsize=SHARD_QUEUE_BATCHES) for _ in shards]
+            tasks = [asyncio.create_task(run(queues[index], *shards[index])) for index in range(slots)]
+            try:
+                for index, queue in enumerate(queues):
+                    while (items := await queue.get()) is not None:
+                        if isinstance(items, Exception):
+                            raise items
+                        if items:
+                            yield items
+                    # run() has closed its session by now, so the slot passes on.
+                    if index + slots < len(shards):
+                        tasks.append(asyncio.create_task(run(queues[index + slots], *shards[index + slots])))
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            for _ in range(slots):
+                _shard_connections.release()
+
+    async def iter_all_time_session_report(
+        self,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> AsyncIterator[List[_CareSessionRow]]:
+        """Yield report rows for all sessions batch by batch, for downloads."""
+        async for sessions in self.repository.stream_all_sessions(created_from=created_from, created_to=created_to):
+            yield _export_rows(sessions)
+
+    async def iter_all_time_session_report_sharded(self) -> AsyncIterator[List[_CareSessionRow]]:
+        """Like iter_all_time_session_report, fetching created_at windows in parallel."""
+        first, last, total = await self.repository.get_session_created_bounds()
+        if first is None:
+            return
+        shards = _time_shards(first, last, total)
+        if len(shards) == 1:
+            async for batch in self.iter_all_time_session_report():
+                yield batch
+            return
+        async for items in self._iter_shards(
+            shards,
+            lambda service, shard_start, shard_end: service.iter_all_time_session_report(shard_start, shard_end),
+        ):
+            yield items
+
+    def generate_csv_stream(self, batches: AsyncIterator[List[CareSessionReportItem]]) -> AsyncIterator[bytes]:
+        """Stream CSV bytes for care session report batches."""
+        return _csv_stream(SESSION_CSV_HEADER, batches, _session_csv_row)
+
+    def generate_parquet_stream(self, batches: AsyncIterator[List[CareSessionReportItem]]) -> AsyncIterator[bytes]:
+        """Stream a Parquet file for care session report batches; needs pyarrow."""
+        return _parquet_stream(batches, _session_parquet_schema())
+
+    def generate_caregiver_csv_stream(self, batches: AsyncIterator[List[CaregiverPerformanceItem]]) -> AsyncIterator[bytes]:
+        """Stream CSV bytes for caregiver performance batches."""
+        return _csv_stream(CAREGIVER_CSV_HEADER, batches, _caregiver_csv_row)
+
+    def generate_patient_sessions_csv_stream(self, batches: AsyncIterator[List[PatientSessionItem]]) -> AsyncIterator[bytes]:
+        """Stream CSV bytes for patient session history batches."""
+        return _csv_stream(PATIENT_SESSIONS_CSV_HEADER, batches, _patient_session_csv_row)
+
+    def generate_feedback_csv_stream(self, batches: AsyncIterator[List[FeedbackReportItem]]) -> AsyncIterator[bytes]:
+        """Stream CSV bytes for feedback report batches."""
+        return _csv_stream(FEEDBACK_CSV_HEADER, batches, _feedback_csv_row)
+
+    def generate_caregiver_feedback_csv_stream(self, batches: AsyncIterator[List[CaregiverFeedbackItem]]) -> AsyncIterator[bytes]:
+        """Stream CSV bytes for caregiver feedback batches."""
+        return _csv_stream(CAREGIVER_FEEDBACK_CSV_HEADER, batches, _caregiver_feedback_csv_row)
+
+    async def get_caregiver_list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Tuple[List[CaregiverListItem], Optional[str]]:
+        after_key = None
+        if after:
+            after_key = self._parse_name_cursor(after)
+            offset = 0
+        key = await self.cache.key(self.repository.tenant_schema, "caregivers", limit, offset, after)
+        cached = await self.cache.get(key, _CAREGIVER_LIST)
+        if cached is not None:
+            return cached
+        caregivers = await self.repository.get_caregiver_list(limit + 1, offset, after_key)
+        next_cursor = None
+        if len(caregivers) > limit:
+            last = caregivers[limit - 1]
+            next_cursor = self._build_name_cursor(last.last_name, last.first_name, last.id)
+            caregivers = caregivers[:limit]
+        items = [
             CaregiverListItem(
                 id=caregiver.id,
                 full_name=self._format_full_name(caregiver.first_name, caregiver.last_name),
@@ -141,6 +778,9 @@ class ReportsService:
             )
             for caregiver in caregivers
         ]
+        result = (items, next_cursor)
+        await self.cache.set(key, result, _CAREGIVER_LIST, LIST_TTL_SECONDS)
+        return result
 
     async def get_caregiver_performance(
         self,
@@ -148,9 +788,17 @@ class ReportsService:
         end_date: Optional[datetime] = None,
         caregiver_id: Optional[UUID] = None,
     ) -> List[CaregiverPerformanceItem]:
+        key = await self.cache.key(
+            self.repository.tenant_schema,
+            "caregiver_performance",
+            start_date,
+            end_date,
+            caregiver_id,
+        )
+        cached = await self.cache.get(key, _CAREGIVER_PERFORMANCE)
+        if cached is not None:
+            return cached
         rows = await self.repository.get_caregiver_performance(start_date, end_date, caregiver_id)
-        caregiver_ids = [row.id for row in rows]
-        avg_ratings = await self.repository.get_caregiver_avg_ratings(caregiver_ids, start_date, end_date)
         items: List[CaregiverPerformanceItem] = []
         for row in rows:
             full_name = self._format_full_name(row.first_name, row.last_name)
@@ -162,73 +810,41 @@ class ReportsService:
                     caregiver_email=row.email,
                     total_sessions=int(row.total_sessions or 0),
                     completed_sessions=int(row.completed_sessions or 0),
-                    avg_rating=avg_ratings.get(row.id),
+                    avg_rating=row.avg_rating,
                     avg_duration_minutes=float(row.avg_duration_minutes) if row.avg_duration_minutes is not None else None,
                     status=status,
                 )
             )
+        await self.cache.set(key, items, _CAREGIVER_PERFORMANCE, SUMMARY_TTL_SECONDS)
         return items
 
 
-    def generate_caregiver_csv(self, caregivers: List[CaregiverPerformanceItem]) -> BytesIO:
-        """Generate CSV file from caregiver performance data."""
-        data = []
-        for caregiver in caregivers:
-            data.append({
-                "Caregiver ID": str(caregiver.caregiver_id),
-                "Caregiver Name": caregiver.caregiver_full_name,
-                "Caregiver Email": caregiver.caregiver_email or "",
-                "Total Sessions": caregiver.total_sessions,
-                "Completed Sessions": caregiver.completed_sessions,
-                "Avg Rating": caregiver.avg_rating if caregiver.avg_rating is not None else "",
-                "Avg Duration (Minutes)": caregiver.avg_duration_minutes if caregiver.avg_duration_minutes is not None else "",
-                "Status": caregiver.status,
-            })
-        df = pd.DataFrame(data)
-        buffer = BytesIO()
-        df.to_csv(buffer, index=False)
-        buffer.seek(0)
-        return buffer
-
-    def generate_caregiver_pdf(self, caregivers: List[CaregiverPerformanceItem], title: str) -> BytesIO:
+    @staticmethod
+    def generate_caregiver_pdf(caregivers: List[CaregiverPerformanceItem], title: str) -> BytesIO:
         """Generate PDF file from caregiver performance data."""
-        buffer = BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
-        line_x1 = 50
-        line_x2 = width - 50
-
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(100, height - 50, title)
-
-        y = height - 80
-        c.setFont("Helvetica", 10)
-
-        for caregiver in caregivers:
-            if y < 200:
-                c.showPage()
-                y = height - 50
-                c.setFont("Helvetica", 10)
-
-            c.drawString(50, y, f"Caregiver ID: {caregiver.caregiver_id}")
-            c.drawString(50, y - 15, f"Name: {caregiver.caregiver_full_name}")
-            c.drawString(50, y - 30, f"Email: {caregiver.caregiver_email or ''}")
-            c.drawString(50, y - 45, f"Total Sessions: {caregiver.total_sessions}")
-            c.drawString(50, y - 60, f"Completed Sessions: {caregiver.completed_sessions}")
-            c.drawString(50, y - 75, f"Avg Rating: {caregiver.avg_rating if caregiver.avg_rating is not None else ''}")
-            c.drawString(50, y - 90, f"Avg Duration (Minutes): {caregiver.avg_duration_minutes if caregiver.avg_duration_minutes is not None else ''}")
-            c.drawString(50, y - 105, f"Status: {caregiver.status}")
-            c.setLineWidth(0.5)
-            c.line(line_x1, y - 120, line_x2, y - 120)
-            y -= 140
+        return _records_pdf(title, caregivers, _caregiver_csv_row, CAREGIVER_PDF_LABELS, page_break_y=200)
 
-        c.save()
-        buffer.seek(0)
-        return buffer
-
-    async def get_patient_list(self, limit: int = 100, offset: int = 0) -> List[PatientListItem]:
-        patients = await self.repository.get_patient_list(limit, offset)
-        return [
+    async def get_patient_list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Tuple[List[PatientListItem], Optional[str]]:
+        after_key = None
+        if after:
+            after_key = self._parse_name_cursor(after)
+            offset = 0
+        key = await self.cache.key(self.repository.tenant_schema, "patients", limit, offset, after)
+        cached = await self.cache.get(key, _PATIENT_LIST)
+        if cached is not None:
+            return cached
+        patients = await self.repository.get_patient_list(limit + 1, offset, after_key)
+        next_cursor = None
+        if len(patients) > limit:
+            last = patients[limit - 1]
+            next_cursor = self._build_name_cursor(last.last_name, last.first_name, last.id)
+            patients = patients[:limit]
+        items = [
             PatientListItem(
                 id=patient.id,
                 full_name=self._format_full_name(patient.first_name, patient.last_name),
@@ -237,15 +853,24 @@ class ReportsService:
             )
             for patient in patients
         ]
+        result = (items, next_cursor)
+        await self.cache.set(key, result, _PATIENT_LIST, LIST_TTL_SECONDS)
+        return result
 
     async def get_patient_summary(self, patient_id: UUID) -> PatientSummary:
+        key = await self.cache.key(self.repository.tenant_schema, "patient_summary", patient_id)
+        cached = await self.cache.get(key, _PATIENT_SUMMARY)
+        if cached is not None:
+            return cached
         summary = await self.repository.get_patient_summary(patient_id)
-        return PatientSummary(
+        result = PatientSummary(
             patient_id=patient_id,
             total_sessions=summary["total_sessions"],
             avg_rating=summary["avg_rating"],
             distinct_caregivers=summary["distinct_caregivers"],
         )
+        await self.cache.set(key, result, _PATIENT_SUMMARY, SUMMARY_TTL_SECONDS)
+        return result
 
     async def get_patient_sessions(
         self,
@@ -254,96 +879,81 @@ class ReportsService:
         offset: int = 0,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
     ) -> PatientSessionPage:
-        rows, total = await self.repository.get_patient_sessions(patient_id, limit, offset, start_date, end_date)
-        caregiver_ids = {row["caregiver_id"] for row in rows}
-        caregivers = await self.repository.get_users_by_ids(list(caregiver_ids))
-        patients = await self.repository.get_patients_by_ids([patient_id])
-        patient = patients.get(patient_id)
+        cursor_time = None
+        cursor_id = None
+        if cursor:
+            cursor_time, cursor_id = self._parse_cursor(cursor)
+            offset = 0
+        rows, total = await self.repository.get_patient_sessions(
+            patient_id,
+            limit + 1,
+            offset,
+            start_date,
+            end_date,
+            cursor_time,
+            cursor_id,
+            with_total,
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = self._build_cursor(last["check_in_time"], last["id"])
+            rows = rows[:limit]
+        items = _PATIENT_SESSION_ITEMS.validate_python(
+            [
+                {
+                    "session_id": row["id"],
+                    "caregiver_id": row["caregiver_id"],
+                    "caregiver_full_name": row["caregiver_full_name"],
+                    "careplan_type": row["careplan_type"],
+                    "check_in_time": row["check_in_time"],
+                    "check_out_time": row["check_out_time"],
+                    "duration_minutes": row["duration_minutes"],
+                    "status": row["status"],
+                    "rating": row.get("rating"),
+                    "feedback_comment": row.get("feedback_comment"),
+                }
+                for row in rows
+            ]
+        )
+        return PatientSessionPage(
+            items=items,
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+        )
 
-        items: List[PatientSessionItem] = []
-        for row in rows:
-            duration_minutes = None
-            if row["check_in_time"] and row["check_out_time"]:
-                duration_minutes = int((row["check_out_time"] - row["check_in_time"]).total_seconds() / 60)
-            caregiver = caregivers.get(row["caregiver_id"])
-            caregiver_full_name = None
-            if caregiver:
-                caregiver_full_name = self._format_full_name(caregiver.first_name, caregiver.last_name)
-            items.append(
-                PatientSessionItem(
-                    session_id=row["id"],
-                    caregiver_id=row["caregiver_id"],
-                    caregiver_full_name=caregiver_full_name,
-                    careplan_type=patient.careplan_type if patient else None,
-                    check_in_time=row["check_in_time"],
-                    check_out_time=row["check_out_time"],
-                    duration_minutes=duration_minutes,
-                    status=row["status"],
-                    rating=row.get("rating"),
-                    feedback_comment=row.get("feedback_comment"),
-                )
+    async def iter_patient_sessions(
+        self,
+        patient_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> AsyncIterator[List[PatientSessionItem]]:
+        """Walk every page of a patient's session history by keyset cursor."""
+        cursor = None
+        while True:
+            page = await self.get_patient_sessions(
+                patient_id,
+                limit=DOWNLOAD_PAGE_SIZE,
+                start_date=start_date,
+                end_date=end_date,
+                cursor=cursor,
+                with_total=False,
             )
-        return PatientSessionPage(items=items, total=total, limit=limit, offset=offset)
-
-    def generate_patient_sessions_csv(self, sessions: List[PatientSessionItem]) -> BytesIO:
-        """Generate CSV file from patient session history."""
-        data = []
-        for session in sessions:
-            data.append({
-                "Session ID": str(session.id),
-                "Caregiver ID": str(session.caregiver_id),
-                "Caregiver Name": session.caregiver_full_name or "",
-                "Careplan Type": session.careplan_type or "",
-                "Check In Time": session.check_in_time.isoformat(),
-                "Check Out Time": session.check_out_time.isoformat() if session.check_out_time else "",
-                "Duration (Minutes)": session.duration_minutes if session.duration_minutes is not None else "",
-                "Status": session.status,
-                "Rating": session.rating if session.rating is not None else "",
-                "Feedback": session.feedback_comment or "",
-            })
-        df = pd.DataFrame(data)
-        buffer = BytesIO()
-        df.to_csv(buffer, index=False)
-        buffer.seek(0)
-        return buffer
-
-    def generate_patient_sessions_pdf(self, sessions: List[PatientSessionItem], title: str) -> BytesIO:
-        """Generate PDF file from patient session history."""
-        buffer = BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
-        line_x1 = 50
-        line_x2 = width - 50
-
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(100, height - 50, title)
-
-        y = height - 80
-        c.setFont("Helvetica", 10)
-
-        for session in sessions:
-            if y < 230:
-                c.showPage()
-                y = height - 50
-                c.setFont("Helvetica", 10)
-
-            c.drawString(50, y, f"Session ID: {session.id}")
-            c.drawString(50, y - 15, f"Caregiver: {session.caregiver_full_name or ''}")
-            c.drawString(50, y - 30, f"Careplan Type: {session.careplan_type or ''}")
-            c.drawString(50, y - 45, f"Check In: {session.check_in_time}")
-            c.drawString(50, y - 60, f"Check Out: {session.check_out_time}")
-            c.drawString(50, y - 75, f"Duration (Minutes): {session.duration_minutes if session.duration_minutes is not None else ''}")
-            c.drawString(50, y - 90, f"Status: {session.status}")
-            c.drawString(50, y - 105, f"Rating: {session.rating if session.rating is not None else ''}")
-            c.drawString(50, y - 120, f"Feedback: {session.feedback_comment or ''}")
-            c.setLineWidth(0.5)
-            c.line(line_x1, y - 135, line_x2, y - 135)
-            y -= 155
+            if page.items:
+                yield page.items
+            cursor = page.next_cursor
+            if cursor is None:
+                return
 
-        c.save()
-        buffer.seek(0)
-        return buffer
+    @staticmethod
+    def generate_patient_sessions_pdf(sessions: List[PatientSessionItem], title: str) -> BytesIO:
+        """Generate PDF file from patient session history."""
+        return _records_pdf(title, sessions, _patient_session_csv_row, PATIENT_SESSIONS_PDF_LABELS, page_break_y=230)
 
     async def get_feedback_report(
         self,
@@ -376,188 +986,165 @@ class ReportsService:
             next_cursor = self._build_cursor(last["feedback_date"], last["id"])
             rows = rows[:limit]
 
-        patient_ids = {row["patient_id"] for row in rows}
-        caregiver_ids = {row["caregiver_id"] for row in rows}
-        patients = await self.repository.get_patients_by_ids(list(patient_ids))
-        caregivers = await self.repository.get_users_by_ids(list(caregiver_ids))
+        items = _FEEDBACK_ITEMS.validate_python(
+            [
+                {
+                    "id": row["id"],
+                    "session_id": row["care_session_id"],
+                    "patient_id": row["patient_id"],
+                    "patient_full_name": row["patient_full_name"],
+                    "caregiver_id": row["caregiver_id"],
+                    "caregiver_full_name": row["caregiver_full_name"],
+                    "careplan_type": row["careplan_type"],
+                    "feedback_date": row["feedback_date"],
+                    "rating": row["rating"],
+                    "comment": row.get("patient_feedback"),
+                }
+                for row in rows
+            ]
+        )
+        return FeedbackReportPage(items=items, next_cursor=next_cursor)
 
-        items = []
-        for row in rows:
-            patient = patients.get(row["patient_id"])
-            caregiver = caregivers.get(row["caregiver_id"])
-            items.append(
-                FeedbackReportItem(
-                    id=row["id"],
-                    session_id=row["care_session_id"],
-                    patient_id=row["patient_id"],
-                    patient_full_name=self._format_full_name(
-                        patient.first_name, patient.last_name
-                    ) if patient else None,
-                    caregiver_id=row["caregiver_id"],
-                    caregiver_full_name=self._format_full_name(
-                        caregiver.first_name, caregiver.last_name
-                    ) if caregiver else None,
-                    careplan_type=patient.careplan_type if patient else None,
-                    feedback_date=row["feedback_date"],
-                    rating=row["rating"],
-                    comment=row.get("patient_feedback"),
-                )
+    async def iter_feedback_report(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        caregiver_id: Optional[UUID] = None,
+        patient_id: Optional[UUID] = None,
+        session_id: Optional[UUID] = None,
+    ) -> AsyncIterator[List[FeedbackReportItem]]:
+        """Walk every page of the feedback report by keyset cursor."""
+        cursor = None
+        while True:
+            page = await self.get_feedback_report(
+                limit=DOWNLOAD_PAGE_SIZE,
+                cursor=cursor,
+                start_date=start_date,
+                end_date=end_date,
+                caregiver_id=caregiver_id,
+                patient_id=patient_id,
+                session_id=session_id,
             )
-        return FeedbackReportPage(items=items, next_cursor=next_cursor)
+            if page.items:
+                yield page.items
+            cursor = page.next_cursor
+            if cursor is None:
+                return
+
+    async def iter_feedback_report_sharded(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> AsyncIterator[List[FeedbackReportItem]]:
+        """Like iter_feedback_report, fetching time windows in parallel when the range is bounded."""
+        shards = [(start_date, end_date)]
+        if start_date is not None and end_date is not None:
+            total = await self.repository.count_feedback_list(start_date, end_date)
+            shards = _time_shards(start_date, end_date, total)
+        if len(shards) == 1:
+            async for batch in self.iter_feedback_report(start_date=start_date, end_date=end_date):
+                yield batch
+            return
+        async for items in self._iter_shards(
+            shards,
+            lambda service, shard_start, shard_end: service.iter_feedback_report(start_date=shard_start, end_date=shard_end),
+        ):
+            yield items
 
     async def get_feedback_summary(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> FeedbackReportSummary:
+        key = await self.cache.key(
+            self.repository.tenant_schema,
+            "feedback_summary",
+            start_date,
+            end_date,
+        )
+        cached = await self.cache.get(key, _FEEDBACK_SUMMARY)
+        if cached is not None:
+            return cached
         summary = await self.repository.get_feedback_summary(start_date, end_date)
-        return FeedbackReportSummary(**summary)
-
-    def generate_feedback_csv(self, feedbacks: List[FeedbackReportItem]) -> BytesIO:
-        """Generate CSV file from feedback report data."""
-        data = []
-        for feedback in feedbacks:
-            data.append({
-                "Feedback ID": str(feedback.id),
-                "Session ID": str(feedback.session_id),
-                "Patient": feedback.patient_full_name or "",
-                "Caregiver": feedback.caregiver_full_name or "",
-                "Type": feedback.careplan_type or "",
-                "Date": feedback.feedback_date.isoformat(),
-                "Rating": feedback.rating,
-                "Feedback": feedback.comment or "",
-            })
-        df = pd.DataFrame(data)
-        buffer = BytesIO()
-        df.to_csv(buffer, index=False)
-        buffer.seek(0)
-        return buffer
-
-    def generate_feedback_pdf(self, feedbacks: List[FeedbackReportItem], title: str) -> BytesIO:
-        """Generate PDF file from feedback report data."""
-        buffer = BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
-        line_x1 = 50
-        line_x2 = width - 50
-
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(100, height - 50, title)
-
-        y = height - 80
-        c.setFont("Helvetica", 10)
-
-        for feedback in feedbacks:
-            if y < 220:
-                c.showPage()
-                y = height - 50
-                c.setFont("Helvetica", 10)
-
-            c.drawString(50, y, f"Feedback ID: {feedback.id}")
-            c.drawString(50, y - 15, f"Session ID: {feedback.session_id}")
-            c.drawString(50, y - 30, f"Patient: {feedback.patient_full_name or ''}")
-            c.drawString(50, y - 45, f"Caregiver: {feedback.caregiver_full_name or ''}")
-            c.drawString(50, y - 60, f"Type: {feedback.careplan_type or ''}")
-            c.drawString(50, y - 75, f"Date: {feedback.feedback_date}")
-            c.drawString(50, y - 90, f"Rating: {feedback.rating}")
-            c.drawString(50, y - 105, f"Feedback: {feedback.comment or ''}")
-            c.setLineWidth(0.5)
-            c.line(line_x1, y - 120, line_x2, y - 120)
-            y -= 140
+        result = FeedbackReportSummary(**summary)
+        await self.cache.set(key, result, _FEEDBACK_SUMMARY, SUMMARY_TTL_SECONDS)
+        return result
 
-        c.save()
-        buffer.seek(0)
-        return buffer
+    @staticmethod
+    def generate_feedback_pdf(feedbacks: List[FeedbackReportItem], title: str) -> BytesIO:
+        """Generate PDF file from feedback report data."""
+        return _records_pdf(title, feedbacks, _feedback_csv_row, FEEDBACK_PDF_LABELS, page_break_y=220)
 
     async def get_caregiver_feedback(
         self,
         caregiver_id: UUID,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
     ) -> CaregiverFeedbackPage:
-        rows, total = await self.repository.get_caregiver_feedback(caregiver_id, limit, offset)
-        patient_ids = {row["patient_id"] for row in rows}
-        patients = await self.repository.get_patients_by_ids(list(patient_ids))
-        caregivers = await self.repository.get_users_by_ids([caregiver_id])
-        caregiver = caregivers.get(caregiver_id)
-        caregiver_full_name = None
-        if caregiver:
-            caregiver_full_name = self._format_full_name(caregiver.first_name, caregiver.last_name)
+        cursor_time = None
+        cursor_id = None
+        if cursor:
+            cursor_time, cursor_id = self._parse_cursor(cursor)
+            offset = 0
+        rows, total = await self.repository.get_caregiver_feedback(
+            caregiver_id,
+            limit + 1,
+            offset,
+            cursor_time,
+            cursor_id,
+            with_total,
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = self._build_cursor(last["feedback_date"], last["id"])
+            rows = rows[:limit]
+        items = _CAREGIVER_FEEDBACK_ITEMS.validate_python(
+            [
+                {
+                    "id": row["id"],
+                    "caregiver_id": caregiver_id,
+                    "caregiver_full_name": row["caregiver_full_name"],
+                    "patient_id": row["patient_id"],
+                    "patient_full_name": row["patient_full_name"],
+                    "rating": row["rating"],
+                    "comment": row.get("patient_feedback"),
+                    "session_date": row["session_date"],
+                    "feedback_date": row["feedback_date"],
+                }
+                for row in rows
+            ]
+        )
+        return CaregiverFeedbackPage(
+            items=items,
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+        )
 
-        items = [
-            CaregiverFeedbackItem(
-                id=row["id"],
-                caregiver_id=caregiver_id,
-                caregiver_full_name=caregiver_full_name,
-                patient_id=row["patient_id"],
-                patient_full_name=self._format_full_name(
-                    patients.get(row["patient_id"]).first_name,
-                    patients.get(row["patient_id"]).last_name,
-                )
-                if patients.get(row["patient_id"])
-                else None,
-                rating=row["rating"],
-                comment=row.get("patient_feedback"),
-                session_date=row["session_date"],
-                feedback_date=row["feedback_date"],
+    async def iter_caregiver_feedback(self, caregiver_id: UUID) -> AsyncIterator[List[CaregiverFeedbackItem]]:
+        """Walk every page of a caregiver's feedback by keyset cursor."""
+        cursor = None
+        while True:
+            page = await self.get_caregiver_feedback(
+                caregiver_id,
+                limit=DOWNLOAD_PAGE_SIZE,
+                cursor=cursor,
+                with_total=False,
             )
-            for row in rows
-        ]
-        return CaregiverFeedbackPage(items=items, total=total, limit=limit, offset=offset)
-
-    def generate_caregiver_feedback_csv(self, feedbacks: List[CaregiverFeedbackItem]) -> BytesIO:
-        """Generate CSV file from caregiver feedback."""
-        data = []
-        for feedback in feedbacks:
-            data.append({
-                "Caregiver ID": str(feedback.caregiver_id),
-                "Caregiver Name": feedback.caregiver_full_name or "",
-                "Patient ID": str(feedback.patient_id),
-                "Patient Name": feedback.patient_full_name or "",
-                "Session Date": feedback.session_date.isoformat(),
-                "Rating": feedback.rating,
-                "Comment": feedback.comment or "",
-                "Feedback Date": feedback.feedback_date.isoformat(),
-            })
-        df = pd.DataFrame(data)
-        buffer = BytesIO()
-        df.to_csv(buffer, index=False)
-        buffer.seek(0)
-        return buffer
-
-    def generate_caregiver_feedback_pdf(self, feedbacks: List[CaregiverFeedbackItem], title: str) -> BytesIO:
-        """Generate PDF file from caregiver feedback."""
-        buffer = BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
-        line_x1 = 50
-        line_x2 = width - 50
-
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(100, height - 50, title)
-
-        y = height - 80
-        c.setFont("Helvetica", 10)
-
-        for feedback in feedbacks:
-            if y < 200:
-                c.showPage()
-                y = height - 50
-                c.setFont("Helvetica", 10)
-
-            c.drawString(50, y, f"Caregiver: {feedback.caregiver_full_name or ''}")
-            c.drawString(50, y - 15, f"Patient: {feedback.patient_full_name or ''}")
-            c.drawString(50, y - 30, f"Session Date: {feedback.session_date}")
-            c.drawString(50, y - 45, f"Rating: {feedback.rating}")
-            c.drawString(50, y - 60, f"Comment: {feedback.comment or ''}")
-            c.drawString(50, y - 75, f"Feedback Date: {feedback.feedback_date}")
-            c.setLineWidth(0.5)
-            c.line(line_x1, y - 90, line_x2, y - 90)
-            y -= 110
+            if page.items:
+                yield page.items
+            cursor = page.next_cursor
+            if cursor is None:
+                return
 
-        c.save()
-        buffer.seek(0)
-        return buffer
+    @staticmethod
+    def generate_caregiver_feedback_pdf(feedbacks: List[CaregiverFeedbackItem], title: str) -> BytesIO:
+        """Generate PDF file from caregiver feedback."""
+        return _records_pdf(title, feedbacks, _caregiver_feedback_csv_row, CAREGIVER_FEEDBACK_PDF_LABELS, page_break_y=200)
 
     async def get_all_time_session_report(
         self,
@@ -581,82 +1168,10 @@ class ReportsService:
             last = sessions[limit - 1]
             next_cursor = self._build_cursor(last.created_at, last.id)
             sessions = sessions[:limit]
-        patients, caregivers = await self._load_cache_maps(sessions)
-        items = [
-            to_report_response(
-                session,
-                patients.get(session.patient_id),
-                caregivers.get(session.caregiver_id),
-            )
-            for session in sessions
-        ]
+        items = to_report_items(sessions)
         return items, next_cursor
 
-    def generate_csv(self, sessions: List[CareSessionReportItem]) -> BytesIO:
-        """Generate CSV file from session data"""
-        data = []
-        for session in sessions:
-            data.append({
-                'ID': str(session.id),
-                'Patient ID': str(session.patient_id),
-                'Patient Name': session.patient_full_name or '',
-                'Patient Email': session.patient_email or '',
-                'Careplan Type': session.careplan_type or '',
-                'Caregiver ID': str(session.caregiver_id),
-                'Caregiver Name': session.caregiver_full_name or '',
-                'Caregiver Email': session.caregiver_email or '',
-                'Check In Time': session.check_in_time.isoformat() if session.check_in_time else '',
-                'Check Out Time': session.check_out_time.isoformat() if session.check_out_time else '',
-                'Duration (Minutes)': session.duration_minutes if session.duration_minutes is not None else '',
-                'Status': session.status,
-                'Caregiver Notes': session.caregiver_notes or '',
-                'Created At': session.created_at.isoformat(),
-                'Updated At': session.updated_at.isoformat() if session.updated_at else '',
-            })
-        df = pd.DataFrame(data)
-        buffer = BytesIO()
-        df.to_csv(buffer, index=False)
-        buffer.seek(0)
-        return buffer
-
-    def generate_pdf(self, sessions: List[CareSessionReportItem], title: str) -> BytesIO:
+    @staticmethod
+    def generate_pdf(sessions: List[CareSessionReportItem], title: str) -> BytesIO:
         """Generate PDF file from session data"""
-        buffer = BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
-        line_x1 = 50
-        line_x2 = width - 50
-
-        # Title
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(100, height - 50, title)
-
-        y = height - 80
-        c.setFont("Helvetica", 10)
-
-        for session in sessions:
-            if y < 250:
-                c.showPage()
-                y = height - 50
-                c.setFont("Helvetica", 10)
-
-            c.drawString(50, y, f"ID: {session.id}")
-            c.drawString(50, y - 15, f"Patient ID: {session.patient_id}")
-            c.drawString(50, y - 30, f"Patient Name: {session.patient_full_name or ''}")
-            c.drawString(50, y - 45, f"Patient Email: {session.patient_email or ''}")
-            c.drawString(50, y - 60, f"Careplan Type: {session.careplan_type or ''}")
-            c.drawString(50, y - 75, f"Caregiver ID: {session.caregiver_id}")
-            c.drawString(50, y - 90, f"Caregiver Name: {session.caregiver_full_name or ''}")
-            c.drawString(50, y - 105, f"Caregiver Email: {session.caregiver_email or ''}")
-            c.drawString(50, y - 120, f"Check In: {session.check_in_time}")
-            c.drawString(50, y - 135, f"Check Out: {session.check_out_time}")
-            c.drawString(50, y - 150, f"Duration (Minutes): {session.duration_minutes if session.duration_minutes is not None else ''}")
-            c.drawString(50, y - 165, f"Status: {session.status}")
-            c.drawString(50, y - 180, f"Notes: {session.caregiver_notes or ''}")
-            c.setLineWidth(0.5)
-            c.line(line_x1, y - 195, line_x2, y - 195)
-            y -= 215
-
-        c.save()
-        buffer.seek(0)
-        return buffer
+        return _records_pdf(title, sessions, _session_csv_row, SESSION_PDF_LABELS, page_break_y=250)
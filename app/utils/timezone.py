@@ -1,9 +1,10 @@
 """Timezone utilities for converting UTC to European timezone"""
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
-# European timezone (handles CET/CEST automatically)
-EUROPE_TZ = pytz.timezone('Europe/Paris')
+# European timezone (handles CET/CEST automatically); the image ships tzdata
+EUROPE_TZ = ZoneInfo('Europe/Paris')
 
 
 def convert_to_cet(dt: datetime | None) -> datetime | None:
@@ -19,9 +20,16 @@ def convert_to_cet(dt: datetime | None) -> datetime | None:
     if dt is None:
         return None
     if dt.tzinfo is None:
-        # Assume it's UTC and convert to Europe/Paris
-        utc_dt = pytz.utc.localize(dt)
-        cet_dt = utc_dt.astimezone(EUROPE_TZ)
-        # Return as naive CET datetime
-        return cet_dt.replace(tzinfo=None)
+        return _naive_utc_to_cet(dt)
     return dt
+
+
+@lru_cache(maxsize=4096)
+def _naive_utc_to_cet(dt: datetime) -> datetime:
+    # Rows often repeat a timestamp (created_at == check_in_time, bulk inserts),
+    # so list responses hit the cache instead of converting again.
+    # Assume it's UTC and convert to Europe/Paris
+    utc_dt = dt.replace(tzinfo=timezone.utc)
+    cet_dt = utc_dt.astimezone(EUROPE_TZ)
+    # Return as naive CET datetime
+    return cet_dt.replace(tzinfo=None)
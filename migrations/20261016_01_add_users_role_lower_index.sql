@@ -0,0 +1,22 @@
+-- Expression index for caregiver lookups in all tenant schemas (org_%).
+-- Reports filter users with lower(role) = 'caregiver' AND deleted_at IS NULL;
+-- the index expression and predicate must match the query for Postgres to use it.
+
+DO $$
+DECLARE
+    tenant_schema TEXT;
+BEGIN
+    FOR tenant_schema IN
+        SELECT nspname
+        FROM pg_namespace
+        WHERE nspname LIKE 'org\_%' ESCAPE '\'
+    LOOP
+        EXECUTE format('SET search_path TO %I', tenant_schema);
+
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS users_role_lower_idx
+                ON users (lower(role))
+                WHERE deleted_at IS NULL
+        ';
+    END LOOP;
+END $$;
@@ -0,0 +1,22 @@
+-- Keyset index for patient session history in all tenant schemas (org_%).
+-- Supports ORDER BY check_in_time DESC, id DESC with the
+-- (check_in_time, id) < (:cursor_time, :cursor_id) seek predicate.
+
+DO $$
+DECLARE
+    tenant_schema TEXT;
+BEGIN
+    FOR tenant_schema IN
+        SELECT nspname
+        FROM pg_namespace
+        WHERE nspname LIKE 'org\_%' ESCAPE '\'
+    LOOP
+        EXECUTE format('SET search_path TO %I', tenant_schema);
+
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS care_sessions_patient_active_idx
+                ON care_sessions (patient_id, check_in_time DESC, id DESC)
+                WHERE deleted_at IS NULL
+        ';
+    END LOOP;
+END $$;
@@ -0,0 +1,22 @@
+-- Keyset index for feedback reports in all tenant schemas (org_%).
+-- Matches ORDER BY created_at DESC, id DESC so the row-value seek
+-- (f.created_at, f.id) < (:cursor_time, :cursor_id) becomes an Index Cond.
+
+DO $$
+DECLARE
+    tenant_schema TEXT;
+BEGIN
+    FOR tenant_schema IN
+        SELECT nspname
+        FROM pg_namespace
+        WHERE nspname LIKE 'org\_%' ESCAPE '\'
+    LOOP
+        EXECUTE format('SET search_path TO %I', tenant_schema);
+
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS feedback_created_id_idx
+                ON feedback (created_at DESC, id DESC)
+                WHERE deleted_at IS NULL
+        ';
+    END LOOP;
+END $$;
@@ -0,0 +1,55 @@
+-- Partial indexes on the sort/filter keys of report queries in all tenant
+-- schemas (org_%). Every report query filters deleted_at IS NULL, so the
+-- predicates below keep soft-deleted rows out of the index entirely.
+-- Already covered by earlier migrations:
+--   care_sessions_patient_active_idx (patient session history)
+--   feedback_created_id_idx          (feedback list keyset)
+--   users_role_lower_idx             (caregiver role filter)
+
+DO $$
+DECLARE
+    tenant_schema TEXT;
+BEGIN
+    FOR tenant_schema IN
+        SELECT nspname
+        FROM pg_namespace
+        WHERE nspname LIKE 'org\_%' ESCAPE '\'
+    LOOP
+        EXECUTE format('SET search_path TO %I', tenant_schema);
+
+        -- Period session report: check_in_time range, keyset on (check_in_time, id)
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS care_sessions_active_checkin_id_idx
+                ON care_sessions (check_in_time DESC, id DESC)
+                WHERE deleted_at IS NULL
+        ';
+
+        -- All-time session report: keyset on (created_at, id)
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS care_sessions_active_created_id_idx
+                ON care_sessions (created_at DESC, id DESC)
+                WHERE deleted_at IS NULL
+        ';
+
+        -- Caregiver performance and caregiver feedback joins
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS care_sessions_caregiver_active_idx
+                ON care_sessions (caregiver_id, check_in_time)
+                WHERE deleted_at IS NULL
+        ';
+
+        -- Caregiver selector, keyset on (last_name, first_name, id)
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS users_caregiver_name_id_idx
+                ON users (last_name, first_name, id)
+                WHERE lower(role) = ''caregiver'' AND deleted_at IS NULL
+        ';
+
+        -- Patient selector, keyset on (last_name, first_name, id)
+        EXECUTE '
+            CREATE INDEX IF NOT EXISTS patients_active_name_id_idx
+                ON patients (last_name, first_name, id)
+                WHERE deleted_at IS NULL
+        ';
+    END LOOP;
+END $$;
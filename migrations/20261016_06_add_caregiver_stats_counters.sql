@@ -0,0 +1,120 @@
+-- Trigger-maintained caregiver counters in all tenant schemas (org_%).
+-- caregiver_stats holds per caregiver per day: session count, completed count,
+-- and duration sum/count. Triggers on care_sessions keep it current, so
+-- get_caregiver_performance sums a few bucket rows instead of scanning
+-- sessions, without the lag of a periodically refreshed rollup.
+-- Soft-deleted sessions do not count; an UPDATE removes the old row's
+-- contribution and adds the new one.
+--
+-- Provisioning: this only covers org_% schemas that exist when it runs. A
+-- tenant schema created later must get the caregiver_stats table and its triggers
+-- from the same DDL, or its day-aligned get_caregiver_performance ranges fail
+-- (missing table) or read zeros (missing triggers). Open-ended ranges always
+-- use the live tables.
+
+DO $$
+DECLARE
+    tenant_schema TEXT;
+BEGIN
+    FOR tenant_schema IN
+        SELECT nspname
+        FROM pg_namespace
+        WHERE nspname LIKE 'org\_%' ESCAPE '\'
+    LOOP
+        EXECUTE format('SET search_path TO %I', tenant_schema);
+
+        EXECUTE '
+            CREATE TABLE IF NOT EXISTS caregiver_stats (
+                caregiver_id UUID NOT NULL,
+                date_bucket TIMESTAMP NOT NULL,
+                total_sessions INTEGER NOT NULL DEFAULT 0,
+                completed_sessions INTEGER NOT NULL DEFAULT 0,
+                total_duration_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+                duration_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (caregiver_id, date_bucket)
+            )
+        ';
+
+        EXECUTE format($fn$
+            CREATE OR REPLACE FUNCTION %I.caregiver_stats_bump(session care_sessions, sign INTEGER)
+            RETURNS void
+            LANGUAGE plpgsql
+            SET search_path = %I
+            AS $body$
+            BEGIN
+                IF session.deleted_at IS NOT NULL THEN
+                    RETURN;
+                END IF;
+                INSERT INTO caregiver_stats AS s (
+                    caregiver_id, date_bucket, total_sessions, completed_sessions,
+                    total_duration_seconds, duration_count
+                )
+                VALUES (
+                    session.caregiver_id,
+                    date_trunc('day', session.check_in_time),
+                    sign,
+                    sign * (CASE WHEN session.status = 'completed' THEN 1 ELSE 0 END),
+                    sign * COALESCE(EXTRACT(EPOCH FROM session.check_out_time - session.check_in_time), 0),
+                    sign * (CASE WHEN session.check_out_time IS NOT NULL THEN 1 ELSE 0 END)
+                )
+                ON CONFLICT (caregiver_id, date_bucket) DO UPDATE SET
+                    total_sessions = s.total_sessions + EXCLUDED.total_sessions,
+                    completed_sessions = s.completed_sessions + EXCLUDED.completed_sessions,
+                    total_duration_seconds = s.total_duration_seconds + EXCLUDED.total_duration_seconds,
+                    duration_count = s.duration_count + EXCLUDED.duration_count;
+            END;
+            $body$
+        $fn$, tenant_schema, tenant_schema);
+
+        EXECUTE format($fn$
+            CREATE OR REPLACE FUNCTION %I.caregiver_stats_sync()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            SET search_path = %I
+            AS $body$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    PERFORM caregiver_stats_bump(OLD, -1);
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    PERFORM caregiver_stats_bump(NEW, 1);
+                END IF;
+                RETURN NULL;
+            END;
+            $body$
+        $fn$, tenant_schema, tenant_schema);
+
+        EXECUTE 'DROP TRIGGER IF EXISTS caregiver_stats_sync_insert_delete ON care_sessions';
+        EXECUTE '
+            CREATE TRIGGER caregiver_stats_sync_insert_delete
+                AFTER INSERT OR DELETE ON care_sessions
+                FOR EACH ROW EXECUTE FUNCTION caregiver_stats_sync()
+        ';
+        EXECUTE 'DROP TRIGGER IF EXISTS caregiver_stats_sync_update ON care_sessions';
+        EXECUTE '
+            CREATE TRIGGER caregiver_stats_sync_update
+                AFTER UPDATE OF caregiver_id, check_in_time, check_out_time, status, deleted_at
+                ON care_sessions
+                FOR EACH ROW EXECUTE FUNCTION caregiver_stats_sync()
+        ';
+
+        -- Backfill from existing sessions.
+        EXECUTE 'TRUNCATE caregiver_stats';
+        EXECUTE '
+            INSERT INTO caregiver_stats (
+                caregiver_id, date_bucket, total_sessions, completed_sessions,
+                total_duration_seconds, duration_count
+            )
+            SELECT
+                caregiver_id,
+                date_trunc(''day'', check_in_time),
+                COUNT(*),
+                SUM(CASE WHEN status = ''completed'' THEN 1 ELSE 0 END),
+                COALESCE(SUM(EXTRACT(EPOCH FROM check_out_time - check_in_time)), 0),
+                COUNT(check_out_time)
+            FROM care_sessions
+            WHERE deleted_at IS NULL
+            GROUP BY caregiver_id, date_trunc(''day'', check_in_time)
+        ';
+    END LOOP;
+END $$;
@@ -0,0 +1,104 @@
+-- Trigger-maintained feedback counters in all tenant schemas (org_%).
+-- feedback_stats holds per day: feedback count, rating sum and positive count.
+-- get_feedback_summary sums these buckets for day-aligned ranges instead of
+-- scanning feedback. Soft-deleted feedback does not count; an UPDATE removes
+-- the old row's contribution and adds the new one.
+--
+-- Provisioning: this only covers org_% schemas that exist when it runs. A
+-- tenant schema created later must get the feedback_stats table and its triggers
+-- from the same DDL, or its day-aligned get_feedback_summary ranges fail
+-- (missing table) or read zeros (missing triggers). Open-ended ranges always
+-- use the live tables.
+
+DO $$
+DECLARE
+    tenant_schema TEXT;
+BEGIN
+    FOR tenant_schema IN
+        SELECT nspname
+        FROM pg_namespace
+        WHERE nspname LIKE 'org\_%' ESCAPE '\'
+    LOOP
+        EXECUTE format('SET search_path TO %I', tenant_schema);
+
+        EXECUTE '
+            CREATE TABLE IF NOT EXISTS feedback_stats (
+                date_bucket TIMESTAMP PRIMARY KEY,
+                total_feedback INTEGER NOT NULL DEFAULT 0,
+                rating_sum BIGINT NOT NULL DEFAULT 0,
+                positive_feedback INTEGER NOT NULL DEFAULT 0
+            )
+        ';
+
+        EXECUTE format($fn$
+            CREATE OR REPLACE FUNCTION %I.feedback_stats_bump(item feedback, sign INTEGER)
+            RETURNS void
+            LANGUAGE plpgsql
+            SET search_path = %I
+            AS $body$
+            BEGIN
+                IF item.deleted_at IS NOT NULL THEN
+                    RETURN;
+                END IF;
+                INSERT INTO feedback_stats AS s (date_bucket, total_feedback, rating_sum, positive_feedback)
+                VALUES (
+                    date_trunc('day', item.created_at),
+                    sign,
+                    sign * item.rating,
+                    sign * (CASE WHEN item.rating >= 4 THEN 1 ELSE 0 END)
+                )
+                ON CONFLICT (date_bucket) DO UPDATE SET
+                    total_feedback = s.total_feedback + EXCLUDED.total_feedback,
+                    rating_sum = s.rating_sum + EXCLUDED.rating_sum,
+                    positive_feedback = s.positive_feedback + EXCLUDED.positive_feedback;
+            END;
+            $body$
+        $fn$, tenant_schema, tenant_schema);
+
+        EXECUTE format($fn$
+            CREATE OR REPLACE FUNCTION %I.feedback_stats_sync()
+            RETURNS trigger
+            LANGUAGE plpgsql
+            SET search_path = %I
+            AS $body$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    PERFORM feedback_stats_bump(OLD, -1);
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    PERFORM feedback_stats_bump(NEW, 1);
+                END IF;
+                RETURN NULL;
+            END;
+            $body$
+        $fn$, tenant_schema, tenant_schema);
+
+        EXECUTE 'DROP TRIGGER IF EXISTS feedback_stats_sync_insert_delete ON feedback';
+        EXECUTE '
+            CREATE TRIGGER feedback_stats_sync_insert_delete
+                AFTER INSERT OR DELETE ON feedback
+                FOR EACH ROW EXECUTE FUNCTION feedback_stats_sync()
+        ';
+        EXECUTE 'DROP TRIGGER IF EXISTS feedback_stats_sync_update ON feedback';
+        EXECUTE '
+            CREATE TRIGGER feedback_stats_sync_update
+                AFTER UPDATE OF rating, created_at, deleted_at
+                ON feedback
+                FOR EACH ROW EXECUTE FUNCTION feedback_stats_sync()
+        ';
+
+        -- Backfill from existing feedback.
+        EXECUTE 'TRUNCATE feedback_stats';
+        EXECUTE '
+            INSERT INTO feedback_stats (date_bucket, total_feedback, rating_sum, positive_feedback)
+            SELECT
+                date_trunc(''day'', created_at),
+                COUNT(*),
+                SUM(rating),
+                SUM(CASE WHEN rating >= 4 THEN 1 ELSE 0 END)
+            FROM feedback
+            WHERE deleted_at IS NULL
+            GROUP BY date_trunc(''day'', created_at)
+        ';
+    END LOOP;
+END $$;
@@ -4,27 +4,27 @@ from uuid import uuid4
 
 
 @pytest.mark.asyncio
-async def test_create_care_session_unauthorized(client: AsyncClient):
-    """Test creating a care session without authentication."""
-    response = await client.post(
-        "/care-sessions/create",
-        json={"tag_id": "test-tag-123"}
-    )
+@pytest.mark.parametrize(
+    "method,url,body",
+    [
+        ("POST", "/care-sessions/create", {"tag_id": "test-tag-123"}),
+        ("GET", "/care-sessions/", None),
+        ("PUT", f"/care-sessions/{uuid4()}/complete", {"caregiver_notes": "Test notes"}),
+    ],
+    ids=["create", "list", "complete"],
+)
+async def test_care_sessions_unauthorized(app_client: AsyncClient, method: str, url: str, body):
+    """Test that care session endpoints reject requests without authentication."""
+    response = await app_client.request(method, url, json=body)
     assert response.status_code in [401, 403]
 
 
 @pytest.mark.asyncio
 async def test_create_care_session_success(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test care session creation endpoint - expects 404 for non-existent tag."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    response = await client.post(
+    response = await authed_client.post(
         "/care-sessions/create",
         json={"tag_id": "test-tag-123"},
         headers={"Authorization": "Bearer mock_token"}
@@ -32,29 +32,14 @@ async def test_create_care_session_success(
     
     assert response.status_code == 404
     assert "detail" in response.json()
-    
-    app.dependency_overrides.clear()
-
-
-@pytest.mark.asyncio
-async def test_list_care_sessions_unauthorized(client: AsyncClient):
-    """Test listing care sessions without authentication."""
-    response = await client.get("/care-sessions/")
-    assert response.status_code in [401, 403]
 
 
 @pytest.mark.asyncio
 async def test_list_care_sessions_structure(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test care session list response structure."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    response = await client.get(
+    response = await authed_client.get(
         "/care-sessions/",
         headers={"Authorization": "Bearer mock_token"}
     )
@@ -67,22 +52,14 @@ async def test_list_care_sessions_structure(
         assert "page_size" in data
         assert "total_pages" in data
         assert isinstance(data["sessions"], list)
-    
-    app.dependency_overrides.clear()
 
 
 @pytest.mark.asyncio
 async def test_list_care_sessions_pagination(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test care session pagination parameters."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    response = await client.get(
+    response = await authed_client.get(
         "/care-sessions/?page=1&page_size=10",
         headers={"Authorization": "Bearer mock_token"}
     )
@@ -91,24 +68,11 @@ async def test_list_care_sessions_pagination(
         data = response.json()
         assert data["page"] == 1
         assert data["page_size"] == 10
-    
-    app.dependency_overrides.clear()
 
 
 @pytest.mark.asyncio
-async def test_get_care_session_not_found(client: AsyncClient):
+async def test_get_care_session_not_found(app_client: AsyncClient):
     """Test getting a non-existent care session."""
     session_id = uuid4()
-    response = await client.get(f"/care-sessions/{session_id}")
+    response = await app_client.get(f"/care-sessions/{session_id}")
     assert response.status_code in [401, 403, 404]
-
-
-@pytest.mark.asyncio
-async def test_complete_care_session_unauthorized(client: AsyncClient):
-    """Test completing a care session without authentication."""
-    session_id = uuid4()
-    response = await client.put(
-        f"/care-sessions/{session_id}/complete",
-        json={"caregiver_notes": "Test notes"}
-    )
-    assert response.status_code in [401, 403]
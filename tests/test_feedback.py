@@ -4,105 +4,64 @@ from uuid import uuid4
 
 
 @pytest.mark.asyncio
-async def test_create_feedback_unauthorized(client: AsyncClient):
-    """Test creating feedback without authentication."""
-    session_id = uuid4()
-    response = await client.post(
-        "/feedback/",
-        json={
-            "session_id": str(session_id),
-            "rating": 3,
-            "patient_feedback": "Great service"
-        }
-    )
+@pytest.mark.parametrize(
+    "method,url,body",
+    [
+        ("POST", "/feedback/", {"session_id": str(uuid4()), "rating": 3, "patient_feedback": "Great service"}),
+        ("GET", "/feedback/", None),
+    ],
+    ids=["create", "list"],
+)
+async def test_feedback_unauthorized(app_client: AsyncClient, method: str, url: str, body):
+    """Test that feedback endpoints reject requests without authentication."""
+    response = await app_client.request(method, url, json=body)
     assert response.status_code in [401, 403]
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("rating", [5, 0])
 async def test_create_feedback_validation(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
+    rating: int,
 ):
     """Test feedback validation - rating must be 1-3."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    session_id = uuid4()
-    
-    response = await client.post(
-        "/feedback/",
-        json={
-            "session_id": str(session_id),
-            "rating": 5,
-            "patient_feedback": "Test"
-        },
-        headers={"Authorization": "Bearer mock_token"}
-    )
-    assert response.status_code == 422  
-    
-    response = await client.post(
+    response = await authed_client.post(
         "/feedback/",
         json={
-            "session_id": str(session_id),
-            "rating": 0,
+            "session_id": str(uuid4()),
+            "rating": rating,
             "patient_feedback": "Test"
         },
         headers={"Authorization": "Bearer mock_token"}
     )
     assert response.status_code == 422
-    
-    app.dependency_overrides.clear()
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("rating", [1, 2, 3])
 async def test_create_feedback_valid_ratings(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
+    rating: int,
 ):
     """Test that ratings 1-3 are accepted."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    session_id = uuid4()
-    
-    for rating in [1, 2, 3]:
-        response = await client.post(
-            "/feedback/",
-            json={
-                "session_id": str(session_id),
-                "rating": rating,
-                "patient_feedback": f"Test feedback for rating {rating}"
-            },
-            headers={"Authorization": "Bearer mock_token"}
-        )
-        assert response.status_code in [201, 404, 422, 500]
-    
-    app.dependency_overrides.clear()
-
-
-@pytest.mark.asyncio
-async def test_list_feedback_unauthorized(client: AsyncClient):
-    """Test listing feedback without authentication."""
-    response = await client.get("/feedback/")
-    assert response.status_code in [401, 403]
+    response = await authed_client.post(
+        "/feedback/",
+        json={
+            "session_id": str(uuid4()),
+            "rating": rating,
+            "patient_feedback": f"Test feedback for rating {rating}"
+        },
+        headers={"Authorization": "Bearer mock_token"}
+    )
+    assert response.status_code in [201, 404, 422, 500]
 
 
 @pytest.mark.asyncio
 async def test_list_feedback_structure(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test feedback list response structure."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    response = await client.get(
+    response = await authed_client.get(
         "/feedback/",
         headers={"Authorization": "Bearer mock_token"}
     )
@@ -113,24 +72,16 @@ async def test_list_feedback_structure(
         assert "count" in data
         assert isinstance(data["feedbacks"], list)
         assert isinstance(data["count"], int)
-    
-    app.dependency_overrides.clear()
 
 
 @pytest.mark.asyncio
 async def test_get_patient_average_rating(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test patient average rating endpoint."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
     patient_id = uuid4()
     
-    response = await client.get(
+    response = await authed_client.get(
         f"/feedback/analytics/patient/{patient_id}/average",
         headers={"Authorization": "Bearer mock_token"}
     )
@@ -141,22 +92,14 @@ async def test_get_patient_average_rating(
         assert "average_rating" in data
         assert "satisfaction_index" in data
         assert "total_feedbacks" in data
-    
-    app.dependency_overrides.clear()
 
 
 @pytest.mark.asyncio
 async def test_get_top_caregivers_weekly(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test top caregivers of the week endpoint."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    response = await client.get(
+    response = await authed_client.get(
         "/feedback/analytics/top-caregivers/weekly",
         headers={"Authorization": "Bearer mock_token"}
     )
@@ -167,22 +110,14 @@ async def test_get_top_caregivers_weekly(
         assert isinstance(data["caregivers"], list)
         # Should return max 3 caregivers
         assert len(data["caregivers"]) <= 3
-    
-    app.dependency_overrides.clear()
 
 
 @pytest.mark.asyncio
 async def test_daily_average_ratings(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test daily average ratings endpoint."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    response = await client.get(
+    response = await authed_client.get(
         "/feedback/analytics/daily?days=7",
         headers={"Authorization": "Bearer mock_token"}
     )
@@ -192,5 +127,3 @@ async def test_daily_average_ratings(
         assert "daily_averages" in data
         assert "count" in data
         assert isinstance(data["daily_averages"], list)
-    
-    app.dependency_overrides.clear()
@@ -1,19 +1,62 @@
 import pytest
 from httpx import AsyncClient
 
+from app.auth.middleware import verify_token
+from app.auth.models import JWTPayload
+from app.main import app
+
+
+def _payload(permissions):
+    return JWTPayload(
+        sub="123e4567-e89b-12d3-a456-426614174000",
+        org_id="org-alpha",
+        tenant_schema="org_alpha",
+        permissions=permissions,
+    )
+
 
 @pytest.mark.asyncio
-async def test_health_check(client: AsyncClient):
+async def test_health_check(app_client: AsyncClient):
     """Test the health check endpoint."""
-    response = await client.get("/health")
+    response = await app_client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
+    assert response.json() == {"status": "ok", "service": "care-session-service"}
 
 
 @pytest.mark.asyncio
-async def test_health_check_response_structure(client: AsyncClient):
+async def test_health_check_response_structure(app_client: AsyncClient):
     """Test that health check returns proper JSON structure."""
-    response = await client.get("/health")
+    response = await app_client.get("/health")
     data = response.json()
     assert "status" in data
     assert isinstance(data["status"], str)
+
+
+@pytest.mark.asyncio
+async def test_pool_health_requires_authentication(app_client: AsyncClient):
+    """Test that pool counters are not exposed to anonymous callers."""
+    response = await app_client.get("/health/pool")
+    assert response.status_code in [401, 403]
+
+
+@pytest.mark.asyncio
+async def test_pool_health_requires_admin_permission(app_client: AsyncClient):
+    """Test that callers without care-session:admin are denied the pool counters."""
+    app.dependency_overrides[verify_token] = lambda: _payload(["care-session:read"])
+    try:
+        response = await app_client.get("/health/pool")
+    finally:
+        app.dependency_overrides.pop(verify_token, None)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_pool_health_for_admin(app_client: AsyncClient):
+    """Test that an admin sees the pool counters."""
+    app.dependency_overrides[verify_token] = lambda: _payload(["care-session:admin"])
+    try:
+        response = await app_client.get("/health/pool")
+    finally:
+        app.dependency_overrides.pop(verify_token, None)
+    assert response.status_code == 200
+    assert set(response.json()["pool"]) == {"size", "checked_in", "checked_out", "overflow"}
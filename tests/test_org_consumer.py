@@ -0,0 +1,207 @@
+"""
+Tests for batching in the organization event consumer
+"""
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.reports import consumer as consumer_module
+from app.reports.consumer import OrganizationEventConsumer
+
+SCHEMA = "org_test"
+
+
+class FakeChannel:
+    def __init__(self):
+        self.acks = []
+        self.nacks = []
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self.acks.append((delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag, requeue=True):
+        self.nacks.append((delivery_tag, requeue))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.timers = []
+        self.removed = []
+
+    def call_later(self, delay, callback):
+        timer = SimpleNamespace(delay=delay, callback=callback)
+        self.timers.append(timer)
+        return timer
+
+    def remove_timeout(self, timer):
+        self.removed.append(timer)
+
+
+@pytest.fixture
+def consumer():
+    consumer = OrganizationEventConsumer()
+    consumer.batch_size = 3
+    consumer.flush_interval = 0.5
+    consumer.channel = FakeChannel()
+    consumer.connection = FakeConnection()
+    consumer.batches = []
+    consumer.singles = []
+
+    async def process_batch(events):
+        consumer.batches.append(events)
+
+    async def process_event(event_type, event_data):
+        consumer.singles.append((event_type, event_data))
+
+    consumer._process_batch = process_batch
+    consumer._process_event = process_event
+    return consumer
+
+
+def _deliver(consumer, delivery_tag, event_type="patient.created", data=None):
+    body = json.dumps({"data": data or {"patient_id": str(uuid4())}})
+    method = SimpleNamespace(delivery_tag=delivery_tag, routing_key=event_type)
+    consumer.callback(consumer.channel, method, None, body)
+
+
+def test_full_batch_is_committed_once_and_acked_with_multiple(consumer):
+    """Test that reaching batch_size flushes one batch and acks every message with one multiple ack."""
+    for tag in (1, 2, 3):
+        _deliver(consumer, tag)
+
+    assert len(consumer.batches) == 1
+    assert len(consumer.batches[0]) == 3
+    assert consumer.channel.acks == [(3, True)]
+    assert consumer.channel.nacks == []
+    assert consumer._pending == []
+
+
+def test_partial_batch_is_flushed_by_the_timer(consumer):
+    """Test that a partial batch schedules one flush timer and is acked when it fires."""
+    _deliver(consumer, 1)
+    _deliver(consumer, 2)
+
+    assert consumer.batches == []
+    assert len(consumer.connection.timers) == 1
+    assert consumer.connection.timers[0].delay == 0.5
+
+    consumer.connection.timers[0].callback()
+
+    assert len(consumer.batches) == 1
+    assert consumer.channel.acks == [(2, True)]
+    assert consumer._flush_timer is None
+
+
+def test_full_batch_cancels_the_pending_timer(consumer):
+    """Test that a size-triggered flush removes the timer scheduled for the partial batch."""
+    for tag in (1, 2, 3):
+        _deliver(consumer, tag)
+
+    assert consumer.connection.removed == consumer.connection.timers
+    assert consumer._flush_timer is None
+
+
+def test_failed_batch_is_retried_one_by_one(consumer):
+    """Test that a failed batch falls back to per-event commits, acking successes and requeueing failures."""
+    async def failing_batch(events):
+        raise RuntimeError("batch failed")
+
+    async def process_event(event_type, event_data):
+        if event_data.get("fail"):
+            raise RuntimeError("event failed")
+        consumer.singles.append((event_type, event_data))
+
+    consumer._process_batch = failing_batch
+    consumer._process_event = process_event
+
+    _deliver(consumer, 1)
+    _deliver(consumer, 2, data={"fail": True})
+    _deliver(consumer, 3)
+
+    assert len(consumer.singles) == 2
+    assert consumer.channel.acks == [(1, False), (3, False)]
+    assert consumer.channel.nacks == [(2, True)]
+
+
+def test_malformed_message_is_nacked_without_buffering(consumer):
+    """Test that an undecodable body is requeued immediately and not added to the batch."""
+    method = SimpleNamespace(delivery_tag=7, routing_key="patient.created")
+
+    consumer.callback(consumer.channel, method, None, b"not json")
+
+    assert consumer.channel.nacks == [(7, True)]
+    assert consumer._pending == []
+    assert consumer.connection.timers == []
+
+
+def test_flush_without_pending_messages_is_a_no_op(consumer):
+    """Test that flushing an empty buffer neither processes nor acks anything."""
+    consumer._flush()
+
+    assert consumer.batches == []
+    assert consumer.channel.acks == []
+
+
+class FakeSession:
+    def __init__(self):
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        self.committed = True
+
+
+class RecordingRepository:
+    calls = []
+
+    def __init__(self, session, schema):
+        self.schema = schema
+
+    async def upsert_patients_cache(self, payloads):
+        self.calls.append(("upsert_patients", self.schema, [payload["id"] for payload in payloads]))
+
+    async def upsert_users_cache(self, payloads):
+        self.calls.append(("upsert_users", self.schema, [payload["id"] for payload in payloads]))
+
+    async def mark_patient_deleted(self, patient_id, deleted_at):
+        self.calls.append(("delete_patient", self.schema, patient_id))
+        return True
+
+
+async def test_process_batch_groups_creates_and_keeps_event_order(monkeypatch):
+    """Test that creates are upserted together and flushed before a later event in the same batch."""
+    session = FakeSession()
+    RecordingRepository.calls = []
+    monkeypatch.setattr(consumer_module, "AsyncSessionLocal", lambda: session)
+    monkeypatch.setattr(consumer_module, "ReportsRepository", RecordingRepository)
+    consumer = OrganizationEventConsumer()
+    invalidated = []
+
+    async def invalidate_cache(events):
+        invalidated.append(events)
+
+    consumer._invalidate_cache = invalidate_cache
+    first, second, third = uuid4(), uuid4(), uuid4()
+    events = [
+        ("patient.created", {"schema_name": SCHEMA, "patient_id": str(first)}),
+        ("patient.created", {"schema_name": SCHEMA, "patient_id": str(second)}),
+        ("patient.deleted", {"schema_name": SCHEMA, "patient_id": str(first)}),
+        ("patient.created", {"schema_name": SCHEMA, "patient_id": str(third)}),
+    ]
+
+    await consumer._process_batch(events)
+
+    assert RecordingRepository.calls == [
+        ("upsert_patients", SCHEMA, [first, second]),
+        ("delete_patient", SCHEMA, first),
+        ("upsert_patients", SCHEMA, [third]),
+    ]
+    assert session.committed
+    assert invalidated == [events]
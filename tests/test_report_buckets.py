@@ -0,0 +1,36 @@
+"""
+Tests for choosing between the stats day buckets and the live report tables
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.reports.repository import _day_bucket_range
+
+TICK = timedelta(microseconds=1)
+START = datetime(2026, 3, 1)
+END = datetime(2026, 4, 1) - TICK
+
+
+def test_day_aligned_range_uses_buckets():
+    """Test that a midnight-to-end-of-day range maps to a half-open day range."""
+    assert _day_bucket_range(START, END) == (START, datetime(2026, 4, 1))
+
+
+@pytest.mark.parametrize("start, end", [(None, None), (START, None), (None, END)])
+def test_open_ended_range_stays_on_live_tables(start, end):
+    """Test that open-ended ranges never depend on the provisioned stats tables."""
+    assert _day_bucket_range(start, end) is None
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (START + timedelta(hours=1), END),
+        (START, END - timedelta(hours=1)),
+        (START.replace(tzinfo=timezone.utc), END.replace(tzinfo=timezone.utc)),
+    ],
+)
+def test_unaligned_range_stays_on_live_tables(start, end):
+    """Test that ranges not covered exactly by whole days fall back to the live tables."""
+    assert _day_bucket_range(start, end) is None
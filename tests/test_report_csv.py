@@ -0,0 +1,91 @@
+"""
+Tests for streamed CSV report encoding
+"""
+import csv
+from io import StringIO
+from uuid import uuid4
+
+from app.reports.schemas import CaregiverPerformanceItem
+from app.reports.service import (
+    CAREGIVER_CSV_HEADER,
+    CAREGIVER_FEEDBACK_CSV_HEADER,
+    CAREGIVER_FEEDBACK_PDF_LABELS,
+    CAREGIVER_PDF_LABELS,
+    FEEDBACK_CSV_HEADER,
+    FEEDBACK_PDF_LABELS,
+    PATIENT_SESSIONS_CSV_HEADER,
+    PATIENT_SESSIONS_PDF_LABELS,
+    SESSION_CSV_HEADER,
+    SESSION_PDF_LABELS,
+    _caregiver_csv_row,
+    _csv_stream,
+    single_batch,
+)
+
+
+async def _read_csv(stream) -> list:
+    body = b"".join([chunk async for chunk in stream]).decode("utf-8")
+    return list(csv.reader(StringIO(body)))
+
+
+async def test_csv_stream_writes_header_for_empty_report():
+    """Test that an empty export still carries the header row."""
+    rows = await _read_csv(_csv_stream(CAREGIVER_CSV_HEADER, single_batch([]), _caregiver_csv_row))
+    assert rows == [list(CAREGIVER_CSV_HEADER)]
+
+
+async def test_csv_stream_quotes_fields_and_blanks_missing_values():
+    """Test that commas and quotes survive the round trip and None becomes empty."""
+    caregiver_id = uuid4()
+    item = CaregiverPerformanceItem(
+        caregiver_id=caregiver_id,
+        caregiver_full_name='Doe, Jane "JD"',
+        total_sessions=3,
+        completed_sessions=2,
+        status="ACTIVE",
+    )
+
+    async def batches():
+        yield [item]
+        yield [item]
+
+    rows = await _read_csv(_csv_stream(CAREGIVER_CSV_HEADER, batches(), _caregiver_csv_row))
+    assert len(rows) == 3
+    assert rows[1] == [str(caregiver_id), 'Doe, Jane "JD"', "", "3", "2", "", "", "ACTIVE"]
+    assert rows[2] == rows[1]
+
+
+async def test_csv_stream_plain_batch_matches_csv_writer():
+    """Test that a batch needing no quoting is encoded exactly as csv.writer would."""
+    items = [
+        CaregiverPerformanceItem(
+            caregiver_id=uuid4(),
+            caregiver_full_name="Jane Doe",
+            total_sessions=3,
+            completed_sessions=2,
+            avg_rating=4.5,
+            status="ACTIVE",
+        )
+        for _ in range(3)
+    ]
+
+    body = b"".join([chunk async for chunk in _csv_stream(CAREGIVER_CSV_HEADER, single_batch(items), _caregiver_csv_row)])
+
+    expected = StringIO()
+    writer = csv.writer(expected, lineterminator="\n")
+    writer.writerow(CAREGIVER_CSV_HEADER)
+    writer.writerows(_caregiver_csv_row(item) for item in items)
+    assert body.decode("utf-8") == expected.getvalue()
+
+
+def test_pdf_labels_line_up_with_csv_columns():
+    """Test that every PDF label tuple covers its CSV row column for column."""
+    pairs = [
+        (SESSION_PDF_LABELS, SESSION_CSV_HEADER),
+        (CAREGIVER_PDF_LABELS, CAREGIVER_CSV_HEADER),
+        (PATIENT_SESSIONS_PDF_LABELS, PATIENT_SESSIONS_CSV_HEADER),
+        (FEEDBACK_PDF_LABELS, FEEDBACK_CSV_HEADER),
+        (CAREGIVER_FEEDBACK_PDF_LABELS, CAREGIVER_FEEDBACK_CSV_HEADER),
+    ]
+    for labels, header in pairs:
+        assert len(labels) == len(header)
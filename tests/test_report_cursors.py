@@ -0,0 +1,121 @@
+"""
+Tests for report pagination cursors
+"""
+import json
+import struct
+from base64 import urlsafe_b64encode
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.reports.service import ReportsService
+
+
+def _encode(value) -> str:
+    return urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("ascii")
+
+
+def test_name_cursor_round_trip():
+    """Test that a name cursor decodes to the key it was built from."""
+    service = ReportsService(repository=None)
+    cursor_id = uuid4()
+
+    cursor = service._build_name_cursor("Doe", "Jane", cursor_id)
+
+    assert service._parse_name_cursor(cursor) == ("Doe", "Jane", cursor_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        _encode([1, 2, 3]),
+        _encode(["Doe", "Jane", 42]),
+        _encode(["Doe", "Jane"]),
+        _encode({"last": "Doe"}),
+        _encode(["Doe", "Jane", "not-a-uuid"]),
+        "not base64!",
+    ],
+)
+def test_name_cursor_rejects_malformed_input(cursor):
+    """Test that malformed name cursors raise ValueError, which the router turns into a 400."""
+    service = ReportsService(repository=None)
+    with pytest.raises(ValueError):
+        service._parse_name_cursor(cursor)
+
+
+def test_keyset_cursor_round_trip():
+    """Test that a keyset cursor decodes to the exact timestamp and id it was built from."""
+    service = ReportsService(repository=None)
+    cursor_time = datetime(2026, 3, 14, 15, 9, 26, 535897)
+    cursor_id = uuid4()
+
+    cursor = service._build_cursor(cursor_time, cursor_id)
+
+    assert service._parse_cursor(cursor) == (cursor_time, cursor_id)
+
+
+def test_keyset_cursor_round_trip_before_epoch():
+    """Test that timestamps before 1970 survive the signed microsecond encoding."""
+    service = ReportsService(repository=None)
+    cursor_time = datetime(1969, 12, 31, 23, 59, 59, 999999)
+    cursor_id = uuid4()
+
+    assert service._parse_cursor(service._build_cursor(cursor_time, cursor_id)) == (cursor_time, cursor_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not base64!",
+        "é",
+        urlsafe_b64encode(b"short").decode("ascii"),
+        urlsafe_b64encode(b"x" * 25).decode("ascii"),
+        urlsafe_b64encode(struct.pack(">q16s", 2**63 - 1, bytes(16))).decode("ascii"),
+    ],
+)
+def test_keyset_cursor_rejects_malformed_input(cursor):
+    """Test that malformed keyset cursors raise ValueError, which the router turns into a 400."""
+    service = ReportsService(repository=None)
+    with pytest.raises(ValueError):
+        service._parse_cursor(cursor)
+
+
+class RecordingSelectorRepository:
+    tenant_schema = "org_test"
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_caregiver_list(self, limit, offset, after):
+        self.calls.append((limit, offset, after))
+        return []
+
+    async def get_patient_list(self, limit, offset, after):
+        self.calls.append((limit, offset, after))
+        return []
+
+
+@pytest.mark.parametrize("method", ["get_caregiver_list", "get_patient_list"])
+async def test_name_cursor_overrides_legacy_offset(method):
+    """Test that a cursor resumes after its key instead of also skipping the offset."""
+    repository = RecordingSelectorRepository()
+    service = ReportsService(repository=repository)
+    cursor_id = uuid4()
+    cursor = service._build_name_cursor("Doe", "Jane", cursor_id)
+
+    await getattr(service, method)(limit=10, offset=25, after=cursor)
+
+    assert repository.calls == [(11, 0, ("Doe", "Jane", cursor_id))]
+
+
+@pytest.mark.parametrize("method", ["get_caregiver_list", "get_patient_list"])
+async def test_offset_still_applies_without_cursor(method):
+    """Test that legacy offset paging keeps working when no cursor is sent."""
+    repository = RecordingSelectorRepository()
+    service = ReportsService(repository=repository)
+
+    await getattr(service, method)(limit=10, offset=25)
+
+    assert repository.calls == [(11, 25, None)]
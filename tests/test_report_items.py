@@ -0,0 +1,61 @@
+"""
+Tests for building care session report items from database rows
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+from app.reports.service import to_report_items
+
+
+def _session(**overrides):
+    check_in = datetime(2026, 10, 16, 9, 0)
+    fields = dict(
+        id=uuid4(),
+        patient_id=uuid4(),
+        caregiver_id=uuid4(),
+        check_in_time=check_in,
+        check_out_time=check_in + timedelta(minutes=45, seconds=30),
+        duration_minutes=45,
+        status="COMPLETED",
+        caregiver_notes=None,
+        created_at=check_in,
+        updated_at=None,
+        patient_full_name=None,
+        patient_email=None,
+        careplan_type=None,
+        caregiver_full_name=None,
+        caregiver_email=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_report_items_are_typed_and_derived():
+    """Test that report items keep DB types and carry the joined names."""
+    session = _session(
+        patient_full_name="Jane",
+        patient_email="jane@example.org",
+        careplan_type="daily",
+        caregiver_full_name="Bob Roe",
+    )
+
+    [item] = to_report_items([session])
+
+    assert isinstance(item.id, UUID)
+    assert isinstance(item.check_in_time, datetime)
+    assert item.duration_minutes == 45
+    assert item.patient_full_name == "Jane"
+    assert item.caregiver_full_name == "Bob Roe"
+    assert item.careplan_type == "daily"
+
+
+def test_report_items_tolerate_missing_people_and_open_sessions():
+    """Test that unknown patients/caregivers and open sessions leave fields empty."""
+    session = _session(check_out_time=None, duration_minutes=None, status="IN_PROGRESS")
+
+    [item] = to_report_items([session])
+
+    assert item.duration_minutes is None
+    assert item.patient_full_name is None
+    assert item.caregiver_email is None
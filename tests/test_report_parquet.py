@@ -0,0 +1,78 @@
+"""
+Tests for streamed Parquet report encoding
+"""
+from datetime import datetime
+from io import BytesIO
+from uuid import uuid4
+
+import pytest
+
+from app.reports.schemas import CareSessionReportItem
+from app.reports.service import ReportsService, _session_parquet_schema, single_batch
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+def _session(**overrides) -> CareSessionReportItem:
+    values = dict(
+        id=uuid4(),
+        patient_id=uuid4(),
+        patient_full_name="Jane Doe",
+        patient_email="jane@example.com",
+        careplan_type="daily",
+        caregiver_id=uuid4(),
+        caregiver_full_name="Sam Care",
+        caregiver_email="sam@example.com",
+        check_in_time=datetime(2026, 3, 14, 9, 0, 0, 123456),
+        check_out_time=datetime(2026, 3, 14, 9, 45),
+        duration_minutes=44,
+        status="completed",
+        caregiver_notes="All good",
+        created_at=datetime(2026, 3, 14, 8, 59),
+        updated_at=None,
+    )
+    values.update(overrides)
+    return CareSessionReportItem(**values)
+
+
+async def _read_parquet(stream):
+    return pq.read_table(BytesIO(b"".join([chunk async for chunk in stream])))
+
+
+async def test_parquet_stream_reads_back_with_session_schema():
+    """Test that batches stream into one Parquet file with the session schema and values intact."""
+    first = [_session(), _session(check_out_time=None, duration_minutes=None, status="in_progress")]
+    second = [_session(patient_full_name=None, caregiver_notes="Line one\nline two")]
+    service = ReportsService(repository=None)
+
+    table = await _read_parquet(service.generate_parquet_stream(_batches(first, second)))
+
+    assert table.schema.equals(_session_parquet_schema())
+    rows = table.to_pylist()
+    expected = first + second
+    assert len(rows) == len(expected)
+    for row, item in zip(rows, expected):
+        assert row["id"] == str(item.id)
+        assert row["patient_id"] == str(item.patient_id)
+        assert row["caregiver_id"] == str(item.caregiver_id)
+        assert row["patient_full_name"] == item.patient_full_name
+        assert row["check_in_time"] == item.check_in_time
+        assert row["check_out_time"] == item.check_out_time
+        assert row["duration_minutes"] == item.duration_minutes
+        assert row["caregiver_notes"] == item.caregiver_notes
+        assert row["updated_at"] is None
+
+
+async def test_parquet_stream_for_empty_report_is_a_valid_file():
+    """Test that an export with no rows is still a readable file with the schema."""
+    service = ReportsService(repository=None)
+
+    table = await _read_parquet(service.generate_parquet_stream(single_batch([])))
+
+    assert table.num_rows == 0
+    assert table.schema.equals(_session_parquet_schema())
@@ -0,0 +1,109 @@
+"""
+Tests for resolving report periods into date ranges
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.reports import router as reports_router
+from app.reports.router import _resolve_period_range, _resolve_period_range_for_day
+
+TICK = timedelta(microseconds=1)
+
+
+def _ordinal(year: int, month: int, day: int) -> int:
+    return date(year, month, day).toordinal()
+
+
+def test_day_period_covers_the_whole_day():
+    """Test that the day period runs from midnight to the last microsecond of the day."""
+    start, end = _resolve_period_range_for_day("day", _ordinal(2026, 3, 14))
+
+    assert start == datetime(2026, 3, 14)
+    assert end == datetime(2026, 3, 15) - TICK
+
+
+def test_week_period_starts_on_monday_across_a_month_boundary():
+    """Test that the week period starts on Monday even when that falls in the previous month."""
+    start, end = _resolve_period_range_for_day("week", _ordinal(2026, 4, 2))
+
+    assert start == datetime(2026, 3, 30)
+    assert end == datetime(2026, 4, 6) - TICK
+
+
+def test_week_period_on_a_monday_starts_that_day():
+    """Test that resolving the week on a Monday does not step back a week."""
+    start, _ = _resolve_period_range_for_day("week", _ordinal(2026, 3, 30))
+
+    assert start == datetime(2026, 3, 30)
+
+
+@pytest.mark.parametrize(
+    "day, expected_start, expected_next",
+    [
+        ((2026, 12, 31), datetime(2026, 12, 1), datetime(2027, 1, 1)),
+        ((2028, 2, 29), datetime(2028, 2, 1), datetime(2028, 3, 1)),
+        ((2026, 1, 1), datetime(2026, 1, 1), datetime(2026, 2, 1)),
+    ],
+)
+def test_month_period_boundaries(day, expected_start, expected_next):
+    """Test that the month period handles year rollover and leap years."""
+    start, end = _resolve_period_range_for_day("month", _ordinal(*day))
+
+    assert start == expected_start
+    assert end == expected_next - TICK
+
+
+def test_invalid_period_raises_value_error():
+    """Test that an unknown period raises ValueError."""
+    with pytest.raises(ValueError):
+        _resolve_period_range_for_day("year", _ordinal(2026, 3, 14))
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Pin the router's clock; drops ranges cached while it was patched."""
+    def freeze(moment: datetime) -> None:
+        monkeypatch.setattr(reports_router, "datetime", _frozen_now(moment))
+
+    yield freeze
+    _resolve_period_range_for_day.cache_clear()
+
+
+def _frozen_now(moment: datetime):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return moment.astimezone(tz)
+
+    return FrozenDatetime
+
+
+def test_period_range_follows_the_utc_day_boundary(frozen_clock):
+    """Test that the cached range changes exactly when the UTC day does."""
+    before_midnight = datetime(2026, 3, 14, 23, 59, 59, 999999, tzinfo=timezone.utc)
+
+    frozen_clock(before_midnight)
+    assert _resolve_period_range("day") == (datetime(2026, 3, 14), datetime(2026, 3, 15) - TICK)
+
+    frozen_clock(before_midnight + TICK)
+    assert _resolve_period_range("day") == (datetime(2026, 3, 15), datetime(2026, 3, 16) - TICK)
+
+
+def test_period_range_uses_utc_not_local_offset(frozen_clock):
+    """Test that a non-UTC clock reading resolves against its UTC day."""
+    # 01:30 in UTC+02:00 is still the previous day in UTC.
+    local = datetime(2026, 3, 15, 1, 30, tzinfo=timezone(timedelta(hours=2)))
+    frozen_clock(local)
+
+    assert _resolve_period_range("day")[0] == datetime(2026, 3, 14)
+
+
+def test_period_range_is_cached_per_day():
+    """Test that repeated lookups for the same period and day hit the cache."""
+    ordinal = _ordinal(2031, 7, 4)
+    first = _resolve_period_range_for_day("week", ordinal)
+    hits = _resolve_period_range_for_day.cache_info().hits
+
+    assert _resolve_period_range_for_day("week", ordinal) is first
+    assert _resolve_period_range_for_day.cache_info().hits == hits + 1
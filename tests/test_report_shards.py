@@ -0,0 +1,127 @@
+"""
+Tests for splitting report downloads into time shards
+"""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.reports import service as service_module
+from app.reports.service import DOWNLOAD_PAGE_SIZE, MAX_DOWNLOAD_SHARDS, ReportsService, _time_shards
+
+START = datetime(2026, 1, 1)
+END = datetime(2026, 1, 31, 23, 59, 59)
+
+
+def test_time_shards_empty_range():
+    """Test that a range with no rows stays a single window."""
+    assert _time_shards(START, END, 0) == [(START, END)]
+
+
+def test_time_shards_range_shorter_than_a_shard():
+    """Test that a range holding less than one page of rows stays a single window."""
+    assert _time_shards(START, END, DOWNLOAD_PAGE_SIZE) == [(START, END)]
+
+
+def test_time_shards_inverted_range():
+    """Test that a range whose end does not follow its start is not split."""
+    assert _time_shards(END, START, DOWNLOAD_PAGE_SIZE * 4) == [(END, START)]
+
+
+@pytest.mark.parametrize("start, end", [(None, END), (START, None), (None, None)])
+def test_time_shards_open_ended_range(start, end):
+    """Test that an open-ended range is fetched as a single window."""
+    assert _time_shards(start, end, DOWNLOAD_PAGE_SIZE * 4) == [(start, end)]
+
+
+def test_time_shards_cover_range_contiguously_newest_first():
+    """Test that shards tile the range without gaps or overlap, newest window first."""
+    shards = _time_shards(START, END, DOWNLOAD_PAGE_SIZE * 3)
+
+    assert len(shards) == 3
+    oldest_first = shards[::-1]
+    assert oldest_first[0][0] == START
+    assert oldest_first[-1][1] == END
+    for (_, previous_end), (next_start, _) in zip(oldest_first, oldest_first[1:]):
+        assert next_start - previous_end == timedelta(microseconds=1)
+
+
+def test_time_shards_capped():
+    """Test that the shard count never exceeds MAX_DOWNLOAD_SHARDS."""
+    assert len(_time_shards(START, END, DOWNLOAD_PAGE_SIZE * 100)) == MAX_DOWNLOAD_SHARDS
+
+
+class CountingSessions:
+    """Stand-in for AsyncSessionLocal that tracks how many sessions are open at once."""
+
+    def __init__(self):
+        self.open = 0
+        self.peak = 0
+        self.opened = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        self.open += 1
+        self.opened += 1
+        self.peak = max(self.peak, self.open)
+        return SimpleNamespace()
+
+    async def __aexit__(self, *exc_info):
+        self.open -= 1
+        return False
+
+
+async def _fetch_window(service, shard_start, shard_end):
+    await asyncio.sleep(0)
+    yield [shard_start]
+    await asyncio.sleep(0)
+    yield [shard_end]
+
+
+def _service():
+    return ReportsService(repository=SimpleNamespace(tenant_schema="org_test"))
+
+
+async def test_iter_shards_stays_within_the_connection_budget(monkeypatch):
+    """Test that shards beyond the free slots wait for one and still come out in order."""
+    sessions = CountingSessions()
+    monkeypatch.setattr(service_module, "AsyncSessionLocal", sessions)
+    monkeypatch.setattr(service_module, "_shard_connections", asyncio.Semaphore(2))
+    shards = [(index, index + 0.5) for index in range(5)]
+
+    batches = [items async for items in _service()._iter_shards(shards, _fetch_window)]
+
+    assert batches == [[value] for shard in shards for value in shard]
+    assert sessions.opened == 5
+    assert sessions.peak == 2
+    assert not service_module._shard_connections.locked()
+
+
+async def test_iter_shards_reads_on_the_request_session_when_no_slot_is_free(monkeypatch):
+    """Test that an exhausted budget falls back to reading shards in order without new sessions."""
+    sessions = CountingSessions()
+    monkeypatch.setattr(service_module, "AsyncSessionLocal", sessions)
+    monkeypatch.setattr(service_module, "_shard_connections", asyncio.Semaphore(0))
+    shards = [(0, 1), (2, 3)]
+
+    batches = [items async for items in _service()._iter_shards(shards, _fetch_window)]
+
+    assert batches == [[0], [1], [2], [3]]
+    assert sessions.opened == 0
+
+
+async def test_iter_shards_returns_slots_when_the_consumer_stops_early(monkeypatch):
+    """Test that abandoning a download closes its sessions and frees its slots."""
+    sessions = CountingSessions()
+    monkeypatch.setattr(service_module, "AsyncSessionLocal", sessions)
+    monkeypatch.setattr(service_module, "_shard_connections", asyncio.Semaphore(3))
+    stream = _service()._iter_shards([(index, index) for index in range(6)], _fetch_window)
+
+    assert await stream.__anext__() == [0]
+    await stream.aclose()
+
+    assert sessions.open == 0
+    assert service_module._shard_connections._value == 3
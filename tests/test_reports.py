@@ -3,24 +3,18 @@ from httpx import AsyncClient
 
 
 @pytest.mark.asyncio
-async def test_get_reports_unauthorized(client: AsyncClient):
+async def test_get_reports_unauthorized(app_client: AsyncClient):
     """Test getting reports without authentication."""
-    response = await client.get("/reports/")
+    response = await app_client.get("/reports/")
     assert response.status_code in [401, 403, 404]
 
 
 @pytest.mark.asyncio
 async def test_get_reports_structure(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test reports list response structure."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    response = await client.get(
+    response = await authed_client.get(
         "/reports/",
         headers={"Authorization": "Bearer mock_token"}
     )
@@ -29,27 +23,17 @@ async def test_get_reports_structure(
         data = response.json()
         assert "reports" in data
         assert isinstance(data["reports"], list)
-    
-    app.dependency_overrides.clear()
 
 
 @pytest.mark.asyncio
 async def test_generate_report_unauthorized_role(
-    client: AsyncClient,
-    mock_jwt_payload,
+    authed_client: AsyncClient,
 ):
     """Test that only admins can generate reports (non-admin should be denied)."""
-    from app.main import app
-    from app.auth.middleware import verify_token
-    
-    app.dependency_overrides[verify_token] = lambda: mock_jwt_payload
-    
-    response = await client.post(
+    response = await authed_client.post(
         "/reports/generate",
         json={"report_type": "care_sessions"},
         headers={"Authorization": "Bearer mock_token"}
     )
     
     assert response.status_code in [403, 404, 500]
-    
-    app.dependency_overrides.clear()
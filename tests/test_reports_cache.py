@@ -0,0 +1,171 @@
+"""
+Tests for the Redis-backed reports cache helpers
+"""
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.reports.cache import SESSION_REPORT_NAMESPACES, ReportsCache
+
+INTS = TypeAdapter(List[int])
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def incr(self, key):
+        self.commands.append(key)
+
+    async def execute(self):
+        self.redis.pipelines += 1
+        return [await self.redis.incr(key) for key in self.commands]
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis returning bytes like the real client."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.pipelines = 0
+        self.fail = False
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = bytes(value)
+        self.ttls[key] = ex
+
+    async def incr(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        value = int(self.data.get(key, 0)) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+    def pipeline(self, transaction=True):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    cache = ReportsCache(url="")
+    cache.client = redis_client
+    return cache
+
+
+async def test_set_then_get_round_trips_through_the_adapter(cache, redis_client):
+    """Test that a stored value comes back validated and is written with its TTL."""
+    key = await cache.key("org_a", "patients", 10, 0, None)
+
+    await cache.set(key, [1, 2, 3], INTS, ttl=60)
+
+    assert await cache.get(key, INTS) == [1, 2, 3]
+    assert redis_client.ttls[key] == 60
+
+
+async def test_get_misses_return_none(cache):
+    """Test that an absent key is a cache miss."""
+    assert await cache.get(await cache.key("org_a", "patients"), INTS) is None
+
+
+async def test_get_treats_undecodable_payloads_as_a_miss(cache, redis_client):
+    """Test that a payload the adapter rejects is returned as a miss instead of raising."""
+    key = await cache.key("org_a", "patients")
+    redis_client.data[key] = b'{"not": "a list"}'
+
+    assert await cache.get(key, INTS) is None
+
+
+async def test_key_separates_parts_and_keeps_missing_parts_positional(cache):
+    """Test that None parts stay as empty slots so different argument lists never collide."""
+    assert await cache.key("org_a", "patients", None, 5) != await cache.key("org_a", "patients", 5, None)
+
+
+async def test_invalidate_hides_existing_entries(cache):
+    """Test that invalidating a namespace makes its existing entries unreachable."""
+    key = await cache.key("org_a", "patients", 10)
+    await cache.set(key, [1], INTS, ttl=60)
+
+    await cache.invalidate("org_a", "patients")
+
+    new_key = await cache.key("org_a", "patients", 10)
+    assert new_key != key
+    assert await cache.get(new_key, INTS) is None
+
+
+async def test_invalidate_is_scoped_to_tenant_and_namespace(cache):
+    """Test that invalidation leaves other tenants and other namespaces untouched."""
+    other_tenant = await cache.key("org_b", "patients", 10)
+    other_namespace = await cache.key("org_a", "caregivers", 10)
+
+    await cache.invalidate("org_a", "patients")
+
+    assert await cache.key("org_b", "patients", 10) == other_tenant
+    assert await cache.key("org_a", "caregivers", 10) == other_namespace
+
+
+async def test_result_computed_before_invalidation_is_not_served_after_it(cache):
+    """Test that a write racing an invalidation lands under the superseded generation."""
+    key = await cache.key("org_a", "feedback_summary")
+    await cache.invalidate("org_a", "feedback_summary")
+    await cache.set(key, [1], INTS, ttl=10)
+
+    assert await cache.get(await cache.key("org_a", "feedback_summary"), INTS) is None
+
+
+async def test_invalidate_session_reports_bumps_every_namespace_in_one_round_trip(cache, redis_client):
+    """Test that session writes invalidate all derived report namespaces with one pipeline."""
+    before = {namespace: await cache.key("org_a", namespace) for namespace in SESSION_REPORT_NAMESPACES}
+
+    await cache.invalidate_session_reports("org_a")
+
+    assert redis_client.pipelines == 1
+    for namespace in SESSION_REPORT_NAMESPACES:
+        assert await cache.key("org_a", namespace) != before[namespace]
+    assert await cache.key("org_a", "patients") == "org_a:patients:0"
+
+
+async def test_redis_errors_degrade_to_uncached(cache, redis_client):
+    """Test that Redis failures are swallowed so reports fall back to the database."""
+    redis_client.fail = True
+
+    key = await cache.key("org_a", "patients")
+    await cache.set(key, [1], INTS, ttl=60)
+    await cache.invalidate_session_reports("org_a")
+
+    assert key == "org_a:patients:0"
+    assert await cache.get(key, INTS) is None
+
+
+async def test_cache_without_redis_is_a_no_op():
+    """Test that an unconfigured cache never stores anything."""
+    cache = ReportsCache(url="")
+    key = await cache.key("org_a", "patients")
+
+    await cache.set(key, [1], INTS, ttl=60)
+    await cache.invalidate("org_a", "patients")
+
+    assert cache.client is None
+    assert await cache.get(key, INTS) is None
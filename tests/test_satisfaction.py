@@ -2,7 +2,7 @@
 Tests for satisfaction level calculations
 """
 import pytest
-from unittest.mock import Mock
+from types import SimpleNamespace
 from app.feedback.satisfaction import (
     SatisfactionLevel,
     get_satisfaction_level,
@@ -26,8 +26,7 @@ def test_satisfaction_level_invalid():
 
 def test_compute_metrics_all_satisfied():
     """Test metrics when all ratings are satisfied."""
-    # Create mock Feedback objects
-    feedbacks = [Mock(rating=3) for _ in range(4)]
+    feedbacks = [SimpleNamespace(rating=3) for _ in range(4)]
     metrics = compute_metrics(feedbacks)
     
     assert metrics["average_rating"] == 3.0
@@ -39,8 +38,7 @@ def test_compute_metrics_all_satisfied():
 
 def test_compute_metrics_mixed():
     """Test metrics with mixed ratings."""
-    # Create mock Feedback objects with mixed ratings
-    feedbacks = [Mock(rating=1), Mock(rating=2), Mock(rating=3), Mock(rating=3)]
+    feedbacks = [SimpleNamespace(rating=rating) for rating in (1, 2, 3, 3)]
     metrics = compute_metrics(feedbacks)
     
     assert metrics["average_rating"] == 2.25
@@ -52,7 +50,7 @@ def test_compute_metrics_mixed():
 
 def test_compute_metrics_all_dissatisfied():
     """Test metrics when all ratings are dissatisfied."""
-    feedbacks = [Mock(rating=1) for _ in range(3)]
+    feedbacks = [SimpleNamespace(rating=1) for _ in range(3)]
     metrics = compute_metrics(feedbacks)
     
     assert metrics["average_rating"] == 1.0
@@ -62,6 +60,18 @@ def test_compute_metrics_all_dissatisfied():
     assert metrics["distribution"]["1_dissatisfied"] == 100.0
 
 
+def test_compute_metrics_large_batch():
+    """Test that a large batch gives the same metrics as its repeating pattern."""
+    feedbacks = [SimpleNamespace(rating=rating) for rating in (1, 2, 3, 3) * 2500]
+    metrics = compute_metrics(feedbacks)
+
+    assert metrics["total_feedbacks"] == 10000
+    assert metrics["average_rating"] == 2.25
+    assert metrics["distribution"]["3_satisfied"] == 50.0
+    assert metrics["distribution"]["2_neutral"] == 25.0
+    assert metrics["distribution"]["1_dissatisfied"] == 25.0
+
+
 def test_compute_metrics_empty():
     """Test metrics with no ratings."""
     feedbacks = []
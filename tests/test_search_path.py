@@ -0,0 +1,31 @@
+"""
+Tests for the per-connection search_path memo
+"""
+from sqlalchemy import create_engine
+
+from app.db.repository import _SEARCH_PATH_KEY
+
+
+def test_savepoint_rollback_forgets_search_path():
+    """Test that rolling back a savepoint drops the memo, since it may undo the SET."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.begin()
+        savepoint = conn.begin_nested()
+        conn.info[_SEARCH_PATH_KEY] = "org_test"
+
+        savepoint.rollback()
+
+        assert _SEARCH_PATH_KEY not in conn.info
+
+
+def test_rollback_forgets_search_path():
+    """Test that a transaction rollback drops the memo."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        conn.info[_SEARCH_PATH_KEY] = "org_test"
+
+        transaction.rollback()
+
+        assert _SEARCH_PATH_KEY not in conn.info